@@ -1 +1,6 @@
-# backend/__init__.py
\ No newline at end of file
+# backend/__init__.py
+
+# .env는 여기서 한 번만 로드 (backend.* 어느 모듈을 import해도 가장 먼저 실행됨)
+from dotenv import load_dotenv
+
+load_dotenv()
@@ -0,0 +1,60 @@
+# backend/core/config.py
+"""
+DB / Redis 접속 설정 + rate limit 한도 (pydantic-settings).
+
+- .env는 backend/__init__.py에서 프로세스당 한 번만 읽어 os.environ에 올린다.
+  여기서는 환경변수만 읽음 (각 모듈의 os.getenv 튜닝 값도 같은 .env를 봄)
+- get_settings()는 처음 부를 때 한 번만 만들고 캐시 -> import만으로는 아무것도 검증/연결하지 않음
+- bool 값은 pydantic 규칙대로 1/true/yes/on 등을 참으로 읽음
+- URL이 비어 있으면 엔진/클라이언트를 실제로 만들 때(get_engine / get_redis_client) 에러
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """환경변수 이름 = 필드 이름 대문자 (예: database_url -> DATABASE_URL)"""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    # -----------------------------
+    # DB (동기/비동기 엔진 공통, 워커 1개 기준)
+    # -----------------------------
+    database_url: str = ""
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30  # 커넥션 대기 한도 (초)
+    db_pool_recycle: int = 1800  # 오래된 커넥션 교체 (초)
+    db_pool_pre_ping: bool = True
+
+    # -----------------------------
+    # Redis (동기/비동기 풀 각각 적용)
+    # -----------------------------
+    redis_url: str = ""
+    redis_max_connections: int = 50
+    redis_socket_timeout: float = 2
+    redis_socket_connect_timeout: float = 2
+    redis_health_check_interval: int = 30
+
+    # -----------------------------
+    # Rate limit (backend/utils/rate_limit.py, window 단위: 초)
+    # -----------------------------
+    rate_limit_enabled: bool = True
+    # 프록시(로드밸런서) 뒤에서만 true: X-Forwarded-For에서 우리 프록시가 붙인 주소를 클라이언트 IP로 사용
+    rate_limit_trust_proxy: bool = False
+    # 앱 앞단의 신뢰하는 프록시 수 (X-Forwarded-For 오른쪽에서 이 번째 주소 = 실제 클라이언트)
+    rate_limit_trusted_hops: int = 1
+    signup_rate_window: int = 600
+    signup_request_per_email: int = 5
+    signup_request_per_ip: int = 20
+    signup_verify_per_email: int = 10
+    signup_verify_per_ip: int = 60
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
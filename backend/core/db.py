@@ -1,15 +1,32 @@
 # backend/core/db.py
+"""
+SQLAlchemy 엔진 / 세션.
 
-import os
+엔진(동기/비동기)은 import 시점이 아니라 처음 쓸 때 만든다 (get_engine / get_async_engine).
+앱은 lifespan에서 init_engines() / dispose_engines()로 관리하고,
+CLI·스크립트는 get_engine() / get_sessionmaker()를 바로 쓰면 된다.
+예전처럼 `from backend.core.db import engine, SessionLocal`도 동작함 (모듈 __getattr__).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from sqlalchemy.orm import DeclarativeBase
 
-# .env 파일 로드
-load_dotenv()
+from backend.core.metrics import attach_query_listeners
+from backend.core.pool_metrics import PoolStats, attach_pool_listeners, instrumented_pool_class
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+    from backend.core.config import Settings
 
 
 class Base(DeclarativeBase):
@@ -20,46 +37,203 @@ class Base(DeclarativeBase):
 # ======================================================
 # DATABASE_URL
 # ======================================================
-# DATABASE_URL만 넣으면 됩니다
-DATABASE_URL = os.getenv("DATABASE_URL", "")
+def _settings() -> Settings:
+    # pydantic-settings import도 엔진을 만들 때까지 미룸 (모델/스크립트 import를 가볍게)
+    from backend.core.config import get_settings
+
+    return get_settings()
+
+
+def _database_url(settings: Settings) -> str:
+    if not settings.database_url:
+        # DATABASE_URL이 없으면 에러 뜨게 해놨어요! (엔진을 처음 만들 때)
+        raise RuntimeError(
+            "DATABASE_URL 환경변수가 설정되지 않았습니다. "
+            "테스트 환경에서 DB 연결을 위해 반드시 값이 필요합니다."
+        )
+    return settings.database_url
+
+
+def _to_async_url(url: str) -> str:
+    """
+    DATABASE_URL의 드라이버만 asyncpg로 바꾼 URL 반환.
+    (postgresql://, postgresql+psycopg2:// 등 어떤 형태로 넣어도 동일한 DB를 가리킴)
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed.render_as_string(hide_password=False)
+
+
+# ======================================================
+# 커넥션 풀 설정 (워커 1개 기준, 동기/비동기 엔진 공통)
+# ======================================================
+def _pool_options(settings: Settings) -> Dict[str, Any]:
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+# 풀 통계 (/internal/db/pool 에서 조회)
+pool_stats = PoolStats("sync")
+async_pool_stats = PoolStats("async")
+
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[sessionmaker] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_engine_lock = threading.Lock()
+
+
+# ======================================================
+# SQLAlchemy 기본 세팅 (처음 호출 시 생성)
+# ======================================================
+def get_engine() -> Engine:
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                settings = _settings()
+                engine = create_engine(
+                    _database_url(settings),
+                    echo=False,  # 에러뜨면 True로 바꿔서 sql 체크!
+                    future=True,
+                    poolclass=instrumented_pool_class(QueuePool, pool_stats),
+                    **_pool_options(settings),
+                )
+                attach_pool_listeners(engine, pool_stats)
+                attach_query_listeners(engine)
+                _session_factory = sessionmaker(
+                    autocommit=False,
+                    autoflush=False,
+                    bind=engine,
+                )
+                _engine = engine
+    return _engine
+
+
+def get_sessionmaker() -> sessionmaker:
+    """SessionLocal (동기 세션 팩토리)"""
+    get_engine()
+    return _session_factory
 
-if not DATABASE_URL:
-    # DATABASE_URL이 없으면 에러 뜨게 해놨어요!
-    raise RuntimeError(
-        "DATABASE_URL 환경변수가 설정되지 않았습니다. "
-        "테스트 환경에서 DB 연결을 위해 반드시 값이 필요합니다."
-    )
 
 # ======================================================
-# SQLAlchemy 기본 세팅
+# SQLAlchemy 비동기 세팅 (asyncpg, 처음 호출 시 생성)
 # ======================================================
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,  # 에러뜨면 True로 바꿔서 sql 체크!
-    future=True,
-)
+# 동기 엔진과 같은 DATABASE_URL을 사용하므로
+# 엔드포인트를 하나씩 async def로 옮기면서 비교할 수 있음
+# (sqlalchemy.ext.asyncio / asyncpg import도 처음 쓸 때까지 미룸)
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+                settings = _settings()
+                async_engine = create_async_engine(
+                    _to_async_url(_database_url(settings)),
+                    echo=False,
+                    poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, async_pool_stats),
+                    **_pool_options(settings),
+                )
+                attach_pool_listeners(async_engine.sync_engine, async_pool_stats)
+                attach_query_listeners(async_engine.sync_engine)
+                _async_session_factory = async_sessionmaker(
+                    bind=async_engine,
+                    class_=AsyncSession,
+                    autoflush=False,
+                    expire_on_commit=False,
+                )
+                _async_engine = async_engine
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    """AsyncSessionLocal (비동기 세션 팩토리)"""
+    get_async_engine()
+    return _async_session_factory
 
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
+
+# ======================================================
+# lifespan용: 시작 시 생성 / 종료 시 정리
+# ======================================================
+def init_engines() -> None:
+    """
+    앱 시작 시 호출 (설정 오류를 첫 요청이 아니라 기동 시점에 드러냄, 연결은 아직 안 맺음).
+    비동기 엔진은 get_async_db를 쓰는 라우터가 처음 요청될 때 만든다.
+    """
+    get_engine()
+
+
+async def dispose_engines() -> None:
+    """앱 종료 시 풀의 커넥션을 모두 닫음"""
+    global _engine, _async_engine, _session_factory, _async_session_factory
+    with _engine_lock:
+        engine, async_engine = _engine, _async_engine
+        _engine = _async_engine = None
+        _session_factory = _async_session_factory = None
+    if async_engine is not None:
+        await async_engine.dispose()
+    if engine is not None:
+        engine.dispose()
+
+
+# 예전 모듈 속성 이름 호환 (접근할 때 엔진 생성)
+_LAZY_ATTRS = {
+    "engine": get_engine,
+    "async_engine": get_async_engine,
+    "SessionLocal": get_sessionmaker,
+    "AsyncSessionLocal": get_async_sessionmaker,
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        return _LAZY_ATTRS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ======================================================
 # FastAPI에서 사용되는 get_db()
 # ======================================================
 def get_db():
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
         db.close()
 
 
+# ======================================================
+# FastAPI에서 사용되는 get_async_db() (async def 라우터용)
+# ======================================================
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+# ======================================================
+# 커넥션 풀 상태 조회
+# ======================================================
+def get_pool_stats() -> dict:
+    # 아직 만들어지지 않은 엔진은 빼고 반환 (조회 때문에 엔진을 만들지 않음)
+    stats = {}
+    if _engine is not None:
+        stats["sync"] = pool_stats.snapshot(_engine.pool)
+    if _async_engine is not None:
+        stats["async"] = async_pool_stats.snapshot(_async_engine.sync_engine.pool)
+    return stats
+
+
 # ======================================================
 # 초기 DB 테이블 생성 함수
 # ======================================================
 def init_db():  # 테스트 환경에서 최초 한 번만 실행.
 
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
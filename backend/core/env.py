@@ -0,0 +1,17 @@
+# backend/core/env.py
+"""
+모듈별 os.getenv 튜닝 값을 읽는 공용 헬퍼 (import가 가벼워야 하는 모듈용).
+접속 정보 / 새 설정 값은 core/config.py Settings에 둔다.
+"""
+
+import os
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """1/true/yes/on(대소문자 무시)이면 True, 비어 있거나 없으면 default"""
+    value = os.getenv(name, "").strip().lower()
+    if not value:
+        return default
+    return value in _TRUE_VALUES
@@ -0,0 +1,234 @@
+# backend/core/log.py
+"""
+구조화 로깅 설정 (비동기 출력 + JSON + 샘플링 + 민감정보 마스킹).
+
+- 요청 스레드는 QueueHandler로 레코드를 큐에 넣기만 하고, 실제 stdout 쓰기는
+  QueueListener 백그라운드 스레드가 한다. 큐가 가득 차면 기다리지 않고 버린다.
+- 마스킹/샘플링은 큐에 넣기 전에 적용 -> 비밀값은 큐에도 남지 않음
+- DEBUG 레코드는 LOG_DEBUG_SAMPLE_RATE 비율만 통과 (extra={"sample_rate": 1.0}으로 개별 지정 가능)
+
+사용:
+    logger = logging.getLogger(__name__)
+    logger.info("signup requested", extra={"email": email})
+
+앱은 lifespan에서, CLI는 main()에서 setup_logging()을 한 번 호출한다.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from backend.core.env import env_bool
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()  # json | text
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.01"))
+# 개발 환경에서 인증 코드 등을 직접 봐야 할 때만 false로
+LOG_REDACT = env_bool("LOG_REDACT", True)
+# uvicorn 기본 로거(접근 로그 포함)도 같은 큐로 보냄
+LOG_CAPTURE_UVICORN = env_bool("LOG_CAPTURE_UVICORN", True)
+
+REDACTED = "[REDACTED]"
+
+# extra / 메시지에서 값을 가릴 키
+SENSITIVE_KEYS = frozenset(
+    {"password", "password_hash", "code", "token", "access_token", "secret", "authorization", "cookie"}
+)
+_KEY_VALUE_RE = re.compile(
+    r"(?i)\b(" + "|".join(sorted(SENSITIVE_KEYS)) + r")(\s*[=:]\s*)(['\"]?)[^\s,'\"}]+"
+)
+_PATTERNS = (
+    re.compile(r"\$2[aby]?\$\d{2}\$[./A-Za-z0-9]{53}"),  # bcrypt 해시
+    re.compile(r"\beyJ[\w-]+\.[\w-]+\.[\w-]+"),  # JWT
+)
+_EMAIL_RE = re.compile(r"\b([A-Za-z0-9._%+-])[A-Za-z0-9._%+-]*(@[A-Za-z0-9.-]+\.[A-Za-z]{2,})\b")
+
+# LogRecord 기본 속성 (이 외의 속성은 extra로 보고 JSON에 포함)
+_RESERVED = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "sample_rate"}
+
+
+# ======================================================
+# 필터
+# ======================================================
+def redact_text(text: str) -> str:
+    text = _KEY_VALUE_RE.sub(lambda m: f"{m.group(1)}{m.group(2)}{m.group(3)}{REDACTED}", text)
+    for pattern in _PATTERNS:
+        text = pattern.sub(REDACTED, text)
+    return _EMAIL_RE.sub(r"\1***\2", text)
+
+
+def _redact_value(key: str, value: Any) -> Any:
+    if key.lower() in SENSITIVE_KEYS:
+        return REDACTED
+    if isinstance(value, str):
+        return redact_text(value)
+    return value
+
+
+class RedactionFilter(logging.Filter):
+    """메시지(인자 포함)와 extra 값에서 비밀번호/인증코드/토큰/이메일을 가림"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = redact_text(record.getMessage())
+        record.args = None
+        for key, value in list(vars(record).items()):
+            if key not in _RESERVED:
+                setattr(record, key, _redact_value(key, value))
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """DEBUG 이하 레코드를 비율만큼만 통과 (INFO 이상은 항상 통과)"""
+
+    def __init__(self, rate: float = LOG_DEBUG_SAMPLE_RATE) -> None:
+        super().__init__()
+        self.rate = rate
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = getattr(record, "sample_rate", self.rate)
+        if rate >= 1.0 or random.random() < rate:
+            return True
+        self.dropped += 1
+        return False
+
+
+# ======================================================
+# 포맷터
+# ======================================================
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON: ts, level, logger, msg + extra 필드 (+ exc)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED:
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+# ======================================================
+# 큐 핸들러 (가득 차면 버림)
+# ======================================================
+class DroppingQueueHandler(QueueHandler):
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 prepare는 예외 traceback을 메시지에 합쳐버리므로, 메시지와 exc_text를 따로 보존
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # 로그 때문에 요청이 기다리지 않도록 버리고 개수만 셈
+            self.dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+_sampling_filter: Optional[SamplingFilter] = None
+_setup_lock = threading.Lock()
+
+
+def setup_logging(
+    level: str = LOG_LEVEL,
+    fmt: str = LOG_FORMAT,
+    debug_sample_rate: float = LOG_DEBUG_SAMPLE_RATE,
+    redact: bool = LOG_REDACT,
+) -> None:
+    """루트 로거를 큐 핸들러 하나로 교체하고 백그라운드 writer 시작 (여러 번 불러도 한 번만 적용)"""
+    global _listener, _queue_handler, _sampling_filter
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        output = logging.StreamHandler(sys.stdout)
+        if fmt == "json":
+            output.setFormatter(JsonFormatter())
+        else:
+            output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        handler = DroppingQueueHandler(log_queue)
+        sampling = SamplingFilter(debug_sample_rate)
+        handler.addFilter(sampling)
+        if redact:
+            handler.addFilter(RedactionFilter())
+
+        root = logging.getLogger()
+        root.handlers = [handler]
+        root.setLevel(level)
+
+        if LOG_CAPTURE_UVICORN:
+            for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+                uvicorn_logger = logging.getLogger(name)
+                uvicorn_logger.handlers = []
+                uvicorn_logger.propagate = True
+
+        _listener = QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+        _queue_handler = handler
+        _sampling_filter = sampling
+
+
+def shutdown_logging() -> None:
+    """
+    큐에 남은 로그를 모두 쓰고 writer 스레드 종료.
+    이후 로그가 큐에 쌓여 사라지지 않도록, 루트 로거의 큐 핸들러를 출력 핸들러로 바로 교체
+    (같은 포맷 / 필터, 호출한 스레드에서 동기로 출력)
+    """
+    global _listener
+    with _setup_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+
+        root = logging.getLogger()
+        if _queue_handler is not None and _queue_handler in root.handlers:
+            root.removeHandler(_queue_handler)
+            for output in _listener.handlers:
+                for log_filter in _queue_handler.filters:
+                    output.addFilter(log_filter)
+                root.addHandler(output)
+        _listener = None
+
+
+def get_logging_stats() -> Dict[str, int]:
+    return {
+        "queued": _queue_handler.queue.qsize() if _queue_handler is not None else 0,
+        "dropped_queue_full": _queue_handler.dropped if _queue_handler is not None else 0,
+        "dropped_sampling": _sampling_filter.dropped if _sampling_filter is not None else 0,
+    }
@@ -0,0 +1,354 @@
+# backend/core/metrics.py
+"""
+요청 단위 지연 시간 계측 + Prometheus 텍스트 포맷 노출.
+
+- MetricsMiddleware: 라우트별 응답 시간 히스토그램, 요청마다 DB/Redis 시간과 호출 수 집계
+- attach_query_listeners(engine): SQLAlchemy before/after_cursor_execute 훅
+- instrumented_redis_connection_class(base): redis-py Connection 서브클래스 (명령 단위 시간)
+
+DB/Redis 시간은 contextvar에 담긴 현재 요청의 RequestStats로 합산되므로,
+설문 조회처럼 쿼리가 N번 나가는 라우트는 http_request_db_queries 히스토그램에서 바로 보인다.
+(sync 라우터는 threadpool에서 돌지만 contextvar가 복사되어 같은 RequestStats를 가리킴)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 한 요청의 쿼리 수가 이 값을 넘으면 경고 로그 (N+1 탐지용, 0이면 끔)
+METRICS_QUERY_WARN_THRESHOLD = int(os.getenv("METRICS_QUERY_WARN_THRESHOLD", "20"))
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+# ======================================================
+# 히스토그램 (Prometheus 텍스트 포맷)
+# ======================================================
+class Histogram:
+    """라벨별 누적 버킷 카운트 + 합계 (스레드 안전)"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 -> [버킷별 개수 ..., +Inf 개수], 합계
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            items = [(labels, list(counts), total[0]) for labels, (counts, total) in self._series.items()]
+        for labels, counts, total in sorted(items):
+            base = [f'{k}="{_escape(v)}"' for k, v in zip(self.labelnames, labels)]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format(bound)
+                bucket_labels = ",".join(base + ['le="' + le + '"'])
+                yield f"{self.name}_bucket{{{bucket_labels}}} {cumulative}"
+            suffix = f"{{{','.join(base)}}}" if base else ""
+            yield f"{self.name}_sum{suffix} {_format(total)}"
+            yield f"{self.name}_count{suffix} {cumulative}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    return repr(float(value))
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ("method", "route", "status"),
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds",
+    "요청 하나에서 DB 쿼리에 쓴 시간 합계",
+    ("method", "route"),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "요청 하나에서 실행한 DB 쿼리 수",
+    ("method", "route"),
+    buckets=COUNT_BUCKETS,
+)
+REQUEST_REDIS_TIME = Histogram(
+    "http_request_redis_seconds",
+    "요청 하나에서 Redis 명령에 쓴 시간 합계",
+    ("method", "route"),
+)
+REQUEST_REDIS_COMMANDS = Histogram(
+    "http_request_redis_commands",
+    "요청 하나에서 받은 Redis 응답 수",
+    ("method", "route"),
+    buckets=COUNT_BUCKETS,
+)
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds",
+    "DB 쿼리 실행 시간 (커서 execute 기준)",
+    ("operation",),
+)
+REDIS_COMMAND_LATENCY = Histogram(
+    "redis_command_duration_seconds",
+    "Redis 명령 응답 시간 (파이프라인은 응답 단위)",
+    ("command",),
+)
+
+REGISTRY: List[Histogram] = [
+    REQUEST_LATENCY,
+    REQUEST_DB_TIME,
+    REQUEST_DB_QUERIES,
+    REQUEST_REDIS_TIME,
+    REQUEST_REDIS_COMMANDS,
+    DB_QUERY_LATENCY,
+    REDIS_COMMAND_LATENCY,
+]
+
+
+def render_prometheus() -> str:
+    """/metrics 응답 본문"""
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
+
+
+# ======================================================
+# 요청 단위 집계 (contextvar)
+# ======================================================
+@dataclass
+class RequestStats:
+    db_queries: int = 0
+    db_time: float = 0.0
+    redis_commands: int = 0
+    redis_time: float = 0.0
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _current_request.get()
+
+
+def record_db_query(operation: str, seconds: float) -> None:
+    DB_QUERY_LATENCY.observe(seconds, operation)
+    stats = _current_request.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_time += seconds
+
+
+def record_redis_command(command: str, seconds: float) -> None:
+    REDIS_COMMAND_LATENCY.observe(seconds, command)
+    stats = _current_request.get()
+    if stats is not None:
+        stats.redis_commands += 1
+        stats.redis_time += seconds
+
+
+class MetricsMiddleware:
+    """
+    순수 ASGI 미들웨어 (BaseHTTPMiddleware보다 오버헤드가 적고 contextvar가 라우터까지 그대로 전달됨).
+    응답 헤더에 Server-Timing(db, redis, app)도 붙인다.
+    """
+
+    def __init__(self, app, exclude_paths: Sequence[str] = ("/metrics",)) -> None:
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        started = perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                timing = (
+                    f"db;dur={stats.db_time * 1000:.1f};desc=\"{stats.db_queries} queries\", "
+                    f"redis;dur={stats.redis_time * 1000:.1f}, "
+                    f"app;dur={(perf_counter() - started) * 1000:.1f}"
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - started
+            _current_request.reset(token)
+
+            # 매칭된 라우트의 경로 템플릿만 라벨로 사용 (/movies/{movie_id}), 없으면 묶어서
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+
+            REQUEST_LATENCY.observe(elapsed, method, route_path, str(status_code))
+            REQUEST_DB_TIME.observe(stats.db_time, method, route_path)
+            REQUEST_DB_QUERIES.observe(stats.db_queries, method, route_path)
+            REQUEST_REDIS_TIME.observe(stats.redis_time, method, route_path)
+            REQUEST_REDIS_COMMANDS.observe(stats.redis_commands, method, route_path)
+
+            if METRICS_QUERY_WARN_THRESHOLD and stats.db_queries > METRICS_QUERY_WARN_THRESHOLD:
+                logger.warning(
+                    "many queries in one request: %s %s queries=%d db_time=%.1fms",
+                    method,
+                    route_path,
+                    stats.db_queries,
+                    stats.db_time * 1000,
+                )
+
+
+# ======================================================
+# SQLAlchemy 훅
+# ======================================================
+_QUERY_START_KEY = "metrics_query_start"
+
+
+def _operation(statement: str) -> str:
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def attach_query_listeners(engine: Engine) -> None:
+    """engine(비동기 엔진이면 .sync_engine)에 쿼리 시간 계측 훅 등록"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_QUERY_START_KEY)
+        if starts:
+            record_db_query(_operation(statement), perf_counter() - starts.pop())
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        # 실패한 쿼리는 after_cursor_execute가 안 불리므로 시작 시각만 정리
+        conn = exception_context.connection
+        if conn is not None:
+            starts = conn.info.get(_QUERY_START_KEY)
+            if starts:
+                starts.pop()
+
+
+# ======================================================
+# Redis 훅 (Connection 서브클래스)
+# ======================================================
+def _command_name(args: tuple) -> str:
+    if not args:
+        return "UNKNOWN"
+    name = args[0]
+    if isinstance(name, bytes):
+        name = name.decode(errors="replace")
+    return str(name).upper()
+
+
+def instrumented_redis_connection_class(base: Type) -> Type:
+    """
+    redis.Connection 계열 클래스에 명령 시간 계측을 붙인 서브클래스.
+    send_command로 보낸 명령은 명령 이름으로, 파이프라인(send_packed_command 직접 호출)은
+    PIPELINE으로 기록하며, 응답(read_response) 하나마다 한 번씩 기록한다.
+    """
+
+    class InstrumentedConnection(base):
+        _metrics_command: Optional[str] = None
+        _metrics_pending: Optional[Tuple[str, float]] = None
+
+        def send_command(self, *args, **kwargs):
+            self._metrics_command = _command_name(args)
+            return super().send_command(*args, **kwargs)
+
+        def send_packed_command(self, command, check_health=True):
+            name = self._metrics_command or "PIPELINE"
+            self._metrics_command = None
+            started = perf_counter()
+            super().send_packed_command(command, check_health)
+            # health check PING이 안에서 끝난 뒤에 현재 명령을 대기 상태로 둠
+            self._metrics_pending = (name, started)
+
+        def read_response(self, *args, **kwargs):
+            try:
+                return super().read_response(*args, **kwargs)
+            finally:
+                pending = self._metrics_pending
+                if pending is not None:
+                    now = perf_counter()
+                    record_redis_command(pending[0], now - pending[1])
+                    self._metrics_pending = (pending[0], now)
+
+    InstrumentedConnection.__name__ = f"Instrumented{base.__name__}"
+    InstrumentedConnection.__qualname__ = InstrumentedConnection.__name__
+    return InstrumentedConnection
+
+
+def instrumented_async_redis_connection_class(base: Type) -> Type:
+    """redis.asyncio.Connection 계열용 (instrumented_redis_connection_class와 동일한 규칙)"""
+
+    class InstrumentedConnection(base):
+        _metrics_command: Optional[str] = None
+        _metrics_pending: Optional[Tuple[str, float]] = None
+
+        async def send_command(self, *args, **kwargs):
+            self._metrics_command = _command_name(args)
+            return await super().send_command(*args, **kwargs)
+
+        async def send_packed_command(self, command, check_health=True):
+            name = self._metrics_command or "PIPELINE"
+            self._metrics_command = None
+            started = perf_counter()
+            await super().send_packed_command(command, check_health)
+            self._metrics_pending = (name, started)
+
+        async def read_response(self, *args, **kwargs):
+            try:
+                return await super().read_response(*args, **kwargs)
+            finally:
+                pending = self._metrics_pending
+                if pending is not None:
+                    now = perf_counter()
+                    record_redis_command(pending[0], now - pending[1])
+                    self._metrics_pending = (pending[0], now)
+
+    InstrumentedConnection.__name__ = f"Instrumented{base.__name__}"
+    InstrumentedConnection.__qualname__ = InstrumentedConnection.__name__
+    return InstrumentedConnection
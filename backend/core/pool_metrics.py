@@ -0,0 +1,142 @@
+# backend/core/pool_metrics.py
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool
+
+
+class PoolStats:
+    """
+    커넥션 풀 하나의 누적 통계.
+
+    - wait: 풀에서 커넥션을 얻기까지 기다린 시간 (pool_timeout 대기 포함)
+    - hold: checkout ~ checkin 사이 커넥션을 점유한 시간
+    - overflow: pool_size를 넘겨 max_overflow 구간에서 나간 checkout
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.overflow_checkouts = 0
+            self.max_overflow_seen = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.hold_total = 0.0
+            self.hold_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                self.max_overflow_seen = max(self.max_overflow_seen, overflow)
+
+    def record_checkin(self, held: float) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.hold_total += held
+            self.hold_max = max(self.hold_max, held)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidate(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, object]:
+        """누적 통계 + 현재 풀 상태"""
+        with self._lock:
+            checkouts = self.checkouts
+            data: Dict[str, object] = {
+                "name": self.name,
+                "pool_class": type(pool).__name__,
+                "connects": self.connects,
+                "checkouts": checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "max_overflow_seen": self.max_overflow_seen,
+                "wait_avg_ms": (self.wait_total / checkouts * 1000) if checkouts else 0.0,
+                "wait_max_ms": self.wait_max * 1000,
+                "hold_avg_ms": (self.hold_total / self.checkins * 1000) if self.checkins else 0.0,
+                "hold_max_ms": self.hold_max * 1000,
+            }
+
+        # QueuePool 계열만 size/overflow 정보를 제공함
+        for attr in ("size", "checkedin", "checkedout", "overflow"):
+            getter = getattr(pool, attr, None)
+            if callable(getter):
+                data[attr] = getter()
+        return data
+
+
+# ======================================================
+# 대기 시간 측정용 풀 클래스
+# ======================================================
+def instrumented_pool_class(base: Type[Pool], stats: PoolStats) -> Type[Pool]:
+    """
+    base 풀 클래스의 _do_get()을 감싸 커넥션 대기 시간을 기록하는 서브클래스 생성.
+    dispose() 시 풀이 같은 클래스로 재생성되므로 통계도 그대로 이어진다.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = base._do_get(self)
+        except PoolTimeoutError:
+            stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        stats.record_wait(time.perf_counter() - start)
+        return conn
+
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
+
+
+def attach_pool_listeners(engine: Engine, stats: PoolStats) -> None:
+    """checkout/checkin/connect/invalidate 이벤트로 통계 수집"""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.record_connect()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout_at"] = time.perf_counter()
+        overflow = getattr(engine.pool, "overflow", None)
+        stats.record_checkout(overflow() if callable(overflow) else 0)
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        started = connection_record.info.pop("checkout_at", None)
+        if started is not None:
+            stats.record_checkin(time.perf_counter() - started)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.record_invalidate()
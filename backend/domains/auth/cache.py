@@ -0,0 +1,123 @@
+# backend/domains/auth/cache.py
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from redis import RedisError
+
+from backend.core.env import env_bool
+from backend.utils.cache import TTLCache
+from backend.utils.redis import get_redis_client
+
+# ======================================================
+# 캐시 설정
+# ======================================================
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+# 워커 간 무효화는 Redis로만 전파되므로, 로컬 TTL이 최대 지연 시간이 됨
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+PRINCIPAL_CACHE_REDIS = env_bool("PRINCIPAL_CACHE_REDIS", False)
+PRINCIPAL_CACHE_REDIS_TTL = int(os.getenv("PRINCIPAL_CACHE_REDIS_TTL", "600"))
+PRINCIPAL_REDIS_KEY = "auth:principal:{user_id}"
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """인증에 필요한 유저 정보만 담은 가벼운 객체 (get_current_user 반환값)"""
+
+    user_id: UUID
+    deleted_at: Optional[datetime]
+    onboarding_completed: bool
+
+
+def _redis_key(user_id: UUID) -> str:
+    return PRINCIPAL_REDIS_KEY.format(user_id=user_id)
+
+
+class PrincipalCache:
+    """
+    user_id -> UserPrincipal 캐시.
+
+    - 1차: 프로세스 내부 LRU + TTL
+    - 2차(선택): Redis 해시 (PRINCIPAL_CACHE_REDIS=true 일 때)
+    - Redis 오류는 무시하고 DB 조회로 넘어감
+    """
+
+    def __init__(
+        self,
+        maxsize: int = PRINCIPAL_CACHE_SIZE,
+        ttl: float = PRINCIPAL_CACHE_TTL,
+        use_redis: bool = PRINCIPAL_CACHE_REDIS,
+        redis_ttl: int = PRINCIPAL_CACHE_REDIS_TTL,
+    ) -> None:
+        self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.use_redis = use_redis
+        self.redis_ttl = redis_ttl
+
+    def get(self, user_id: UUID) -> Optional[UserPrincipal]:
+        principal = self._local.get(user_id)
+        if principal is not None or not self.use_redis:
+            return principal
+
+        try:
+            data = get_redis_client().hgetall(_redis_key(user_id))
+        except RedisError:
+            return None
+        if not data:
+            return None
+
+        principal = UserPrincipal(
+            user_id=user_id,
+            deleted_at=datetime.fromisoformat(data["deleted_at"]) if data.get("deleted_at") else None,
+            onboarding_completed=data.get("onboarding_completed") == "1",
+        )
+        self._local.set(user_id, principal)
+        return principal
+
+    def set(self, principal: UserPrincipal) -> None:
+        self._local.set(principal.user_id, principal)
+        if not self.use_redis:
+            return
+
+        key = _redis_key(principal.user_id)
+        try:
+            pipe = get_redis_client().pipeline(transaction=True)
+            pipe.hset(
+                key,
+                mapping={
+                    "deleted_at": principal.deleted_at.isoformat() if principal.deleted_at else "",
+                    "onboarding_completed": "1" if principal.onboarding_completed else "0",
+                },
+            )
+            pipe.expire(key, self.redis_ttl)
+            pipe.execute()
+        except RedisError:
+            pass
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._local.pop(user_id)
+        if not self.use_redis:
+            return
+        try:
+            get_redis_client().delete(_redis_key(user_id))
+        except RedisError:
+            pass
+
+    def stats(self) -> dict:
+        return self._local.stats()
+
+
+# 프로세스 단위 공용 캐시
+principal_cache = PrincipalCache()
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    """
+    users 테이블의 인증 관련 컬럼(deleted_at, onboarding_completed)을 바꾼 뒤 반드시 호출.
+    (온보딩 완료/스킵/설문 저장, 회원 탈퇴 등)
+    """
+    principal_cache.invalidate(user_id)
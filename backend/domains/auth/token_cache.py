@@ -0,0 +1,126 @@
+# backend/domains/auth/token_cache.py
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from redis import RedisError
+
+from backend.core.env import env_bool
+from backend.utils.cache import TTLCache
+from backend.utils.redis import get_redis_client
+
+# ======================================================
+# 캐시 설정
+# ======================================================
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "50000"))
+TOKEN_DENYLIST_REDIS = env_bool("TOKEN_DENYLIST_REDIS", False)
+# 다른 워커에서 폐기한 토큰이 반영되기까지의 최대 지연 (초)
+TOKEN_DENYLIST_SYNC_INTERVAL = float(os.getenv("TOKEN_DENYLIST_SYNC_INTERVAL", "5"))
+TOKEN_DENYLIST_REDIS_KEY = "auth:token:denylist"
+
+
+def token_digest(token: str) -> str:
+    """토큰 원문 대신 캐시 키로 쓰는 SHA-256 digest"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class VerifiedTokenCache:
+    """
+    서명 검증이 끝난 JWT claims 캐시.
+
+    - 키: 토큰 digest, 값: claims (exp 시각까지만 보관)
+    - denylist에 오른 digest는 캐시 여부와 상관없이 거절
+    - denylist는 프로세스 내부 + (선택) Redis ZSET(score=exp)으로 공유
+    """
+
+    def __init__(
+        self,
+        maxsize: int = TOKEN_CACHE_SIZE,
+        use_redis: bool = TOKEN_DENYLIST_REDIS,
+        sync_interval: float = TOKEN_DENYLIST_SYNC_INTERVAL,
+    ) -> None:
+        self._claims = TTLCache(maxsize=maxsize, ttl=0)
+        self._denylist: Dict[str, float] = {}  # digest -> exp (epoch seconds)
+        self._lock = threading.Lock()
+        self.use_redis = use_redis
+        self.sync_interval = sync_interval
+        self._synced_at = 0.0
+        self.revoked_hits = 0
+
+    # -----------------------------
+    # claims 캐시
+    # -----------------------------
+    def get(self, digest: str) -> Optional[dict]:
+        return self._claims.get(digest)
+
+    def put(self, digest: str, claims: dict) -> None:
+        exp = claims.get("exp")
+        if exp is None:
+            return
+        self._claims.set(digest, claims, ttl=float(exp) - time.time())
+
+    # -----------------------------
+    # denylist
+    # -----------------------------
+    def is_revoked(self, digest: str) -> bool:
+        if self.use_redis:
+            self._maybe_sync()
+        exp = self._denylist.get(digest)
+        if exp is None:
+            return False
+        if exp <= time.time():
+            # 이미 만료된 토큰은 서명 검증 단계에서 걸러지므로 목록에서 제거
+            self._denylist.pop(digest, None)
+            return False
+        self.revoked_hits += 1
+        return True
+
+    def revoke(self, digest: str, exp: float) -> None:
+        with self._lock:
+            self._denylist[digest] = float(exp)
+        self._claims.pop(digest)
+
+        if not self.use_redis:
+            return
+        try:
+            get_redis_client().zadd(TOKEN_DENYLIST_REDIS_KEY, {digest: float(exp)})
+        except RedisError:
+            pass
+
+    def _maybe_sync(self) -> None:
+        now = time.monotonic()
+        if now - self._synced_at < self.sync_interval:
+            return
+        with self._lock:
+            if now - self._synced_at < self.sync_interval:
+                return
+            self._synced_at = now
+
+        epoch = time.time()
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            pipe.zremrangebyscore(TOKEN_DENYLIST_REDIS_KEY, "-inf", epoch)
+            pipe.zrangebyscore(TOKEN_DENYLIST_REDIS_KEY, epoch, "+inf", withscores=True)
+            _, entries = pipe.execute()
+        except RedisError:
+            return
+
+        with self._lock:
+            for digest, exp in entries:
+                self._denylist[digest] = exp
+                self._claims.pop(digest)
+
+    def stats(self) -> dict:
+        data = self._claims.stats()
+        data["revoked"] = len(self._denylist)
+        data["revoked_hits"] = self.revoked_hits
+        return data
+
+
+# 프로세스 단위 공용 캐시
+token_cache = VerifiedTokenCache()
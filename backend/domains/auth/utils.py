@@ -3,6 +3,7 @@
 import os
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import UUID
 
 import jwt
 from fastapi import Depends, HTTPException, status
@@ -12,6 +13,9 @@ from sqlalchemy.orm import Session
 from backend.core.db import get_db
 from backend.domains.user.models import User
 
+from .cache import UserPrincipal, principal_cache
+from .token_cache import token_cache, token_digest
+
 # ======================================================
 # JWT 설정
 # ======================================================
@@ -46,15 +50,25 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 # ======================================================
-# 현재 로그인된 유저 조회
+# JWT 검증 (검증 결과 캐시 사용)
 # ======================================================
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    # -----------------------------
-    # 토큰 디코딩
-    # -----------------------------
+def decode_access_token(token: str) -> dict:
+    """
+    서명/만료를 검증한 claims 반환.
+    한 번 검증된 토큰은 exp까지 캐시에서 바로 꺼내 쓰고, 폐기된 토큰은 거절한다.
+    """
+    digest = token_digest(token)
+
+    if token_cache.is_revoked(digest):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="폐기된 토큰입니다.",
+        )
+
+    payload = token_cache.get(digest)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except jwt.ExpiredSignatureError:
@@ -68,23 +82,78 @@ def get_current_user(
             detail="유효하지 않은 토큰입니다.",
         )
 
-    user_id: str = payload.get("sub")
-    if user_id is None:
+    token_cache.put(digest, payload)
+    return payload
+
+
+# ======================================================
+# JWT 폐기 (로그아웃, 탈퇴 등)
+# ======================================================
+def revoke_access_token(token: str) -> None:
+    """토큰을 denylist에 올려 exp 전이라도 더 이상 인증되지 않게 한다."""
+    try:
+        payload = jwt.decode(
+            token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False}
+        )
+    except jwt.InvalidTokenError:
+        return  # 서명이 맞지 않는 토큰은 애초에 인증되지 않음
+
+    exp = payload.get("exp")
+    if exp is not None:
+        token_cache.revoke(token_digest(token), exp)
+
+
+# ======================================================
+# 현재 로그인된 유저 조회
+# ======================================================
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> UserPrincipal:
+    # -----------------------------
+    # 토큰 디코딩
+    # -----------------------------
+    payload = decode_access_token(token)
+
+    sub: Optional[str] = payload.get("sub")
+    if sub is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="토큰에 유저 정보가 없습니다.",
         )
 
+    try:
+        user_id = UUID(sub)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 토큰입니다.",
+        )
+
     # -----------------------------
-    # DB에서 유저 조회
+    # 캐시 조회 → 없으면 DB에서 필요한 컬럼만 조회
     # -----------------------------
-    user = db.query(User).filter(User.user_id == user_id).first()
+    user = principal_cache.get(user_id)
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="해당 유저를 찾을 수 없습니다.",
+    if user is None:
+        row = (
+            db.query(User.user_id, User.deleted_at, User.onboarding_completed)
+            .filter(User.user_id == user_id)
+            .first()
+        )
+
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="해당 유저를 찾을 수 없습니다.",
+            )
+
+        user = UserPrincipal(
+            user_id=row.user_id,
+            deleted_at=row.deleted_at,
+            onboarding_completed=row.onboarding_completed,
         )
+        principal_cache.set(user)
 
     if user.deleted_at:
         raise HTTPException(
@@ -0,0 +1,79 @@
+# backend/domains/movie/genres.py
+"""
+movies.genres 문자열 -> movie_genres 정규화.
+
+구분자는 '|' 또는 ',' (앞뒤 공백 제거, 빈 값 무시).
+카탈로그 적재(ingest movies)는 batch마다 같은 규칙으로 갱신하므로,
+이 모듈은 최초 backfill이나 movies를 직접 수정한 뒤에만 쓰면 된다.
+
+실행:
+    python -m backend.domains.movie.genres
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Python / SQL 양쪽에서 같은 규칙으로 자름
+GENRE_SEPARATOR = r"[|,]"
+_SEPARATOR_RE = re.compile(GENRE_SEPARATOR)
+
+_DELETE_SQL = "DELETE FROM movie_genres WHERE movie_id = ANY(:movie_ids)"
+_INSERT_SQL = f"""
+    INSERT INTO movie_genres (movie_id, genre)
+    SELECT DISTINCT m.movie_id, btrim(g.genre)
+    FROM movies m
+    CROSS JOIN LATERAL regexp_split_to_table(m.genres, '{GENRE_SEPARATOR}') AS g(genre)
+    WHERE m.genres IS NOT NULL AND btrim(g.genre) <> '' {{where}}
+    ON CONFLICT DO NOTHING
+"""
+
+
+def split_genres(genres: Optional[str]) -> List[str]:
+    """'Drama|Comedy' -> ['Drama', 'Comedy']"""
+    if not genres:
+        return []
+    return [g.strip() for g in _SEPARATOR_RE.split(genres) if g.strip()]
+
+
+def sync_movie_genres(db: Session, movie_ids: Optional[Sequence[int]] = None) -> int:
+    """
+    movie_genres를 movies.genres 기준으로 다시 만든다 (movie_ids가 없으면 전체).
+    커밋은 호출한 쪽에서. 반환: 넣은 행 수
+    """
+    if movie_ids is None:
+        db.execute(text("TRUNCATE movie_genres"))
+        result = db.execute(text(_INSERT_SQL.format(where="")))
+    else:
+        ids = list(movie_ids)
+        if not ids:
+            return 0
+        db.execute(text(_DELETE_SQL), {"movie_ids": ids})
+        result = db.execute(
+            text(_INSERT_SQL.format(where="AND m.movie_id = ANY(:movie_ids)")),
+            {"movie_ids": ids},
+        )
+    return result.rowcount
+
+
+def main() -> None:
+    from backend.core.db import get_sessionmaker
+    from backend.utils.http_cache import invalidate as invalidate_http_cache
+
+    db = get_sessionmaker()()
+    try:
+        inserted = sync_movie_genres(db)
+        db.commit()
+    finally:
+        db.close()
+    invalidate_http_cache("movies")
+    print(json.dumps({"movie_genres": inserted}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+# backend/domains/movie/ingest.py
+"""
+영화 카탈로그 대량 적재 CLI (CSV / JSONL, .gz 지원).
+
+파일을 한 줄씩 읽어 batch 단위로 검증하고, 임시 staging 테이블에 COPY 한 뒤
+실제 테이블로 upsert 한다. batch마다 커밋하므로 메모리 사용량은 파일 크기와 무관하다.
+
+실행:
+    python -m backend.domains.movie.ingest movies       data/movies.jsonl.gz
+    python -m backend.domains.movie.ingest providers    data/providers.csv
+    python -m backend.domains.movie.ingest movie-ott    data/movie_ott.csv
+    python -m backend.domains.movie.ingest candidates   data/candidates.csv
+
+컬럼:
+    movies      tmdb_id*, title*, genres, runtime, adult, popularity, tag_genome(JSON)
+    providers   provider_id*, provider_name*, logo_path
+    movie-ott   tmdb_id*, provider_id*, link_url
+    candidates  tmdb_id*, mood_tag*, display_order*
+    (* 필수, movie-ott / candidates는 movies에 있는 tmdb_id만 반영)
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from .genres import GENRE_SEPARATOR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 5000
+
+Record = Dict[str, Any]
+
+
+# ========================================
+# 1. 읽기 (제너레이터)
+# ========================================
+def _open_text(path: str) -> TextIO:
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Tuple[int, Optional[Record]]]:
+    """(줄 번호, 레코드)를 하나씩 yield (JSON 파싱에 실패한 줄은 None)"""
+    fmt = fmt or ("jsonl" if ".jsonl" in path or ".ndjson" in path else "csv")
+    f = _open_text(path)
+    try:
+        if fmt == "jsonl":
+            for lineno, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                yield lineno, record if isinstance(record, dict) else None
+        else:
+            csv.field_size_limit(sys.maxsize)  # tag_genome JSON이 긴 경우
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ========================================
+# 2. 검증 / 변환
+# ========================================
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value.strip() == "")
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("1", "true", "t", "yes", "y"):
+        return True
+    if text in ("0", "false", "f", "no", "n"):
+        return False
+    raise ValueError(f"bool이 아닙니다: {value!r}")
+
+
+def _to_json(value: Any) -> str:
+    # 문자열이면 파싱해서 유효성만 확인하고, 다시 직렬화해서 COPY에 넘김
+    parsed = json.loads(value) if isinstance(value, str) else value
+    if not isinstance(parsed, (dict, list)):
+        raise ValueError("tag_genome은 JSON object/array여야 합니다")
+    return json.dumps(parsed, ensure_ascii=False, separators=(",", ":"))
+
+
+def _to_text(value: Any) -> str:
+    return str(value).strip()
+
+
+@dataclass(frozen=True)
+class Field:
+    name: str
+    convert: Callable[[Any], Any]
+    required: bool = False
+
+
+@dataclass(frozen=True)
+class Entity:
+    """적재 대상 하나: 입력 컬럼 정의 + staging 테이블 + merge SQL"""
+
+    fields: Sequence[Field]
+    staging_table: str
+    staging_ddl: str
+    merge_sql: Sequence[str]
+    post_sql: Sequence[str] = ()
+    cache_namespaces: Sequence[str] = ()  # 적재 후 무효화할 HTTP 응답 캐시 (utils/http_cache)
+    on_loaded: Optional[Callable[[], None]] = None  # 적재 후 호출 (스냅샷 갱신 등)
+
+
+def validate_batch(
+    entity: Entity, batch: Sequence[Tuple[int, Optional[Record]]]
+) -> Tuple[List[Tuple[Any, ...]], List[Tuple[int, str]]]:
+    """검증을 통과한 행 (마지막 컬럼 = 줄 번호) 과 에러 목록"""
+    rows: List[Tuple[Any, ...]] = []
+    errors: List[Tuple[int, str]] = []
+    for lineno, record in batch:
+        if record is None:
+            errors.append((lineno, "JSON 객체가 아닙니다"))
+            continue
+        values = []
+        try:
+            for field in entity.fields:
+                raw = record.get(field.name)
+                if _blank(raw):
+                    if field.required:
+                        raise ValueError(f"{field.name} 값이 없습니다")
+                    values.append(None)
+                else:
+                    values.append(field.convert(raw))
+        except (ValueError, TypeError) as exc:
+            errors.append((lineno, str(exc)))
+            continue
+        values.append(lineno)
+        rows.append(tuple(values))
+    return rows, errors
+
+
+# ========================================
+# 3. 적재 (COPY -> merge)
+# ========================================
+def copy_rows(cur, table: str, columns: Sequence[str], rows: Iterable[Tuple[Any, ...]]) -> None:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        # CSV 형식 COPY에서 따옴표 없는 빈 값 = NULL
+        writer.writerow(["" if v is None else v for v in row])
+    buf.seek(0)
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        buf,
+    )
+
+
+def _bump_ott_providers() -> None:
+    # API 서버의 OTT 목록 스냅샷이 다음 버전 확인 때 다시 읽도록
+    from backend.domains.ott.snapshot import bump_ott_providers_version
+
+    bump_ott_providers_version()
+
+
+def _invalidate_movie_search() -> None:
+    # API 서버의 자동완성 LRU가 다음 버전 확인 때 비워지도록
+    from backend.domains.movie.search import invalidate_typeahead_cache
+
+    invalidate_typeahead_cache()
+
+
+ENTITIES: Dict[str, Entity] = {
+    "movies": Entity(
+        fields=[
+            Field("tmdb_id", int, required=True),
+            Field("title", _to_text, required=True),
+            Field("genres", _to_text),
+            Field("runtime", int),
+            Field("adult", _to_bool),
+            Field("popularity", float),
+            Field("tag_genome", _to_json),
+        ],
+        staging_table="stg_movies",
+        staging_ddl="""
+            CREATE TEMP TABLE stg_movies (
+                tmdb_id integer, title text, genres text, runtime integer,
+                adult boolean, popularity double precision, tag_genome jsonb, _line bigint
+            ) ON COMMIT DELETE ROWS
+        """,
+        merge_sql=[
+            # 같은 tmdb_id가 여러 번 나오면 마지막 줄 기준, 값이 같으면 UPDATE 생략
+            """
+            INSERT INTO movies (tmdb_id, title, genres, runtime, adult, popularity, tag_genome)
+            SELECT DISTINCT ON (tmdb_id)
+                   tmdb_id, title, genres, runtime, COALESCE(adult, false), popularity, tag_genome
+            FROM stg_movies
+            ORDER BY tmdb_id, _line DESC
+            ON CONFLICT (tmdb_id) DO UPDATE SET
+                title = EXCLUDED.title,
+                genres = EXCLUDED.genres,
+                runtime = EXCLUDED.runtime,
+                adult = EXCLUDED.adult,
+                popularity = EXCLUDED.popularity,
+                tag_genome = COALESCE(EXCLUDED.tag_genome, movies.tag_genome)
+            WHERE (movies.title, movies.genres, movies.runtime, movies.adult, movies.popularity,
+                   movies.tag_genome)
+                  IS DISTINCT FROM
+                  (EXCLUDED.title, EXCLUDED.genres, EXCLUDED.runtime, EXCLUDED.adult,
+                   EXCLUDED.popularity, COALESCE(EXCLUDED.tag_genome, movies.tag_genome))
+            """,
+            # batch에 포함된 영화의 movie_genres를 새 genres 값으로 교체
+            """
+            DELETE FROM movie_genres mg
+            USING stg_movies s
+            JOIN movies m ON m.tmdb_id = s.tmdb_id
+            WHERE mg.movie_id = m.movie_id
+            """,
+            f"""
+            INSERT INTO movie_genres (movie_id, genre)
+            SELECT DISTINCT m.movie_id, btrim(g.genre)
+            FROM (SELECT DISTINCT tmdb_id FROM stg_movies) s
+            JOIN movies m ON m.tmdb_id = s.tmdb_id
+            CROSS JOIN LATERAL regexp_split_to_table(m.genres, '{GENRE_SEPARATOR}') AS g(genre)
+            WHERE btrim(g.genre) <> ''
+            ON CONFLICT DO NOTHING
+            """,
+        ],
+        cache_namespaces=("movies", "recommendations:similar"),
+        on_loaded=_invalidate_movie_search,
+    ),
+    "providers": Entity(
+        fields=[
+            Field("provider_id", int, required=True),
+            Field("provider_name", _to_text, required=True),
+            Field("logo_path", _to_text),
+        ],
+        staging_table="stg_providers",
+        staging_ddl="""
+            CREATE TEMP TABLE stg_providers (
+                provider_id integer, provider_name text, logo_path text, _line bigint
+            ) ON COMMIT DELETE ROWS
+        """,
+        merge_sql=[
+            """
+            INSERT INTO ott_providers (provider_id, provider_name, logo_path)
+            SELECT DISTINCT ON (provider_id) provider_id, provider_name, logo_path
+            FROM stg_providers
+            ORDER BY provider_id, _line DESC
+            ON CONFLICT (provider_id) DO UPDATE SET
+                provider_name = EXCLUDED.provider_name,
+                logo_path = EXCLUDED.logo_path
+            WHERE (ott_providers.provider_name, ott_providers.logo_path)
+                  IS DISTINCT FROM (EXCLUDED.provider_name, EXCLUDED.logo_path)
+            """,
+        ],
+        post_sql=[
+            # provider_id를 직접 넣었으므로 시퀀스를 최대값 뒤로 맞춤
+            """
+            SELECT setval(
+                pg_get_serial_sequence('ott_providers', 'provider_id'),
+                GREATEST((SELECT MAX(provider_id) FROM ott_providers), 1)
+            )
+            """,
+        ],
+        on_loaded=_bump_ott_providers,
+    ),
+    "movie-ott": Entity(
+        fields=[
+            Field("tmdb_id", int, required=True),
+            Field("provider_id", int, required=True),
+            Field("link_url", _to_text),
+        ],
+        staging_table="stg_movie_ott",
+        staging_ddl="""
+            CREATE TEMP TABLE stg_movie_ott (
+                tmdb_id integer, provider_id integer, link_url text, _line bigint
+            ) ON COMMIT DELETE ROWS
+        """,
+        merge_sql=[
+            """
+            INSERT INTO movie_ott_map (movie_id, provider_id, link_url)
+            SELECT DISTINCT ON (m.movie_id, s.provider_id) m.movie_id, s.provider_id, s.link_url
+            FROM stg_movie_ott s
+            JOIN movies m ON m.tmdb_id = s.tmdb_id
+            JOIN ott_providers p ON p.provider_id = s.provider_id
+            ORDER BY m.movie_id, s.provider_id, s._line DESC
+            ON CONFLICT (movie_id, provider_id) DO UPDATE SET
+                link_url = EXCLUDED.link_url
+            WHERE movie_ott_map.link_url IS DISTINCT FROM EXCLUDED.link_url
+            """,
+        ],
+        cache_namespaces=("movies", "recommendations:similar"),
+    ),
+    "candidates": Entity(
+        fields=[
+            Field("tmdb_id", int, required=True),
+            Field("mood_tag", _to_text, required=True),
+            Field("display_order", int, required=True),
+        ],
+        staging_table="stg_candidates",
+        staging_ddl="""
+            CREATE TEMP TABLE stg_candidates (
+                tmdb_id integer, mood_tag varchar(50), display_order integer, _line bigint
+            ) ON COMMIT DELETE ROWS
+        """,
+        merge_sql=[
+            # onboarding_candidates에는 자연키 제약이 없으므로 (영화, 태그) 단위로 교체
+            """
+            DELETE FROM onboarding_candidates c
+            USING stg_candidates s
+            JOIN movies m ON m.tmdb_id = s.tmdb_id
+            WHERE c.movie_id = m.movie_id AND c.mood_tag = s.mood_tag
+            """,
+            """
+            INSERT INTO onboarding_candidates (movie_id, mood_tag, display_order)
+            SELECT DISTINCT ON (m.movie_id, s.mood_tag) m.movie_id, s.mood_tag, s.display_order
+            FROM stg_candidates s
+            JOIN movies m ON m.tmdb_id = s.tmdb_id
+            ORDER BY m.movie_id, s.mood_tag, s._line DESC
+            """,
+        ],
+    ),
+}
+
+
+def ingest(
+    raw_conn,
+    entity: Entity,
+    records: Iterable[Tuple[int, Optional[Record]]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_errors: int = 1000,
+    log: Callable[[str], None] = logger.info,
+) -> Dict[str, int]:
+    """
+    records를 batch 단위로 검증 -> COPY -> merge -> 커밋.
+    에러가 max_errors를 넘으면 중단 (이미 커밋된 batch는 유지).
+    """
+    columns = [f.name for f in entity.fields] + ["_line"]
+    stats = {"read": 0, "valid": 0, "invalid": 0, "merged": 0, "batches": 0}
+    started = time.monotonic()
+
+    cur = raw_conn.cursor()
+    try:
+        cur.execute(entity.staging_ddl)
+        raw_conn.commit()
+
+        for batch in batched(records, batch_size):
+            rows, errors = validate_batch(entity, batch)
+            stats["read"] += len(batch)
+            stats["valid"] += len(rows)
+            stats["invalid"] += len(errors)
+            for lineno, message in errors[:20]:
+                log(f"[ingest] line {lineno}: {message}")
+            if stats["invalid"] > max_errors:
+                raise RuntimeError(f"검증 실패가 {max_errors}건을 넘어 중단합니다.")
+            if not rows:
+                continue
+
+            try:
+                copy_rows(cur, entity.staging_table, columns, rows)
+                for sql in entity.merge_sql:
+                    cur.execute(sql)
+                    stats["merged"] += max(cur.rowcount, 0)
+                raw_conn.commit()  # ON COMMIT DELETE ROWS -> staging 비움
+            except BaseException:
+                raw_conn.rollback()
+                raise
+
+            stats["batches"] += 1
+            elapsed = time.monotonic() - started
+            log(f"[ingest] batch {stats['batches']}: read={stats['read']} "
+                f"merged={stats['merged']} invalid={stats['invalid']} "
+                f"({stats['read'] / elapsed:.0f} rows/s)")
+
+        for sql in entity.post_sql:
+            cur.execute(sql)
+        raw_conn.commit()
+    finally:
+        cur.close()
+
+    return stats
+
+
+def main() -> None:
+    from backend.core.db import get_engine
+    from backend.core.log import setup_logging, shutdown_logging
+    from backend.utils.http_cache import invalidate as invalidate_http_cache
+
+    parser = argparse.ArgumentParser(description="영화 카탈로그 대량 적재")
+    parser.add_argument("entity", choices=sorted(ENTITIES))
+    parser.add_argument("path", help="CSV/JSONL 파일 경로 (.gz 가능, '-'는 stdin)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--max-errors", type=int, default=1000)
+    args = parser.parse_args()
+
+    setup_logging()
+    try:
+        raw_conn = get_engine().raw_connection()
+        try:
+            stats = ingest(
+                raw_conn,
+                ENTITIES[args.entity],
+                read_records(args.path, args.format),
+                batch_size=args.batch_size,
+                max_errors=args.max_errors,
+            )
+        finally:
+            raw_conn.close()
+
+        entity = ENTITIES[args.entity]
+        for namespace in entity.cache_namespaces:
+            invalidate_http_cache(namespace)
+        if entity.on_loaded is not None:
+            entity.on_loaded()
+        print(json.dumps(stats))
+    finally:
+        # 캐시 무효화 / on_loaded 훅이 남기는 경고까지 쓴 뒤에 종료
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,19 @@
 # backend/models/movie.py
 
-from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    event,
+    func,
+    literal_column,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -24,6 +37,48 @@ class Movie(Base):
     popularity = Column(Float, nullable=True)
     tag_genome = Column(JSONB, nullable=True)
 
+    # 목록 조회 정렬 키 (coalesce(popularity, 0) DESC, movie_id DESC) 와 같은 모양의 인덱스
+    # -> keyset 페이지네이션이 인덱스 순서대로 LIMIT만큼만 읽고 끝남
+    __table_args__ = (
+        Index(
+            "ix_movies_popularity_keyset",
+            func.coalesce(popularity, 0).desc(),
+            movie_id.desc(),
+        ),
+        Index(
+            "ix_movies_adult_popularity_keyset",
+            adult,
+            func.coalesce(popularity, 0).desc(),
+            movie_id.desc(),
+        ),
+        Index("ix_movies_runtime", runtime),
+        # 제목 검색 (movie/search.py)
+        # - 자동완성 접두어: lower(title) LIKE 'abc%'
+        Index(
+            "ix_movies_title_lower_prefix",
+            func.lower(title).label("title_lower"),
+            postgresql_ops={"title_lower": "text_pattern_ops"},
+        ),
+        # - 단어 검색: to_tsvector('simple', title) @@ query
+        Index(
+            "ix_movies_title_tsv",
+            func.to_tsvector(literal_column("'simple'"), title),
+            postgresql_using="gin",
+        ),
+        # - 오타/부분 일치: title % query, title ILIKE '%abc%' (pg_trgm)
+        Index(
+            "ix_movies_title_trgm",
+            title,
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+
+    genre_rows = relationship(
+        "MovieGenre",
+        back_populates="movie",
+        cascade="all, delete-orphan",
+    )
     onboarding_answers = relationship(
         "UserOnboardingAnswer",
         back_populates="movie",
@@ -36,6 +91,36 @@ class Movie(Base):
     )
 
 
+# gin_trgm_ops 인덱스를 만들기 전에 확장 설치 (create_all 시)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class MovieGenre(Base):
+    """
+    movie_genres 테이블
+    - movies.genres 문자열("Drama|Comedy")을 장르 단위로 정규화한 것
+    - 장르 필터를 LIKE 스캔 대신 (genre, movie_id) 인덱스로 처리
+    - movies.genres를 바꾼 뒤에는 genres.sync_movie_genres()로 다시 맞출 것
+    """
+
+    __tablename__ = "movie_genres"
+
+    movie_id = Column(
+        Integer,
+        ForeignKey("movies.movie_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    genre = Column(String, primary_key=True)
+
+    movie = relationship("Movie", back_populates="genre_rows")
+
+    __table_args__ = (Index("ix_movie_genres_genre_movie", genre, movie_id),)
+
+
 class OttProvider(Base):
     """
     ott_providers 테이블
@@ -102,3 +187,26 @@ class OnboardingCandidate(Base):
     display_order = Column(Integer, nullable=False)
 
     movie = relationship("Movie")
+
+
+class MovieNeighbor(Base):
+    """
+    movie_neighbors 테이블
+    - tag genome 기준으로 미리 계산해 둔 영화별 유사 영화 상위 N개
+    - (movie_id, rank) PK 하나로 "비슷한 영화" 조회가 끝남
+    """
+
+    __tablename__ = "movie_neighbors"
+
+    movie_id = Column(
+        Integer,
+        ForeignKey("movies.movie_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    rank = Column(SmallInteger, primary_key=True)  # 1부터 시작
+    neighbor_movie_id = Column(
+        Integer,
+        ForeignKey("movies.movie_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    score = Column(Float, nullable=False)  # 코사인 유사도
@@ -0,0 +1,85 @@
+# backend/domains/movie/router.py
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from backend.core.db import get_db
+from backend.utils.http_cache import cache_response
+
+from . import search, service
+from .schema import MovieListResponse, MovieSearchResponse, TypeaheadResponse
+
+router = APIRouter(tags=["movie"])
+
+
+# =========================
+# MOV-01-01 영화 목록 (둘러보기)
+# =========================
+@router.get(
+    "/movies",
+    response_model=MovieListResponse,
+    summary="영화 목록 조회 (인기순, cursor 페이지네이션)",
+)
+@cache_response(ttl=300, namespace="movies")
+def browse_movies(
+    genre: Optional[List[str]] = Query(None, description="장르 (여러 개면 하나라도 해당)"),
+    min_runtime: Optional[int] = Query(None, ge=0),
+    max_runtime: Optional[int] = Query(None, ge=0),
+    adult: Optional[bool] = Query(False, description="성인물 여부 (비우면 전체)"),
+    provider_id: Optional[List[int]] = Query(None, description="이 OTT 중 하나에서라도 볼 수 있는 영화만"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+) -> MovieListResponse:
+    filters = service.MovieBrowseFilter(
+        genres=tuple(genre or ()),
+        min_runtime=min_runtime,
+        max_runtime=max_runtime,
+        adult=adult,
+        provider_ids=tuple(provider_id or ()),
+    )
+    return service.browse_movies(db, filters, limit, cursor)
+
+
+@router.get(
+    "/movies/genres",
+    response_model=List[str],
+    summary="장르 목록 조회",
+)
+@cache_response(ttl=3600, namespace="movies")
+def list_genres(db: Session = Depends(get_db)) -> List[str]:
+    return service.list_genres(db)
+
+
+# =========================
+# MOV-02-01 제목 자동완성
+# =========================
+@router.get(
+    "/movies/typeahead",
+    response_model=TypeaheadResponse,
+    summary="영화 제목 자동완성 (접두어 일치, 인기순)",
+)
+def typeahead(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20),
+    db: Session = Depends(get_db),
+) -> TypeaheadResponse:
+    return search.typeahead(db, q, limit)
+
+
+# =========================
+# MOV-02-02 제목 검색
+# =========================
+@router.get(
+    "/movies/search",
+    response_model=MovieSearchResponse,
+    summary="영화 제목 검색 (단어 일치 + 오타 허용)",
+)
+def search_movies(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+) -> MovieSearchResponse:
+    return search.search_titles(db, q, limit)
@@ -0,0 +1,48 @@
+# backend/domains/movie/schema.py
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+# =========================
+# MOV-01-01 영화 목록 (둘러보기)
+# =========================
+class MovieListItem(BaseModel):  # 목록의 영화 한 개
+    movie_id: int
+    title: str
+    genres: List[str]
+    runtime: Optional[int] = None
+    adult: bool
+    popularity: Optional[float] = None
+
+
+class MovieListResponse(BaseModel):  # 영화 목록 한 페이지
+    movies: List[MovieListItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 None)
+
+
+# =========================
+# MOV-02-01 제목 자동완성
+# =========================
+class TypeaheadItem(BaseModel):  # 자동완성 후보 한 개
+    movie_id: int
+    title: str
+
+
+class TypeaheadResponse(BaseModel):  # 자동완성 후보 목록 (인기순)
+    suggestions: List[TypeaheadItem]
+
+
+# =========================
+# MOV-02-02 제목 검색
+# =========================
+class MovieSearchItem(BaseModel):  # 검색 결과 한 개
+    movie_id: int
+    title: str
+    popularity: Optional[float] = None
+    score: float  # max(전문 검색 순위, 트라이그램 유사도)
+
+
+class MovieSearchResponse(BaseModel):  # 검색 결과 목록 (관련도순)
+    movies: List[MovieSearchItem]
@@ -0,0 +1,160 @@
+# backend/domains/movie/search.py
+"""
+영화 제목 검색.
+
+- typeahead: lower(title) LIKE 'prefix%'  -> ix_movies_title_lower_prefix (text_pattern_ops)
+- search:    to_tsvector('simple', title) @@ query  -> ix_movies_title_tsv (GIN)
+             OR title % query (pg_trgm 유사도)        -> ix_movies_title_trgm (GIN)
+
+짧은 접두어(한두 글자)는 일치하는 행이 많아 정렬 비용이 크고 요청도 가장 많으므로
+프로세스 내부 LRU에 잠깐 보관한다.
+카탈로그를 바꾼 쪽(ingest CLI 등)은 invalidate_typeahead_cache()로 Redis 버전을 올리고,
+각 API 프로세스는 TYPEAHEAD_VERSION_CHECK_INTERVAL마다 버전을 확인해 바뀌었으면 LRU를 비운다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from redis import RedisError
+from sqlalchemy import func, literal_column, or_, select
+from sqlalchemy.orm import Session
+
+from backend.utils.cache import TTLCache
+from backend.utils.redis import get_redis_client
+
+from .models import Movie
+from .schema import MovieSearchItem, MovieSearchResponse, TypeaheadItem, TypeaheadResponse
+
+TYPEAHEAD_CACHE_SIZE = int(os.getenv("TYPEAHEAD_CACHE_SIZE", "2048"))
+TYPEAHEAD_CACHE_TTL = int(os.getenv("TYPEAHEAD_CACHE_TTL", "300"))  # 초 단위
+# 이보다 긴 접두어는 재사용이 드물어 캐시에 넣지 않음 (핫 접두어가 밀려나지 않게)
+TYPEAHEAD_CACHE_MAX_LEN = int(os.getenv("TYPEAHEAD_CACHE_MAX_LEN", "4"))
+TYPEAHEAD_VERSION_KEY = "movies:typeahead:version"
+# Redis 버전 번호 확인 주기 (= 다른 프로세스의 변경이 보이기까지 최대 지연)
+TYPEAHEAD_VERSION_CHECK_INTERVAL = float(os.getenv("TYPEAHEAD_VERSION_CHECK_INTERVAL", "5"))
+
+logger = logging.getLogger(__name__)
+
+_SIMPLE = literal_column("'simple'")
+_TITLE_TSV = func.to_tsvector(_SIMPLE, Movie.title)  # ix_movies_title_tsv 와 같은 식
+_POPULARITY_KEY = func.coalesce(Movie.popularity, literal_column("0"))
+_WHITESPACE_RE = re.compile(r"\s+")
+
+typeahead_cache = TTLCache(maxsize=TYPEAHEAD_CACHE_SIZE, ttl=TYPEAHEAD_CACHE_TTL)
+_typeahead_version: Optional[int] = None
+_typeahead_checked_at: Optional[float] = None
+_typeahead_version_lock = threading.Lock()
+
+
+def _sync_typeahead_version() -> None:
+    """다른 프로세스가 버전을 올렸으면 이 프로세스의 LRU를 비움 (Redis 오류 시 TTL에 맡김)"""
+    global _typeahead_version, _typeahead_checked_at
+    now = time.monotonic()
+    checked_at = _typeahead_checked_at
+    if checked_at is not None and now - checked_at < TYPEAHEAD_VERSION_CHECK_INTERVAL:
+        return
+    with _typeahead_version_lock:
+        if _typeahead_checked_at is not None and now - _typeahead_checked_at < TYPEAHEAD_VERSION_CHECK_INTERVAL:
+            return
+        _typeahead_checked_at = now
+        try:
+            version = int(get_redis_client().get(TYPEAHEAD_VERSION_KEY) or 0)
+        except RedisError:
+            return
+        if _typeahead_version is not None and version != _typeahead_version:
+            typeahead_cache.clear()
+        _typeahead_version = version
+
+
+def normalize_query(q: str) -> str:
+    """앞뒤 공백 제거, 연속 공백 하나로, 소문자"""
+    return _WHITESPACE_RE.sub(" ", q).strip().lower()
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# ========================================
+# MOV-02-01 자동완성 (접두어)
+# ========================================
+def typeahead(db: Session, q: str, limit: int) -> TypeaheadResponse:
+    prefix = normalize_query(q)
+    if not prefix:
+        return TypeaheadResponse(suggestions=[])
+
+    cacheable = len(prefix) <= TYPEAHEAD_CACHE_MAX_LEN
+    key = (prefix, limit)
+    if cacheable:
+        _sync_typeahead_version()
+        cached = typeahead_cache.get(key)
+        if cached is not None:
+            return TypeaheadResponse(suggestions=cached)
+
+    rows: List[Tuple[int, str]] = db.execute(
+        select(Movie.movie_id, Movie.title)
+        .where(
+            func.lower(Movie.title).like(_escape_like(prefix) + "%", escape="\\"),
+            Movie.adult == False,  # noqa: E712
+        )
+        .order_by(_POPULARITY_KEY.desc(), Movie.movie_id.desc())
+        .limit(limit)
+    ).all()
+
+    suggestions = [TypeaheadItem(movie_id=movie_id, title=title) for movie_id, title in rows]
+    if cacheable:
+        typeahead_cache.set(key, suggestions)
+    return TypeaheadResponse(suggestions=suggestions)
+
+
+# ========================================
+# MOV-02-02 제목 검색 (단어 + 유사도)
+# ========================================
+def search_titles(db: Session, q: str, limit: int) -> MovieSearchResponse:
+    query = normalize_query(q)
+    if not query:
+        return MovieSearchResponse(movies=[])
+
+    ts_query = func.plainto_tsquery(_SIMPLE, query)
+    score = func.greatest(
+        func.ts_rank(_TITLE_TSV, ts_query),
+        func.similarity(Movie.title, query),
+    ).label("score")
+
+    # 두 조건 모두 GIN 인덱스가 있어 BitmapOr로 합쳐짐 (순차 스캔 없음)
+    rows = db.execute(
+        select(Movie.movie_id, Movie.title, Movie.popularity, score)
+        .where(
+            or_(_TITLE_TSV.op("@@")(ts_query), Movie.title.op("%")(query)),
+            Movie.adult == False,  # noqa: E712
+        )
+        .order_by(score.desc(), _POPULARITY_KEY.desc(), Movie.movie_id.desc())
+        .limit(limit)
+    ).all()
+
+    return MovieSearchResponse(
+        movies=[
+            MovieSearchItem(
+                movie_id=row.movie_id,
+                title=row.title,
+                popularity=row.popularity,
+                score=float(row.score),
+            )
+            for row in rows
+        ]
+    )
+
+
+def invalidate_typeahead_cache() -> None:
+    """movies 제목/인기도 변경 후 호출 (Redis 버전을 올려 모든 API 프로세스의 LRU도 비움)"""
+    try:
+        get_redis_client().incr(TYPEAHEAD_VERSION_KEY)
+    except RedisError as exc:
+        logger.warning("typeahead cache version bump failed: %s", exc)
+    typeahead_cache.clear()
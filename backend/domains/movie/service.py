@@ -0,0 +1,138 @@
+# backend/domains/movie/service.py
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, exists, false, func, literal_column, select, tuple_
+from sqlalchemy.orm import Session
+
+from .genres import split_genres
+from .models import Movie, MovieGenre, MovieOttMap
+from .schema import MovieListItem, MovieListResponse
+
+# 정렬 키: models.Movie의 ix_movies_popularity_keyset 인덱스와 같은 식이어야 인덱스를 탐
+# (0을 바인드 파라미터로 보내면 식이 달라지므로 리터럴로 고정)
+_POPULARITY_KEY = func.coalesce(Movie.popularity, literal_column("0"))
+
+
+# ========================================
+# keyset 커서
+# ========================================
+def encode_cursor(popularity: float, movie_id: int) -> str:
+    """마지막 행의 정렬 키 -> 불투명한 커서 문자열"""
+    raw = json.dumps([popularity, movie_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        popularity, movie_id = json.loads(raw)
+        return float(popularity), int(movie_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 cursor 입니다.",
+        )
+
+
+@dataclass(frozen=True)
+class MovieBrowseFilter:
+    genres: Sequence[str] = ()  # 하나라도 해당하면 포함
+    min_runtime: Optional[int] = None
+    max_runtime: Optional[int] = None
+    adult: Optional[bool] = False  # None이면 성인물 여부와 관계없이
+    provider_ids: Sequence[int] = ()  # 이 OTT 중 하나에서라도 볼 수 있는 영화만
+
+
+def _filter_clauses(f: MovieBrowseFilter) -> List:
+    clauses = []
+    if f.adult is not None:
+        # IS FALSE는 btree 인덱스를 못 타므로 = 비교
+        clauses.append(Movie.adult == f.adult)
+    if f.min_runtime is not None:
+        clauses.append(Movie.runtime >= f.min_runtime)
+    if f.max_runtime is not None:
+        clauses.append(Movie.runtime <= f.max_runtime)
+    if f.genres:
+        # (genre, movie_id) 인덱스 조회 -> LIKE 스캔 없음
+        clauses.append(
+            exists().where(
+                MovieGenre.movie_id == Movie.movie_id,
+                MovieGenre.genre.in_(list(f.genres)),
+            )
+        )
+    if f.provider_ids:
+        # movie_ott_map PK (movie_id, provider_id) 조회
+        clauses.append(
+            exists().where(
+                MovieOttMap.movie_id == Movie.movie_id,
+                MovieOttMap.provider_id.in_(list(f.provider_ids)),
+            )
+        )
+    if f.min_runtime is not None and f.max_runtime is not None and f.min_runtime > f.max_runtime:
+        clauses.append(false())
+    return clauses
+
+
+# ========================================
+# MOV-01-01 영화 목록 (인기순, keyset 페이지네이션)
+# ========================================
+def browse_movies(
+    db: Session,
+    filters: MovieBrowseFilter,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> MovieListResponse:  # OFFSET 없이 "마지막으로 본 (인기도, movie_id) 다음"부터 조회
+
+    clauses = _filter_clauses(filters)
+    if cursor:
+        popularity, movie_id = decode_cursor(cursor)
+        clauses.append(tuple_(_POPULARITY_KEY, Movie.movie_id) < tuple_(popularity, movie_id))
+
+    # 한 개 더 읽어서 다음 페이지 존재 여부 판단
+    rows = db.execute(
+        select(
+            Movie.movie_id,
+            Movie.title,
+            Movie.genres,
+            Movie.runtime,
+            Movie.adult,
+            Movie.popularity,
+        )
+        .where(and_(*clauses))
+        .order_by(_POPULARITY_KEY.desc(), Movie.movie_id.desc())
+        .limit(limit + 1)
+    ).all()
+
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and page:
+        last = page[-1]
+        next_cursor = encode_cursor(last.popularity or 0.0, last.movie_id)
+
+    return MovieListResponse(
+        movies=[
+            MovieListItem(
+                movie_id=row.movie_id,
+                title=row.title,
+                genres=split_genres(row.genres),
+                runtime=row.runtime,
+                adult=row.adult,
+                popularity=row.popularity,
+            )
+            for row in page
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+def list_genres(db: Session) -> List[str]:
+    """필터에 쓸 수 있는 장르 목록 (ix_movie_genres_genre_movie 인덱스만 읽음)"""
+    return list(db.scalars(select(MovieGenre.genre).distinct().order_by(MovieGenre.genre)).all())
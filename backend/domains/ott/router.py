@@ -0,0 +1,31 @@
+# backend/domains/ott/router.py
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from backend.core.db import get_db
+from backend.utils.http_cache import cache_response
+
+from .schema import OttProviderItem, OttProvidersResponse
+from .snapshot import HTTP_CACHE_NAMESPACE, ott_provider_snapshot
+
+router = APIRouter(tags=["ott"])
+
+
+# =========================
+# OTT-01-01 OTT 플랫폼 목록
+# =========================
+@router.get(
+    "/ott/providers",
+    response_model=OttProvidersResponse,
+    summary="OTT 플랫폼 목록 조회 (온보딩 OTT 선택용)",
+)
+@cache_response(ttl=60, namespace=HTTP_CACHE_NAMESPACE)
+def list_providers(db: Session = Depends(get_db)) -> OttProvidersResponse:
+    """메모리 스냅샷에서 응답 (스냅샷이 최신이면 DB 조회 없음)"""
+    return OttProvidersResponse(
+        providers=[
+            OttProviderItem(provider_id=provider_id, provider_name=name, logo_path=logo_path)
+            for provider_id, name, logo_path in ott_provider_snapshot.providers(db)
+        ]
+    )
@@ -0,0 +1,18 @@
+# backend/domains/ott/schema.py
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+# =========================
+# OTT-01-01 OTT 플랫폼 목록
+# =========================
+class OttProviderItem(BaseModel):  # OTT 플랫폼 한 개
+    provider_id: int
+    provider_name: str
+    logo_path: Optional[str] = None
+
+
+class OttProvidersResponse(BaseModel):  # OTT 플랫폼 목록 (provider_id 순)
+    providers: List[OttProviderItem]
@@ -0,0 +1,162 @@
+# backend/domains/ott/snapshot.py
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from redis import RedisError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.domains.movie.models import OttProvider
+from backend.utils.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# ======================================================
+# 스냅샷 설정
+# ======================================================
+OTT_PROVIDERS_VERSION_KEY = "ott:providers:version"
+# Redis 버전 번호 확인 주기 (= 다른 프로세스의 변경이 보이기까지 최대 지연)
+OTT_SNAPSHOT_CHECK_INTERVAL = float(os.getenv("OTT_SNAPSHOT_CHECK_INTERVAL", "5"))
+# Redis를 못 쓸 때는 이 주기로 DB에서 다시 읽음
+OTT_SNAPSHOT_TTL = float(os.getenv("OTT_SNAPSHOT_TTL", "300"))
+
+HTTP_CACHE_NAMESPACE = "ott:providers"
+
+
+@dataclass(frozen=True)
+class _State:
+    """한 시점의 ott_providers 전체 (참조 교체로 통째로 바뀜)"""
+
+    providers: Tuple[Tuple[int, str, Optional[str]], ...]  # (provider_id, name, logo_path)
+    provider_ids: FrozenSet[int]
+    version: Optional[int]  # 읽을 당시 Redis 버전 (Redis를 못 썼으면 None)
+    loaded_at: float
+
+
+class OttProviderSnapshot:
+    """
+    ott_providers 테이블의 프로세스 단위 스냅샷.
+
+    - 앱 시작 시(lifespan) 한 번 읽고, 이후 요청은 DB 조회 없이 메모리에서 응답
+    - OTT_SNAPSHOT_CHECK_INTERVAL마다 Redis 버전(ott:providers:version)만 확인해서
+      바뀌었으면 다시 읽는다. 테이블을 바꾼 쪽은 bump_ott_providers_version()을 호출할 것.
+    """
+
+    def __init__(
+        self,
+        check_interval: float = OTT_SNAPSHOT_CHECK_INTERVAL,
+        ttl: float = OTT_SNAPSHOT_TTL,
+    ) -> None:
+        self.check_interval = check_interval
+        self.ttl = ttl
+        self._state: Optional[_State] = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    # -----------------------------
+    # 버전
+    # -----------------------------
+    @staticmethod
+    def _remote_version() -> Optional[int]:
+        try:
+            return int(get_redis_client().get(OTT_PROVIDERS_VERSION_KEY) or 0)
+        except RedisError:
+            return None
+
+    def _recently_checked(self, now: float) -> bool:
+        return self._checked_at is not None and now - self._checked_at < self.check_interval
+
+    def _is_changed(self, state: _State, now: float) -> bool:
+        version = self._remote_version()
+        if version is None or state.version is None:
+            # Redis 장애 중에는 TTL 기준으로만 갱신
+            return now - state.loaded_at >= self.ttl
+        return version != state.version
+
+    # -----------------------------
+    # 로딩 / 갱신
+    # -----------------------------
+    def load(self, db: Session) -> _State:
+        """DB에서 전체 목록을 읽어 스냅샷 교체"""
+        # 버전을 먼저 읽어야 읽는 도중 바뀐 내용을 다음 확인에서 놓치지 않음
+        version = self._remote_version()
+        rows = db.execute(
+            select(OttProvider.provider_id, OttProvider.provider_name, OttProvider.logo_path)
+            .order_by(OttProvider.provider_id)
+        ).all()
+        providers = tuple((provider_id, name, logo) for provider_id, name, logo in rows)
+        state = _State(
+            providers=providers,
+            provider_ids=frozenset(provider_id for provider_id, _, _ in providers),
+            version=version,
+            loaded_at=time.monotonic(),
+        )
+        self._state = state
+        self._checked_at = state.loaded_at
+        return state
+
+    def load_once(self) -> None:
+        """lifespan 시작 시 호출 (자체 세션 사용)"""
+        from backend.core.db import get_sessionmaker
+
+        db = get_sessionmaker()()
+        try:
+            self.load(db)
+        finally:
+            db.close()
+
+    def ensure_fresh(self, db: Session) -> _State:
+        state = self._state
+        if state is not None and self._recently_checked(time.monotonic()):
+            return state
+        with self._lock:
+            state = self._state
+            now = time.monotonic()
+            # 다른 스레드가 먼저 확인했으면 건너뜀
+            if state is not None and self._recently_checked(now):
+                return state
+            if state is None or self._is_changed(state, now):
+                return self.load(db)
+            self._checked_at = now
+            return state
+
+    def invalidate(self) -> None:
+        """이 프로세스에서 다음 조회 시 다시 읽도록 표시"""
+        self._state = None
+
+    # -----------------------------
+    # 조회
+    # -----------------------------
+    def providers(self, db: Session) -> Tuple[Tuple[int, str, Optional[str]], ...]:
+        return self.ensure_fresh(db).providers
+
+    def unknown_ids(self, db: Session, provider_ids: Iterable[int]) -> List[int]:
+        """스냅샷에 없는 provider_id 목록 (입력 순서 유지, 중복 제거)"""
+        known = self.ensure_fresh(db).provider_ids
+        return list(dict.fromkeys(p for p in provider_ids if p not in known))
+
+
+# 프로세스 단위 공용 스냅샷
+ott_provider_snapshot = OttProviderSnapshot()
+
+
+def bump_ott_providers_version() -> None:
+    """
+    ott_providers 변경 후 호출.
+    Redis 버전을 올려 모든 프로세스의 스냅샷을 갱신시키고, 응답 캐시도 비운다.
+    """
+    from backend.utils.http_cache import invalidate as invalidate_http_cache
+
+    try:
+        get_redis_client().incr(OTT_PROVIDERS_VERSION_KEY)
+    except RedisError as exc:
+        logger.warning("ott providers version bump failed: %s", exc)
+    ott_provider_snapshot.invalidate()
+    invalidate_http_cache(HTTP_CACHE_NAMESPACE)
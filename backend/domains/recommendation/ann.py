@@ -0,0 +1,286 @@
+# backend/domains/recommendation/ann.py
+"""
+tag genome 벡터용 IVF(inverted file) 근사 최근접 이웃 인덱스.
+
+- 학습: 정규화된 벡터에 spherical k-means -> nlist개 중심점
+- 검색: query와 가까운 중심점 nprobe개의 리스트만 정확히 채점
+  (nprobe를 올리면 recall↑ / 지연↑, nlist를 올리면 리스트가 작아져 지연↓)
+
+실행:
+    python -m backend.domains.recommendation.ann build --store data/genome [--nlist 256]
+    python -m backend.domains.recommendation.ann eval  --store data/genome --k 10 --nprobe 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .engine import l2_normalize
+
+ANN_INDEX_FILE = "ivf.npz"
+_ASSIGN_CHUNK = 8192
+
+
+def _default_nlist(n: int) -> int:
+    # 흔히 쓰는 sqrt(N) 근처, 최소 1
+    return max(1, int(np.sqrt(n)))
+
+
+def _assign(matrix: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """각 행을 가장 가까운(내적이 큰) 중심점에 배정 (청크 단위)"""
+    labels = np.empty(len(matrix), dtype=np.int32)
+    for start in range(0, len(matrix), _ASSIGN_CHUNK):
+        block = np.asarray(matrix[start : start + _ASSIGN_CHUNK], dtype=np.float32)
+        labels[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part])]
+
+
+class IVFIndex:
+    """
+    행 번호 기준 IVF 인덱스 (벡터 자체는 저장하지 않고 genome 행렬을 그대로 참조).
+
+    리스트는 CSR 형태로 보관: list_rows[offsets[i]:offsets[i+1]] = i번 리스트의 행 번호
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        offsets: np.ndarray,
+        list_rows: np.ndarray,
+        nprobe: int = 8,
+    ) -> None:
+        self.centroids = centroids.astype(np.float32, copy=False)
+        self.offsets = offsets.astype(np.int64, copy=False)
+        self.list_rows = list_rows.astype(np.int64, copy=False)
+        self.nprobe = nprobe
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    # -----------------------------
+    # 학습
+    # -----------------------------
+    @classmethod
+    def train(
+        cls,
+        matrix: np.ndarray,
+        nlist: Optional[int] = None,
+        iters: int = 20,
+        sample_size: int = 50000,
+        seed: int = 0,
+        nprobe: int = 8,
+    ) -> "IVFIndex":
+        n = len(matrix)
+        nlist = min(nlist or _default_nlist(n), max(n, 1))
+        rng = np.random.default_rng(seed)
+
+        sample_rows = np.sort(rng.choice(n, size=min(sample_size, n), replace=False))
+        sample = np.asarray(matrix[sample_rows], dtype=np.float32)
+        nlist = min(nlist, len(sample))
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+
+        for _ in range(iters):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=nlist)
+
+            # 빈 클러스터는 임의의 샘플로 다시 시작
+            empty = np.flatnonzero(counts == 0)
+            if empty.size:
+                sums[empty] = sample[rng.choice(len(sample), size=empty.size, replace=False)]
+            centroids = l2_normalize(sums).astype(np.float32)
+
+        return cls.from_centroids(matrix, centroids, nprobe=nprobe)
+
+    @classmethod
+    def from_centroids(cls, matrix: np.ndarray, centroids: np.ndarray, nprobe: int = 8) -> "IVFIndex":
+        """
+        학습된 중심점에 matrix의 모든 행을 다시 배정 (재학습 없이 리스트만 새로 만듦).
+        태그 목록이 같은 새 genome 빌드로 이전 인덱스를 옮길 때 사용.
+        """
+        labels = _assign(matrix, centroids)
+        order = np.argsort(labels, kind="stable")
+        counts = np.bincount(labels, minlength=len(centroids))
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        return cls(centroids, offsets, order, nprobe=nprobe)
+
+    # -----------------------------
+    # 검색
+    # -----------------------------
+    def candidates(self, query: np.ndarray, nprobe: Optional[int] = None) -> np.ndarray:
+        probes = _top_k(self.centroids @ query, nprobe or self.nprobe)
+        return np.concatenate(
+            [self.list_rows[self.offsets[i] : self.offsets[i + 1]] for i in probes]
+        )
+
+    def search(
+        self,
+        matrix: np.ndarray,
+        query: np.ndarray,
+        k: int,
+        nprobe: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """query와 가까운 상위 k개 (행 번호, 점수). matrix는 학습에 쓴 genome 행렬"""
+        query = query.astype(np.float32, copy=False)
+        rows = self.candidates(query, nprobe)
+        scores = np.asarray(matrix[rows], dtype=np.float32) @ query
+        best = _top_k(scores, k)
+        return rows[best], scores[best]
+
+    def search_batch(
+        self,
+        matrix: np.ndarray,
+        queries: np.ndarray,
+        k: int,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        return [self.search(matrix, q, k, nprobe) for q in queries]
+
+    # -----------------------------
+    # 저장 / 로드
+    # -----------------------------
+    def save(self, path: str) -> None:
+        tmp = path + ".tmp.npz"
+        np.savez(
+            tmp,
+            centroids=self.centroids,
+            offsets=self.offsets,
+            list_rows=self.list_rows,
+            nprobe=np.int64(self.nprobe),
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IVFIndex":
+        with np.load(path) as data:
+            return cls(
+                data["centroids"],
+                data["offsets"],
+                data["list_rows"],
+                nprobe=int(data["nprobe"]),
+            )
+
+
+# ========================================
+# 정확도 평가 (recall@k vs 전체 탐색)
+# ========================================
+def exact_search(matrix: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """전체 탐색 결과 행 번호 (query 수 x k)"""
+    results = []
+    for start in range(0, len(queries), 256):
+        block = queries[start : start + 256] @ np.asarray(matrix, dtype=np.float32).T
+        kk = min(k, block.shape[1])
+        part = np.argpartition(-block, kk - 1, axis=1)[:, :kk]
+        part_scores = np.take_along_axis(block, part, axis=1)
+        results.append(np.take_along_axis(part, np.argsort(-part_scores, axis=1), axis=1))
+    return np.concatenate(results)
+
+
+def evaluate(
+    index: IVFIndex,
+    matrix: np.ndarray,
+    k: int = 10,
+    nprobes: Sequence[int] = (1, 2, 4, 8, 16, 32),
+    num_queries: int = 500,
+    seed: int = 0,
+) -> List[Dict[str, float]]:
+    """
+    영화 벡터 일부를 query로 써서 nprobe별 recall@k와 평균 지연을 측정.
+    기준은 전체 탐색(exact_search)의 상위 k개.
+    """
+    rng = np.random.default_rng(seed)
+    query_rows = rng.choice(len(matrix), size=min(num_queries, len(matrix)), replace=False)
+    queries = np.asarray(matrix[query_rows], dtype=np.float32)
+
+    start = time.perf_counter()
+    truth = exact_search(matrix, queries, k)
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    report = [{"nprobe": 0, "recall": 1.0, "latency_ms": exact_ms, "candidates": float(len(matrix))}]
+    for nprobe in nprobes:
+        hits = 0
+        candidates = 0
+        start = time.perf_counter()
+        results = index.search_batch(matrix, queries, k, nprobe)
+        elapsed = time.perf_counter() - start
+        for (rows, _), expected in zip(results, truth):
+            hits += len(np.intersect1d(rows, expected, assume_unique=True))
+        for q in queries[: min(50, len(queries))]:
+            candidates += len(index.candidates(q, nprobe))
+        report.append(
+            {
+                "nprobe": nprobe,
+                "recall": hits / truth.size,
+                "latency_ms": elapsed * 1000 / len(queries),
+                "candidates": candidates / min(50, len(queries)),
+            }
+        )
+    return report
+
+
+def main() -> None:
+    from .genome_store import GENOME_STORE_DIR, open_genome_store
+
+    parser = argparse.ArgumentParser(description="tag genome IVF 인덱스")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="현재 genome 빌드로 IVF 인덱스 학습")
+    build.add_argument("--store", default=GENOME_STORE_DIR or "data/genome")
+    build.add_argument("--nlist", type=int, default=None)
+    build.add_argument("--nprobe", type=int, default=8, help="검색 기본값")
+    build.add_argument("--iters", type=int, default=20)
+
+    ev = sub.add_parser("eval", help="nprobe별 recall@k / 지연 측정")
+    ev.add_argument("--store", default=GENOME_STORE_DIR or "data/genome")
+    ev.add_argument("--k", type=int, default=10)
+    ev.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    ev.add_argument("--queries", type=int, default=500)
+
+    args = parser.parse_args()
+    store = open_genome_store(args.store)
+    if store is None:
+        parser.error(f"genome 빌드가 없습니다: {args.store}")
+
+    path = os.path.join(store.path, ANN_INDEX_FILE)
+    if args.command == "build":
+        start = time.perf_counter()
+        index = IVFIndex.train(store.matrix, nlist=args.nlist, iters=args.iters, nprobe=args.nprobe)
+        index.save(path)
+        print(
+            json.dumps(
+                {
+                    "path": path,
+                    "nlist": index.nlist,
+                    "rows": int(len(index.list_rows)),
+                    "seconds": round(time.perf_counter() - start, 2),
+                }
+            )
+        )
+    else:
+        index = IVFIndex.load(path)
+        for row in evaluate(index, store.matrix, k=args.k, nprobes=args.nprobe, num_queries=args.queries):
+            print(
+                f"nprobe={int(row['nprobe']):>4}  recall@{args.k}={row['recall']:.3f}  "
+                f"latency={row['latency_ms']:.3f}ms  candidates={row['candidates']:.0f}"
+                + ("  (exact)" if row["nprobe"] == 0 else "")
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# backend/domains/recommendation/availability.py
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.domains.movie.models import MovieOttMap
+
+if TYPE_CHECKING:
+    from .engine import TagGenomeIndex
+
+OTT_AVAILABILITY_TTL = 600  # movie_ott_map 재로딩 주기 (초 단위)
+
+
+class OttAvailabilityBitsets:
+    """
+    provider_id -> 영화 행 번호 비트셋 (np.packbits, 영화 8편당 1바이트).
+
+    TagGenomeIndex의 행 순서와 1:1로 맞춰 두고,
+    유저 구독 목록은 비트셋 OR 한 번으로 후보 마스크가 된다.
+    """
+
+    def __init__(self, size: int, bitsets: Dict[int, np.ndarray]) -> None:
+        self.size = size
+        self._bitsets = bitsets
+
+    @classmethod
+    def build(cls, db: Session, index: "TagGenomeIndex") -> "OttAvailabilityBitsets":
+        rows = db.execute(select(MovieOttMap.provider_id, MovieOttMap.movie_id)).all()
+        size = len(index)
+        if not rows or size == 0:
+            return cls(size, {})
+
+        provider_ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+        movie_ids = np.fromiter((r[1] for r in rows), dtype=np.int64, count=len(rows))
+
+        # movie_id -> 행 번호 (index.movie_ids는 movie_id 오름차순)
+        pos = np.searchsorted(index.movie_ids, movie_ids)
+        pos_clipped = np.minimum(pos, size - 1)
+        known = index.movie_ids[pos_clipped] == movie_ids
+
+        bitsets: Dict[int, np.ndarray] = {}
+        for provider_id in np.unique(provider_ids[known]):
+            flags = np.zeros(size, dtype=bool)
+            flags[pos_clipped[known & (provider_ids == provider_id)]] = True
+            bitsets[int(provider_id)] = np.packbits(flags)
+        return cls(size, bitsets)
+
+    def mask_for(self, provider_ids: Iterable[int]) -> np.ndarray:
+        """구독 중인 OTT 중 하나라도 제공하는 영화 = True인 bool 마스크"""
+        packed = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        for provider_id in provider_ids:
+            bitset = self._bitsets.get(provider_id)
+            if bitset is not None:
+                np.bitwise_or(packed, bitset, out=packed)
+        return np.unpackbits(packed, count=self.size).view(bool)
+
+    def count(self, provider_id: int) -> int:
+        bitset = self._bitsets.get(provider_id)
+        return 0 if bitset is None else int(np.unpackbits(bitset, count=self.size).sum())
+
+
+class OttAvailabilityIndex:
+    """
+    추천 행렬 인덱스에 맞춘 OTT 비트셋을 보관하고 TTL/무효화 시 다시 만든다.
+    movie_ott_map을 바꾼 뒤에는 invalidate()를 호출할 것.
+    """
+
+    def __init__(self, ttl: float = OTT_AVAILABILITY_TTL) -> None:
+        self.ttl = ttl
+        # (기준 행렬, 비트셋) 쌍을 한 번에 교체해 행 순서가 어긋나지 않게 함
+        self._state: Optional[Tuple["TagGenomeIndex", OttAvailabilityBitsets]] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    def _is_stale(self, index: "TagGenomeIndex") -> bool:
+        state = self._state
+        if self._loaded_at is None or state is None or state[0] is not index:
+            return True
+        return time.monotonic() - self._loaded_at >= self.ttl
+
+    def get(self, db: Session, index: "TagGenomeIndex") -> OttAvailabilityBitsets:
+        state = self._state
+        if self._is_stale(index):
+            with self._lock:
+                state = self._state
+                if self._is_stale(index):
+                    state = (index, OttAvailabilityBitsets.build(db, index))
+                    self._state = state
+                    self._loaded_at = time.monotonic()
+        assert state is not None
+        return state[1]
+
+
+# 프로세스 단위 공용 인덱스
+ott_availability = OttAvailabilityIndex()
+
+
+def invalidate_ott_availability() -> None:
+    """movie_ott_map 변경 후 호출 (다음 요청에서 비트셋 재생성)"""
+    ott_availability.invalidate()
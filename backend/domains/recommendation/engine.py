@@ -0,0 +1,318 @@
+# backend/domains/recommendation/engine.py
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.domains.movie.models import Movie
+
+from .availability import ott_availability
+
+logger = logging.getLogger(__name__)
+
+GenomePayload = Union[Mapping[str, float], Sequence[float], Sequence[Mapping[str, object]]]
+
+GENOME_ENGINE_TTL = 3600  # 메모리 행렬 갱신 주기 (초 단위)
+
+
+# ========================================
+# tag_genome JSON 파싱
+# ========================================
+def _genome_items(genome: GenomePayload) -> Dict[Union[str, int], float]:
+    """
+    tag_genome 값을 {태그: relevance} 형태로 통일.
+
+    - {"tag": relevance, ...}
+    - [relevance, ...]                     (위치 = 태그 번호)
+    - [{"tag": ..., "relevance": ...}, ...]
+    """
+    if isinstance(genome, Mapping):
+        return {str(tag): float(score) for tag, score in genome.items()}
+
+    items: Dict[Union[str, int], float] = {}
+    for i, entry in enumerate(genome):
+        if isinstance(entry, Mapping):
+            tag = entry.get("tag", entry.get("tag_id", i))
+            items[str(tag)] = float(entry.get("relevance", entry.get("score", 0.0)))  # type: ignore[arg-type]
+        else:
+            items[i] = float(entry)
+    return items
+
+
+def l2_normalize(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (영벡터는 그대로 0)"""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+# ========================================
+# tag genome 행렬
+# ========================================
+class TagGenomeIndex:
+    """
+    전체 영화의 tag genome을 하나의 (영화 수 x 태그 수) float32 행렬로 보관.
+
+    - 각 행은 L2 정규화되어 있어 내적 = 코사인 유사도
+    - movie_ids[row]로 행 번호 -> movie_id 변환
+    """
+
+    def __init__(self, movie_ids: np.ndarray, matrix: np.ndarray, tags: Sequence[str]) -> None:
+        self.movie_ids = np.ascontiguousarray(movie_ids, dtype=np.int32)
+        self.matrix = matrix
+        self.tags = tuple(tags)
+        self._row_of = {int(movie_id): row for row, movie_id in enumerate(self.movie_ids)}
+
+    def __len__(self) -> int:
+        return len(self.movie_ids)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, GenomePayload]]) -> "TagGenomeIndex":
+        parsed: List[Tuple[int, Dict[Union[str, int], float]]] = [
+            (movie_id, _genome_items(genome)) for movie_id, genome in rows if genome
+        ]
+
+        vocab = sorted({tag for _, items in parsed for tag in items}, key=str)
+        column_of = {tag: col for col, tag in enumerate(vocab)}
+
+        matrix = np.zeros((len(parsed), len(vocab)), dtype=np.float32)
+        for row, (_, items) in enumerate(parsed):
+            cols = [column_of[tag] for tag in items]
+            matrix[row, cols] = list(items.values())
+
+        movie_ids = np.fromiter((movie_id for movie_id, _ in parsed), dtype=np.int32, count=len(parsed))
+        return cls(movie_ids, l2_normalize(matrix), [str(tag) for tag in vocab])
+
+    @classmethod
+    def load(cls, db: Session) -> "TagGenomeIndex":
+        """movies.tag_genome 전체를 스트리밍으로 읽어 행렬 생성"""
+        result = db.execute(
+            select(Movie.movie_id, Movie.tag_genome)
+            .where(Movie.tag_genome.is_not(None))
+            .order_by(Movie.movie_id)
+            .execution_options(yield_per=2000)
+        )
+        return cls.from_rows(result)
+
+    # -----------------------------
+    # 조회
+    # -----------------------------
+    def rows_for(self, movie_ids: Iterable[int]) -> np.ndarray:
+        """movie_id 목록 -> 행 번호 배열 (genome이 없는 영화는 제외)"""
+        rows = [self._row_of[m] for m in movie_ids if m in self._row_of]
+        return np.asarray(rows, dtype=np.int64)
+
+    def taste_vector(self, movie_ids: Iterable[int]) -> Optional[np.ndarray]:
+        """선택한 영화들의 평균 벡터 (정규화). 선택한 영화에 genome이 없으면 None"""
+        rows = self.rows_for(movie_ids)
+        if rows.size == 0:
+            return None
+        return l2_normalize(self.matrix[rows].mean(axis=0))
+
+    def top_k(
+        self,
+        query: np.ndarray,
+        k: int,
+        exclude_rows: Optional[np.ndarray] = None,
+        mask: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        query와 코사인 유사도가 높은 상위 k개 (행 번호, 점수) 반환.
+
+        - exclude_rows: 결과에서 뺄 행 (이미 본 영화 등)
+        - mask: bool 배열, False인 행은 후보에서 제외
+        """
+        scores = self.matrix @ query.astype(np.float32, copy=False)
+        return _select_top_k(scores, k, exclude_rows, mask)
+
+    def top_k_batch(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """여러 query를 행렬곱 한 번으로 처리. 반환: (query 수 x k) 행 번호/점수"""
+        scores = queries.astype(np.float32, copy=False) @ self.matrix.T
+        k = min(k, scores.shape[1])
+        if k <= 0:
+            empty = np.empty((len(queries), 0))
+            return empty.astype(np.int64), empty.astype(np.float32)
+
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        part_scores = np.take_along_axis(scores, part, axis=1)
+        order = np.argsort(-part_scores, axis=1)
+        return np.take_along_axis(part, order, axis=1), np.take_along_axis(part_scores, order, axis=1)
+
+
+def _select_top_k(
+    scores: np.ndarray,
+    k: int,
+    exclude_rows: Optional[np.ndarray] = None,
+    mask: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    if mask is not None:
+        scores = np.where(mask, scores, -np.inf)
+    elif exclude_rows is not None and exclude_rows.size:
+        scores = scores.copy()
+    if exclude_rows is not None and exclude_rows.size:
+        scores[exclude_rows] = -np.inf
+
+    candidates = int(np.count_nonzero(np.isfinite(scores)))
+    k = min(k, candidates)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    # 전체 정렬 대신 argpartition으로 상위 k개만 뽑고, 그 안에서만 정렬
+    part = np.argpartition(-scores, k - 1)[:k]
+    order = np.argsort(-scores[part])
+    rows = part[order]
+    return rows, scores[rows]
+
+
+# ========================================
+# 프로세스 단위 엔진 (지연 로딩 + TTL 갱신)
+# ========================================
+@dataclass(frozen=True)
+class _EngineState:
+    """한 번에 같이 만든 genome 행렬 + IVF 인덱스 (참조 교체로 통째로 바뀜)"""
+
+    index: TagGenomeIndex
+    ann: Optional[Any]  # IVFIndex (genome 빌드에 ivf.npz가 있을 때만), index.matrix 행 번호 기준
+    loaded_at: float
+
+
+class RecommendationEngine:
+    """
+    TagGenomeIndex를 한 번 만들어 두고 TTL마다 다시 읽는 래퍼.
+
+    index와 ann은 서로의 행 번호에 의존하므로 _EngineState 하나로 묶어 한 번에 교체하고,
+    읽는 쪽은 _state 참조를 한 번만 가져와 그 안의 두 값을 같이 쓴다.
+    """
+
+    def __init__(self, ttl: float = GENOME_ENGINE_TTL) -> None:
+        self.ttl = ttl
+        self._state: Optional[_EngineState] = None
+        self._invalidated = False
+        self._lock = threading.Lock()
+
+    def _is_stale(self, state: Optional[_EngineState]) -> bool:
+        if state is None or self._invalidated:
+            return True
+        return time.monotonic() - state.loaded_at >= self.ttl
+
+    def is_stale(self) -> bool:
+        return self._is_stale(self._state)
+
+    def invalidate(self) -> None:
+        self._invalidated = True
+
+    def _build(self, db: Session) -> _EngineState:
+        # 빌드된 저장소가 있으면 mmap으로 열고(워커 간 공유), 없으면 DB에서 직접 생성
+        from .ann import ANN_INDEX_FILE, IVFIndex
+        from .genome_store import GENOME_STORE_DIR, open_genome_store
+
+        if GENOME_STORE_DIR:
+            store = open_genome_store(GENOME_STORE_DIR)
+            if store is not None:
+                ann = None
+                ann_path = os.path.join(store.path, ANN_INDEX_FILE)
+                if os.path.exists(ann_path):
+                    ann = IVFIndex.load(ann_path)
+                else:
+                    logger.warning(
+                        "genome build has no IVF index, similar movies use exact search: %s "
+                        "(python -m backend.domains.recommendation.ann build)",
+                        store.path,
+                    )
+                return _EngineState(store.to_index(), ann, time.monotonic())
+        return _EngineState(TagGenomeIndex.load(db), None, time.monotonic())
+
+    def _get_state(self, db: Session) -> _EngineState:
+        """
+        첫 로드만 다른 요청이 기다리고, 그 뒤로는 한 요청이 다시 읽는 동안
+        나머지 요청은 기존 state를 그대로 사용 (TTL 만료 시 전체 요청이 락에 몰리지 않도록)
+        """
+        state = self._state
+        if not self._is_stale(state):
+            assert state is not None
+            return state
+
+        if state is None:
+            with self._lock:
+                if self._state is None:
+                    self._invalidated = False
+                    self._state = self._build(db)
+                return self._state
+
+        if not self._lock.acquire(blocking=False):
+            return state  # 다른 요청이 이미 다시 읽는 중
+        try:
+            if not self._is_stale(self._state):
+                return self._state  # type: ignore[return-value]
+            self._invalidated = False
+            try:
+                self._state = self._build(db)
+            except Exception:
+                # 다시 읽기 실패 시 기존 state로 계속 응답하고 다음 요청에서 재시도
+                self._invalidated = True
+                logger.exception("recommendation engine refresh failed, serving previous index")
+            return self._state  # type: ignore[return-value]
+        finally:
+            self._lock.release()
+
+    def get_index(self, db: Session) -> TagGenomeIndex:
+        return self._get_state(db).index
+
+    def recommend(
+        self,
+        db: Session,
+        liked_movie_ids: Sequence[int],
+        k: int,
+        provider_ids: Optional[Sequence[int]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        선택한 영화들로 취향 벡터를 만들고 (movie_id, 유사도) 상위 k개 반환.
+        provider_ids를 주면 해당 OTT 중 하나에서라도 볼 수 있는 영화만 후보로 둔다.
+        """
+        index = self.get_index(db)
+        query = index.taste_vector(liked_movie_ids)
+        if query is None:
+            return []
+
+        mask = None
+        if provider_ids:
+            mask = ott_availability.get(db, index).mask_for(provider_ids)
+
+        rows, scores = index.top_k(query, k, exclude_rows=index.rows_for(liked_movie_ids), mask=mask)
+        return [(int(index.movie_ids[r]), float(s)) for r, s in zip(rows, scores)]
+
+    def similar_movies(self, db: Session, movie_id: int, k: int) -> List[Tuple[int, float]]:
+        """
+        movie_id와 비슷한 영화 (movie_id, 유사도) 상위 k개.
+        IVF 인덱스가 있으면 근사 검색, 없으면 전체 탐색.
+        """
+        state = self._get_state(db)
+        index, ann = state.index, state.ann
+        rows = index.rows_for([movie_id])
+        if rows.size == 0:
+            return []
+
+        query = np.asarray(index.matrix[rows[0]], dtype=np.float32)
+        if ann is not None:
+            found, scores = ann.search(index.matrix, query, k + 1)
+        else:
+            found, scores = index.top_k(query, k + 1)
+
+        return [
+            (int(index.movie_ids[r]), float(s))
+            for r, s in zip(found, scores)
+            if r != rows[0]
+        ][:k]
+
+
+# 프로세스 단위 공용 엔진
+recommendation_engine = RecommendationEngine()
@@ -0,0 +1,305 @@
+# backend/domains/recommendation/genome_store.py
+"""
+tag genome 행렬을 디스크에 .npy로 내보내고 워커들이 mmap으로 공유하는 저장소.
+
+디렉터리 구조:
+    <store>/CURRENT                 현재 빌드 이름 (원자적으로 교체)
+    <store>/<build>/matrix.npy      float32 (영화 수 x 태그 수), 행 단위 L2 정규화
+    <store>/<build>/movie_ids.npy   int32, 행 번호 -> movie_id
+    <store>/<build>/digests.npy     S32, 행별 md5(tag_genome::text) (증분 빌드용)
+    <store>/<build>/meta.json       태그 목록, 빌드 시각 등
+    <store>/<build>/ivf.npz         (선택) IVF 인덱스. 이전 빌드에 있었으면 새 빌드에도 다시 만듦
+
+실행:
+    python -m backend.domains.recommendation.genome_store --out data/genome [--full]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.orm import Session
+
+from backend.domains.movie.models import Movie
+
+from .engine import TagGenomeIndex, _genome_items, l2_normalize
+
+GENOME_STORE_DIR = os.getenv("GENOME_STORE_DIR", "")
+_CURRENT = "CURRENT"
+_FETCH_CHUNK = 1000
+_COPY_CHUNK = 4096
+_KEEP_BUILDS = 2  # 읽고 있는 워커가 있을 수 있으므로 직전 빌드까지 남겨둠
+
+
+@dataclass
+class GenomeStore:
+    """mmap으로 연 빌드 하나"""
+
+    path: str
+    movie_ids: np.ndarray
+    matrix: np.ndarray
+    digests: np.ndarray
+    tags: Tuple[str, ...]
+
+    def to_index(self) -> TagGenomeIndex:
+        return TagGenomeIndex(self.movie_ids, self.matrix, self.tags)
+
+
+# ========================================
+# 읽기
+# ========================================
+def current_build_path(store_dir: str) -> Optional[str]:
+    try:
+        with open(os.path.join(store_dir, _CURRENT), encoding="utf-8") as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return os.path.join(store_dir, name) if name else None
+
+
+def open_genome_store(store_dir: str) -> Optional[GenomeStore]:
+    """현재 빌드를 mmap으로 연다 (행렬은 페이지 캐시를 통해 워커 간 공유)"""
+    path = current_build_path(store_dir)
+    if path is None:
+        return None
+
+    with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+
+    return GenomeStore(
+        path=path,
+        movie_ids=np.load(os.path.join(path, "movie_ids.npy")),
+        matrix=np.load(os.path.join(path, "matrix.npy"), mmap_mode="r"),
+        digests=np.load(os.path.join(path, "digests.npy")),
+        tags=tuple(meta["tags"]),
+    )
+
+
+# ========================================
+# 빌드
+# ========================================
+def _current_digests(db: Session) -> Tuple[np.ndarray, np.ndarray]:
+    """DB의 (movie_id, md5(tag_genome)) 전체. genome 본문은 읽지 않음"""
+    rows = db.execute(
+        select(Movie.movie_id, func.md5(cast(Movie.tag_genome, Text)))
+        .where(Movie.tag_genome.is_not(None))
+        .order_by(Movie.movie_id)
+    ).all()
+    movie_ids = np.fromiter((r[0] for r in rows), dtype=np.int32, count=len(rows))
+    digests = np.array([r[1] for r in rows], dtype="S32")
+    return movie_ids, digests
+
+
+def _iter_genomes(db: Session, movie_ids: Optional[Sequence[int]]) -> Iterator[Tuple[int, object]]:
+    """movie_ids가 None이면 전체를 스트리밍, 아니면 해당 영화만 청크 단위로 조회"""
+    if movie_ids is None:
+        yield from db.execute(
+            select(Movie.movie_id, Movie.tag_genome)
+            .where(Movie.tag_genome.is_not(None))
+            .order_by(Movie.movie_id)
+            .execution_options(yield_per=_FETCH_CHUNK)
+        )
+        return
+
+    for start in range(0, len(movie_ids), _FETCH_CHUNK):
+        chunk = [int(m) for m in movie_ids[start : start + _FETCH_CHUNK]]
+        yield from db.execute(
+            select(Movie.movie_id, Movie.tag_genome).where(Movie.movie_id.in_(chunk))
+        )
+
+
+def _scan_vocab(rows: Iterable[Tuple[int, object]]) -> List[str]:
+    vocab = set()
+    for _, genome in rows:
+        if genome:
+            vocab.update(str(tag) for tag in _genome_items(genome))
+    return sorted(vocab)
+
+
+def _genome_vector(genome: object, column_of: Dict[str, int], dim: int) -> np.ndarray:
+    vec = np.zeros(dim, dtype=np.float32)
+    for tag, score in _genome_items(genome).items():  # type: ignore[arg-type]
+        vec[column_of[str(tag)]] = score
+    return l2_normalize(vec)
+
+
+def build_genome_store(db: Session, store_dir: str, full: bool = False) -> Dict[str, Union[int, str]]:
+    """
+    DB의 tag genome을 새 빌드 디렉터리에 기록하고 CURRENT를 교체.
+
+    - 이전 빌드가 있고 태그 목록이 그대로면: md5가 바뀐/새로 생긴 영화만 DB에서 읽고
+      나머지 행은 이전 행렬에서 복사 (증분 빌드)
+    - 새 태그가 생겼거나 full=True면 전체 재빌드 (DB를 두 번 스트리밍, 메모리 사용량 일정)
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    movie_ids, digests = _current_digests(db)
+
+    current = open_genome_store(store_dir)
+    previous = None if full else current
+    if previous is not None and len(previous.movie_ids) == 0:
+        previous = None
+    changed_ids: Optional[np.ndarray] = None  # None = 전체
+    old_rows = np.full(len(movie_ids), -1, dtype=np.int64)
+    tags: List[str]
+
+    if previous is not None:
+        # 이전 빌드에서 같은 movie_id의 행 번호 찾기 (movie_ids는 정렬되어 있음)
+        pos = np.searchsorted(previous.movie_ids, movie_ids)
+        pos_clipped = np.minimum(pos, len(previous.movie_ids) - 1)
+        found = previous.movie_ids[pos_clipped] == movie_ids
+        same = found & (previous.digests[pos_clipped] == digests)
+        old_rows[same] = pos_clipped[same]
+        changed_ids = movie_ids[~same]
+
+        changed_vocab = _scan_vocab(_iter_genomes(db, changed_ids))
+        if set(changed_vocab) <= set(previous.tags):
+            tags = list(previous.tags)
+        else:
+            previous, changed_ids = None, None
+            old_rows[:] = -1
+
+    if previous is None:
+        tags = _scan_vocab(_iter_genomes(db, None))
+
+    column_of = {tag: col for col, tag in enumerate(tags)}
+    row_of = {int(m): row for row, m in enumerate(movie_ids)}
+
+    # UTC 기준 (서머타임 전환에도 이름이 뒤로 가지 않도록)
+    build_name = time.strftime("%Y%m%d%H%M%S", time.gmtime()) + f"-{os.getpid()}"
+    build_path = os.path.join(store_dir, build_name)
+    os.makedirs(build_path)
+
+    matrix = np.lib.format.open_memmap(
+        os.path.join(build_path, "matrix.npy"),
+        mode="w+",
+        dtype=np.float32,
+        shape=(len(movie_ids), len(tags)),
+    )
+
+    # 바뀌지 않은 행: 이전 행렬에서 청크 단위로 복사
+    reused = np.flatnonzero(old_rows >= 0)
+    for start in range(0, len(reused), _COPY_CHUNK):
+        dst = reused[start : start + _COPY_CHUNK]
+        matrix[dst] = previous.matrix[old_rows[dst]]  # type: ignore[union-attr]
+
+    # 바뀐 행: DB에서 읽어 다시 계산
+    rebuilt = 0
+    for movie_id, genome in _iter_genomes(db, changed_ids):
+        row = row_of.get(int(movie_id))
+        if row is None or not genome:
+            continue
+        matrix[row] = _genome_vector(genome, column_of, len(tags))
+        rebuilt += 1
+
+    matrix.flush()
+
+    # IVF 인덱스는 행 번호 기준이라 그대로 복사할 수 없음 -> 새 행렬로 다시 만듦
+    ann_rebuilt = _rebuild_ann(current, build_path, matrix, tags)
+    del matrix
+
+    np.save(os.path.join(build_path, "movie_ids.npy"), movie_ids)
+    np.save(os.path.join(build_path, "digests.npy"), digests)
+    with open(os.path.join(build_path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "tags": tags,
+                "count": int(len(movie_ids)),
+                "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "incremental": previous is not None,
+            },
+            f,
+            ensure_ascii=False,
+        )
+
+    # CURRENT 교체 (rename은 원자적이라 읽는 쪽은 항상 완성된 빌드만 봄)
+    tmp = os.path.join(store_dir, _CURRENT + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(build_name)
+    os.replace(tmp, os.path.join(store_dir, _CURRENT))
+
+    _prune_builds(store_dir, keep=_KEEP_BUILDS)
+
+    return {
+        "build": build_name,
+        "movies": int(len(movie_ids)),
+        "tags": len(tags),
+        "rebuilt": rebuilt,
+        "reused": int(len(reused)),
+        "ann": ann_rebuilt,
+    }
+
+
+def _rebuild_ann(current: Optional[GenomeStore], build_path: str, matrix: np.ndarray, tags: List[str]) -> str:
+    """
+    현재 빌드에 ivf.npz가 있으면 새 빌드에도 만든다.
+    태그 목록이 같으면 중심점을 재사용해 행만 다시 배정하고, 바뀌었으면 같은 nlist로 재학습.
+    반환: "reassigned" | "retrained" | "none"
+    """
+    from .ann import ANN_INDEX_FILE, IVFIndex
+
+    if current is None or len(matrix) == 0:
+        return "none"
+    old_path = os.path.join(current.path, ANN_INDEX_FILE)
+    if not os.path.exists(old_path):
+        return "none"
+
+    old = IVFIndex.load(old_path)
+    if tuple(tags) == current.tags:
+        ann = IVFIndex.from_centroids(matrix, old.centroids, nprobe=old.nprobe)
+        mode = "reassigned"
+    else:
+        ann = IVFIndex.train(matrix, nlist=old.nlist, nprobe=old.nprobe)
+        mode = "retrained"
+    ann.save(os.path.join(build_path, ANN_INDEX_FILE))
+    return mode
+
+
+def _prune_builds(store_dir: str, keep: int) -> None:
+    """
+    최근 keep개 빌드만 남김. CURRENT가 가리키는 빌드는 항상 유지하고,
+    나머지는 이름이 아니라 수정 시각 순으로 정렬 (같은 초의 pid 순서 / 시계 변경에 영향받지 않도록)
+    """
+    current = current_build_path(store_dir)
+    current_name = os.path.basename(current) if current else None
+
+    builds = []
+    for name in os.listdir(store_dir):
+        path = os.path.join(store_dir, name)
+        if name == current_name or not os.path.isdir(path):
+            continue
+        builds.append((os.stat(path).st_mtime, name))
+    builds.sort()
+
+    # CURRENT가 keep개 중 하나를 차지
+    remaining = max(keep - (1 if current_name else 0), 0)
+    stale = builds[:-remaining] if remaining else builds
+    for _, name in stale:
+        shutil.rmtree(os.path.join(store_dir, name), ignore_errors=True)
+
+
+def main() -> None:
+    from backend.core.db import get_sessionmaker
+
+    parser = argparse.ArgumentParser(description="tag genome 행렬 빌드")
+    parser.add_argument("--out", default=GENOME_STORE_DIR or "data/genome")
+    parser.add_argument("--full", action="store_true", help="증분 대신 전체 재빌드")
+    args = parser.parse_args()
+
+    db = get_sessionmaker()()
+    try:
+        summary = build_genome_store(db, args.out, full=args.full)
+    finally:
+        db.close()
+    print(json.dumps(summary, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
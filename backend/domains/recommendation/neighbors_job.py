@@ -0,0 +1,250 @@
+# backend/domains/recommendation/neighbors_job.py
+"""
+영화별 유사 영화 상위 N개를 계산해 movie_neighbors 테이블에 적재하는 배치 작업.
+
+- genome 빌드(genome_store)를 워커 프로세스마다 mmap으로 열어 청크 단위로 행렬곱
+- 청크 결과는 메인 프로세스에서 DELETE + COPY로 청크마다 한 트랜잭션에 기록
+- 끝난 청크는 <build>/neighbors.progress.json에 남겨 중단 후 다시 실행하면 이어서 진행
+- 모든 청크가 끝나면 빌드에서 빠진 영화의 이웃 행을 삭제
+
+실행:
+    python -m backend.domains.recommendation.neighbors_job --store data/genome [--top-n 50] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+
+from .genome_store import GENOME_STORE_DIR, open_genome_store
+
+logger = logging.getLogger(__name__)
+
+_PROGRESS_FILE = "neighbors.progress.json"
+DEFAULT_TOP_N = 50
+DEFAULT_CHUNK = 256  # 청크 하나 = (chunk x 전체 영화) float32 점수 행렬
+
+
+# ========================================
+# 워커 프로세스
+# ========================================
+_worker_store: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _load_build(build_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    # 워커마다 한 번만 열고 재사용 (mmap이라 메모리는 페이지 캐시로 공유)
+    if build_path not in _worker_store:
+        _worker_store[build_path] = (
+            np.load(os.path.join(build_path, "movie_ids.npy")),
+            np.load(os.path.join(build_path, "matrix.npy"), mmap_mode="r"),
+        )
+    return _worker_store[build_path]
+
+
+def _compute_chunk(
+    build_path: str, chunk: int, start: int, end: int, top_n: int
+) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """[start, end) 행의 상위 top_n 이웃 (자기 자신 제외)"""
+    movie_ids, matrix = _load_build(build_path)
+    block = np.asarray(matrix[start:end], dtype=np.float32)
+    scores = block @ np.asarray(matrix, dtype=np.float32).T
+    scores[np.arange(end - start), np.arange(start, end)] = -np.inf
+
+    k = min(top_n, scores.shape[1] - 1)
+    if k <= 0:
+        empty = np.empty((end - start, 0))
+        return chunk, movie_ids[start:end], empty.astype(np.int32), empty.astype(np.float32)
+
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    part_scores = np.take_along_axis(scores, part, axis=1)
+    order = np.argsort(-part_scores, axis=1)
+    rows = np.take_along_axis(part, order, axis=1)
+    return (
+        chunk,
+        movie_ids[start:end],
+        movie_ids[rows],
+        np.take_along_axis(part_scores, order, axis=1),
+    )
+
+
+# ========================================
+# 진행 상황 (재시작용)
+# ========================================
+def _load_progress(build_path: str, top_n: int, chunk_size: int) -> Set[int]:
+    path = os.path.join(build_path, _PROGRESS_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return set()
+    if data.get("top_n") != top_n or data.get("chunk_size") != chunk_size:
+        return set()  # 설정이 바뀌면 처음부터
+    return set(data.get("done", []))
+
+
+def _save_progress(build_path: str, top_n: int, chunk_size: int, done: Set[int]) -> None:
+    path = os.path.join(build_path, _PROGRESS_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"top_n": top_n, "chunk_size": chunk_size, "done": sorted(done)}, f)
+    os.replace(tmp, path)
+
+
+# ========================================
+# 적재 (DELETE + COPY)
+# ========================================
+def _write_chunk(raw_conn, movie_ids: np.ndarray, neighbors: np.ndarray, scores: np.ndarray) -> None:
+    buf = io.StringIO()
+    for movie_id, nbrs, scs in zip(movie_ids, neighbors, scores):
+        for rank, (nbr, score) in enumerate(zip(nbrs, scs), start=1):
+            if np.isfinite(score):
+                buf.write(f"{movie_id}\t{rank}\t{nbr}\t{score:.6f}\n")
+    buf.seek(0)
+
+    cur = raw_conn.cursor()
+    try:
+        cur.execute(
+            "DELETE FROM movie_neighbors WHERE movie_id = ANY(%s)",
+            ([int(m) for m in movie_ids],),
+        )
+        cur.copy_expert(
+            "COPY movie_neighbors (movie_id, rank, neighbor_movie_id, score) FROM STDIN",
+            buf,
+        )
+        raw_conn.commit()
+    except BaseException:
+        raw_conn.rollback()
+        raise
+    finally:
+        cur.close()
+
+
+def _delete_stale(raw_conn, movie_ids: np.ndarray) -> int:
+    """빌드에 없는 영화(삭제/genome 제외)의 이웃 행 삭제 -> 지난 계산 결과가 계속 서비스되지 않도록"""
+    cur = raw_conn.cursor()
+    try:
+        cur.execute(
+            "DELETE FROM movie_neighbors WHERE NOT (movie_id = ANY(%s))",
+            ([int(m) for m in movie_ids],),
+        )
+        deleted = cur.rowcount
+        raw_conn.commit()
+    except BaseException:
+        raw_conn.rollback()
+        raise
+    finally:
+        cur.close()
+    return deleted
+
+
+def run_neighbors_job(
+    store_dir: str,
+    top_n: int = DEFAULT_TOP_N,
+    chunk_size: int = DEFAULT_CHUNK,
+    workers: Optional[int] = None,
+) -> Dict[str, int]:
+    from backend.core.db import get_engine
+
+    store = open_genome_store(store_dir)
+    if store is None:
+        raise RuntimeError(f"genome 빌드가 없습니다: {store_dir}")
+
+    total_rows = len(store.movie_ids)
+    chunks = [(i, s, min(s + chunk_size, total_rows)) for i, s in enumerate(range(0, total_rows, chunk_size))]
+    done = _load_progress(store.path, top_n, chunk_size)
+    pending = [c for c in chunks if c[0] not in done]
+
+    logger.info(
+        "[neighbors] build=%s movies=%d chunks=%d done=%d remaining=%d",
+        os.path.basename(store.path), total_rows, len(chunks), len(done), len(pending),
+    )
+
+    workers = workers or os.cpu_count() or 1
+    started = time.monotonic()
+    finished = 0
+    deleted = 0
+    raw_conn = None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            queue = iter(pending)
+            inflight: Set[Future] = set()
+
+            def submit_next() -> None:
+                item = next(queue, None)
+                if item is not None:
+                    inflight.add(executor.submit(_compute_chunk, store.path, *item, top_n))
+
+            # 결과 행렬이 메모리에 쌓이지 않도록 워커 수의 2배까지만 미리 제출
+            for _ in range(workers * 2):
+                submit_next()
+
+            # 워커 프로세스가 뜬 뒤에 연결 (fork된 워커에 DB 소켓이 복제되지 않게)
+            raw_conn = get_engine().raw_connection()
+
+            while inflight:
+                completed, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    inflight.discard(future)
+                    chunk, movie_ids, neighbors, scores = future.result()
+                    _write_chunk(raw_conn, movie_ids, neighbors, scores)
+
+                    done.add(chunk)
+                    _save_progress(store.path, top_n, chunk_size, done)
+                    finished += 1
+
+                    elapsed = time.monotonic() - started
+                    eta = elapsed / finished * (len(pending) - finished)
+                    logger.info(
+                        "[neighbors] %d/%d chunks (%.1f%%) elapsed=%.1fs eta=%.1fs",
+                        len(done), len(chunks), len(done) / len(chunks) * 100, elapsed, eta,
+                    )
+                    submit_next()
+
+        if len(done) == len(chunks):
+            deleted = _delete_stale(raw_conn, store.movie_ids)
+            if deleted:
+                logger.info("[neighbors] deleted stale rows=%d", deleted)
+    finally:
+        if raw_conn is not None:
+            raw_conn.close()
+
+    return {"chunks": len(chunks), "written": finished, "movies": total_rows, "deleted": deleted}
+
+
+def main() -> None:
+    from backend.core.log import setup_logging, shutdown_logging
+    from backend.utils.http_cache import invalidate as invalidate_http_cache
+
+    parser = argparse.ArgumentParser(description="movie_neighbors 배치 계산")
+    parser.add_argument("--store", default=GENOME_STORE_DIR or "data/genome")
+    parser.add_argument("--top-n", type=int, default=DEFAULT_TOP_N)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--restart", action="store_true", help="진행 기록을 지우고 처음부터")
+    args = parser.parse_args()
+
+    if args.restart:
+        store = open_genome_store(args.store)
+        if store is not None:
+            _save_progress(store.path, args.top_n, args.chunk_size, set())
+
+    setup_logging()
+    try:
+        summary = run_neighbors_job(args.store, args.top_n, args.chunk_size, args.workers)
+        invalidate_http_cache("recommendations:similar")
+        print(json.dumps(summary))
+    finally:
+        # 캐시 무효화가 남기는 경고까지 쓴 뒤에 종료
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
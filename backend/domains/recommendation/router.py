@@ -0,0 +1,49 @@
+# backend/domains/recommendation/router.py
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from backend.core.db import get_db
+from backend.domains.auth.cache import UserPrincipal
+from backend.domains.auth.utils import get_current_user
+from backend.utils.http_cache import cache_response
+
+from . import service
+from .schema import RecommendationsResponse
+
+router = APIRouter(tags=["recommendation"])
+
+
+# =========================
+# REC-01-01 취향 기반 추천
+# =========================
+@router.get(
+    "/recommendations",
+    response_model=RecommendationsResponse,
+    summary="온보딩 설문 응답 기반 영화 추천",
+)
+def get_recommendations(
+    limit: int = Query(20, ge=1, le=100),
+    available_only: bool = Query(True, description="구독 중인 OTT에서 볼 수 있는 영화만"),
+    db: Session = Depends(get_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> RecommendationsResponse:
+    """설문에서 고른 영화들의 tag genome 평균과 코사인 유사도가 높은 순"""
+    return service.recommend_for_user(db, current_user, limit, available_only)
+
+
+# =========================
+# REC-02-01 비슷한 영화
+# =========================
+@router.get(
+    "/recommendations/similar/{movie_id}",
+    response_model=RecommendationsResponse,
+    summary="tag genome 기준 비슷한 영화 조회",
+)
+@cache_response(ttl=3600, namespace="recommendations:similar")
+def get_similar_movies(
+    movie_id: int,
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+) -> RecommendationsResponse:
+    return service.similar_movies(db, movie_id, limit)
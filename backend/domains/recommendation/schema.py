@@ -0,0 +1,18 @@
+# backend/domains/recommendation/schema.py
+
+from typing import List
+
+from pydantic import BaseModel
+
+
+# =========================
+# REC-01-01 취향 기반 추천
+# =========================
+class RecommendedMovieItem(BaseModel):  # 추천 영화 한 개
+    movie_id: int
+    title: str
+    score: float  # 취향 벡터와의 코사인 유사도
+
+
+class RecommendationsResponse(BaseModel):  # 추천 영화 목록
+    movies: List[RecommendedMovieItem]
@@ -0,0 +1,89 @@
+# backend/domains/recommendation/service.py
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.domains.auth.cache import UserPrincipal
+from backend.domains.movie.models import Movie, MovieNeighbor
+from backend.domains.user.models import UserOnboardingAnswer, UserOttMap
+
+from .engine import recommendation_engine
+from .schema import RecommendationsResponse, RecommendedMovieItem
+
+
+def _movie_titles(db: Session, movie_ids: List[int]) -> Dict[int, str]:
+    if not movie_ids:
+        return {}
+    rows = db.execute(
+        select(Movie.movie_id, Movie.title).where(Movie.movie_id.in_(movie_ids))
+    ).all()
+    return {movie_id: title for movie_id, title in rows}
+
+
+def _to_response(db: Session, scored: List[Tuple[int, float]]) -> RecommendationsResponse:
+    # 제목은 상위 k개만 한 번에 조회하고, 점수 순서를 그대로 유지
+    titles = _movie_titles(db, [movie_id for movie_id, _ in scored])
+    return RecommendationsResponse(
+        movies=[
+            RecommendedMovieItem(movie_id=movie_id, title=titles[movie_id], score=score)
+            for movie_id, score in scored
+            if movie_id in titles
+        ]
+    )
+
+
+# ========================================
+# REC-01-01 온보딩 응답 기반 추천
+# ========================================
+def recommend_for_user(
+    db: Session, user: UserPrincipal, limit: int, available_only: bool = True
+) -> RecommendationsResponse:  # 설문에서 고른 영화들과 비슷한 영화 추천
+
+    liked = db.scalars(
+        select(UserOnboardingAnswer.movie_id).where(
+            UserOnboardingAnswer.user_id == user.user_id
+        )
+    ).all()
+
+    # 구독 중인 OTT에서 볼 수 있는 영화만 (구독 정보가 없으면 전체)
+    provider_ids = None
+    if available_only:
+        provider_ids = db.scalars(
+            select(UserOttMap.provider_id).where(UserOttMap.user_id == user.user_id)
+        ).all()
+
+    scored = recommendation_engine.recommend(db, liked, limit, provider_ids=provider_ids)
+    return _to_response(db, scored)
+
+
+# ========================================
+# REC-02-01 비슷한 영화
+# ========================================
+def similar_movies(
+    db: Session, movie_id: int, limit: int
+) -> RecommendationsResponse:  # tag genome 기준 "이 영화와 비슷한 영화"
+
+    # 배치로 미리 계산된 이웃이 limit개 이상 있으면 PK 조회 한 번으로 끝
+    # (배치는 영화당 top_n개만 저장하므로, 그보다 큰 limit은 아래 엔진 계산으로)
+    rows = db.execute(
+        select(MovieNeighbor.neighbor_movie_id, Movie.title, MovieNeighbor.score)
+        .join(Movie, Movie.movie_id == MovieNeighbor.neighbor_movie_id)
+        .where(MovieNeighbor.movie_id == movie_id)
+        .order_by(MovieNeighbor.rank)
+        .limit(limit)
+    ).all()
+    if len(rows) >= limit:
+        return RecommendationsResponse(
+            movies=[
+                RecommendedMovieItem(movie_id=neighbor_id, title=title, score=score)
+                for neighbor_id, title, score in rows
+            ]
+        )
+
+    # 아직 계산되지 않은 영화(또는 저장된 이웃보다 많이 요청한 경우)는 인덱스에서 바로 계산
+    scored = recommendation_engine.similar_movies(db, movie_id, limit)
+    return _to_response(db, scored)
@@ -0,0 +1,55 @@
+# backend/domains/registration/limits.py
+"""
+회원가입 엔드포인트 rate limit (이메일당 + IP당).
+
+- 가입 요청: 매번 bcrypt 해싱 + 메일 발송이 일어나므로 재발송 횟수를 제한
+- 코드 검증/확정: 6자리 코드를 무작정 맞춰보지 못하도록 시도 횟수를 제한
+  (verify와 confirm은 같은 한도를 공유)
+- 한도(SIGNUP_*)는 core/config.py Settings에서 읽고, limiter는 첫 요청 때 만든다
+"""
+
+from functools import lru_cache
+
+from fastapi import Request
+
+from backend.utils.rate_limit import RateLimiter, RateLimitRule, client_ip
+
+from .schema import SignupConfirm, SignupRequest
+
+
+# ========================================
+# limiter (첫 요청 때 설정을 읽어 한 번만 생성)
+# ========================================
+@lru_cache
+def get_signup_request_limiter() -> RateLimiter:
+    from backend.core.config import get_settings
+
+    settings = get_settings()
+    return RateLimiter(
+        "signup:request",
+        RateLimitRule("email", settings.signup_request_per_email, settings.signup_rate_window),
+        RateLimitRule("ip", settings.signup_request_per_ip, settings.signup_rate_window),
+    )
+
+
+@lru_cache
+def get_signup_verify_limiter() -> RateLimiter:
+    from backend.core.config import get_settings
+
+    settings = get_settings()
+    return RateLimiter(
+        "signup:verify",
+        RateLimitRule("email", settings.signup_verify_per_email, settings.signup_rate_window),
+        RateLimitRule("ip", settings.signup_verify_per_ip, settings.signup_rate_window),
+    )
+
+
+# ========================================
+# FastAPI 의존성 (라우터 dependencies=[Depends(...)]에 사용)
+# ========================================
+async def limit_signup_request(request: Request, payload: SignupRequest) -> None:
+    await get_signup_request_limiter().check(email=payload.email.lower(), ip=client_ip(request))
+
+
+async def limit_signup_verify(request: Request, payload: SignupConfirm) -> None:
+    await get_signup_verify_limiter().check(email=payload.email.lower(), ip=client_ip(request))
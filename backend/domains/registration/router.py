@@ -3,11 +3,12 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
+from backend.domains.auth.cache import UserPrincipal
 from backend.domains.auth.utils import get_current_user
 from backend.core.db import get_db
-from backend.domains.user.models import User
 
 from . import service
+from .limits import limit_signup_request, limit_signup_verify
 from .schema import (
     OnboardingCompleteResponse,
     OnboardingOTTRequest,
@@ -29,12 +30,15 @@ router = APIRouter(tags=["registration"])
     "/auth/signup/request",
     response_model=SignupRequestResponse,
     summary="회원가입 요청 (인증 메일 발송)",
+    # 한도 초과는 해싱/DB/메일 전에 429로 거절
+    dependencies=[Depends(limit_signup_request)],
 )
-def request_signup(
+async def request_signup(
     payload: SignupRequest,
     db: Session = Depends(get_db),
 ) -> SignupRequestResponse:  # 성공 시, 인증 만료 시간(expires_in)을 함께 반환한다.
-    return service.request_signup(db, payload)
+    # 해싱 대기 중 스레드풀을 잡지 않도록 async (DB/Redis 단계는 서비스에서 스레드풀로 넘김)
+    return await service.request_signup(db, payload)
 
 
 # =========================
@@ -43,6 +47,8 @@ def request_signup(
 @router.post(
     "/auth/signup/verify",
     summary="이메일 인증 코드 검증 (회원가입 전)",
+    # 코드 대입 방지 (verify/confirm이 같은 시도 횟수를 공유)
+    dependencies=[Depends(limit_signup_verify)],
 )
 def verify_signup_code(
     payload: SignupConfirm,
@@ -58,6 +64,8 @@ def verify_signup_code(
     "/auth/signup/confirm",
     response_model=SignupConfirmResponse,
     summary="이메일 인증 코드 확인 및 회원가입 확정",
+    # 코드 대입 방지 (verify/confirm이 같은 시도 횟수를 공유)
+    dependencies=[Depends(limit_signup_verify)],
 )
 def confirm_signup(
     payload: SignupConfirm,
@@ -76,7 +84,7 @@ def confirm_signup(
 def select_ott(
     payload: OnboardingOTTRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> dict:
     service.save_user_ott(db, current_user, payload)
     return {"status": "ok"}
@@ -92,7 +100,7 @@ def select_ott(
 def survey(
     payload: OnboardingSurveyRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> dict:
     service.save_onboarding_answers(db, current_user, payload)
     return {"status": "ok"}
@@ -108,7 +116,7 @@ def survey(
 )
 def complete(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> OnboardingCompleteResponse:
     return service.complete_onboarding(db, current_user)
 
@@ -138,6 +146,6 @@ def get_survey_movies(
 )
 def skip(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> OnboardingCompleteResponse:
     return service.skip_onboarding(db, current_user)
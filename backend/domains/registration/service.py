@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime
+from typing import List, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, func
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from redis.commands.core import Script
 from sqlalchemy.orm import Session
 
+from backend.domains.auth.cache import UserPrincipal, invalidate_principal
 from backend.domains.auth.utils import create_access_token  # JWT 발급 함수
-from backend.domains.movie.models import Movie, OnboardingCandidate
+from backend.domains.ott.snapshot import ott_provider_snapshot
 from backend.domains.user.models import User, UserOnboardingAnswer, UserOttMap
 from .mail import (
     generate_signup_code,
     send_signup_code_email,
 )
-from backend.utils.password import hash_password
+from backend.utils.mailer import MailQueueFull
+from backend.utils.password import PasswordHasherBusy, hash_password_async
 from backend.utils.redis import get_redis_client
+from .survey_pool import survey_candidate_pool
 
 from .schema import (
     OnboardingCompleteResponse,
@@ -30,6 +38,8 @@ from .schema import (
     SurveyMoviesResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 # ========================================
 # 설정 값
 # ========================================
@@ -42,13 +52,92 @@ def _redis_key(email: str) -> str:
     return SIGNUP_REDIS_KEY.format(email=email)
 
 
+# ========================================
+# 회원가입 임시 상태 저장소 (Redis)
+# ========================================
+# 코드 비교 + 데이터 조회 + 삭제를 한 번에 처리 (동시 confirm 요청 중 하나만 성공)
+# 반환값: 0 = 키 없음, 1 = 코드 불일치, 그 외 = {남은 TTL(ms), HGETALL 결과}
+_CONSUME_SIGNUP_LUA = """
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then
+    return 0
+end
+if code ~= ARGV[1] then
+    return 1
+end
+local ttl = redis.call('PTTL', KEYS[1])
+local data = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return {ttl, data}
+"""
+_SIGNUP_STATE_MISSING = 0
+_SIGNUP_CODE_MISMATCH = 1
+
+_consume_script: Optional[Script] = None
+
+
+def _save_signup_state(key: str, mapping: dict, ttl_ms: Optional[int] = None) -> None:
+    """HSET + 만료 설정을 한 번의 왕복(MULTI/EXEC)으로 저장 (ttl_ms가 없으면 SIGNUP_CODE_TTL)"""
+    pipe = get_redis_client().pipeline(transaction=True)
+    pipe.hset(key, mapping=mapping)  # type: ignore[arg-type]
+    if ttl_ms is None:
+        pipe.expire(key, SIGNUP_CODE_TTL)
+    else:
+        pipe.pexpire(key, max(ttl_ms, 1))
+    pipe.execute()
+
+
+def _consume_signup_state(key: str, code: str) -> tuple[dict, Optional[int]]:
+    """
+    코드가 맞으면 저장된 데이터를 꺼내고 키를 삭제 (원자적).
+    반환: (데이터, 삭제 직전 남은 TTL ms — 만료 없음이면 None)
+    """
+    global _consume_script
+    client = get_redis_client()
+    if _consume_script is None:
+        _consume_script = client.register_script(_CONSUME_SIGNUP_LUA)  # EVALSHA로 호출
+    result = _consume_script(keys=[key], args=[code], client=client)
+
+    if result == _SIGNUP_STATE_MISSING:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="인증 정보가 만료되었거나 존재하지 않습니다.",
+        )
+    if result == _SIGNUP_CODE_MISMATCH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="인증 코드가 올바르지 않습니다.",
+        )
+
+    ttl_ms, data = int(result[0]), result[1]
+    return dict(zip(data[::2], data[1::2])), (ttl_ms if ttl_ms > 0 else None)
+
+
 # ========================================
 # REG-01-01 회원가입 요청
 # ========================================
-def request_signup(
+async def request_signup(
     db: Session, payload: SignupRequest
 ) -> SignupRequestResponse:  # 이메일 중복 체크, 인증코드 생성 후 발송까지
+    """
+    async 라우터용. DB/Redis(동기 클라이언트) 단계만 스레드풀에서 돌리고,
+    bcrypt 해싱은 이벤트 루프에서 await 하므로 해싱 중에는 스레드풀 자리를 잡지 않는다.
+    """
+    await run_in_threadpool(_check_signup_available, db, payload)
+
+    # 비밀번호 해싱 (프로세스 풀에서 실행, 대기열이 가득 차면 바로 거절)
+    try:
+        password_hash = await hash_password_async(payload.password)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+        )
 
+    return await run_in_threadpool(_issue_signup_code, payload, password_hash)
+
+
+def _check_signup_available(db: Session, payload: SignupRequest) -> None:
     # 이미 가입된 이메일인지 체크
     email_exists = db.query(User).filter(User.email == payload.email).first()
     if email_exists:
@@ -65,34 +154,34 @@ def request_signup(
             detail="이미 사용 중인 닉네임입니다.",
         )
 
+
+def _issue_signup_code(payload: SignupRequest, password_hash: str) -> SignupRequestResponse:
     # 인증 코드 생성 (6자리 숫자)
     code = generate_signup_code()
 
-    # Redis 저장
-    redis = get_redis_client()
+    # Redis 저장 (값 저장 + TTL 설정을 한 번에)
     key = _redis_key(payload.email)
 
-    print(f"[DEBUG] Saving to Redis key: '{key}'")
-    print(f"[DEBUG] Code to save: '{code}'")
-
-    redis.hset(
+    _save_signup_state(
         key,
-        mapping={  # type: ignore[arg-type]
+        {
             "email": payload.email,
-            "password": hash_password(payload.password),
+            "password": password_hash,
             "nickname": payload.nickname,
             "code": code,
         },
     )
-    redis.expire(key, SIGNUP_CODE_TTL)
-
-    # 확인
-    saved_data = redis.hgetall(key)
-    print(f"[DEBUG] Saved data in Redis: {saved_data}")
 
-    # 메일 발송 (SMTP 환경변수 없으면 콘솔에만 출력)
-    send_signup_code_email(payload.email, code)
+    # 메일 발송 요청 (백그라운드 큐로 넘기고 바로 반환, SMTP 환경변수 없으면 로그로만 남김)
+    try:
+        send_signup_code_email(payload.email, code)
+    except MailQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+        )
 
+    logger.debug("signup code issued", extra={"email": payload.email})
     return SignupRequestResponse(email=payload.email, expires_in=SIGNUP_CODE_TTL)
 
 
@@ -107,21 +196,18 @@ def verify_code(payload: SignupConfirm) -> dict:
     redis = get_redis_client()
     key = _redis_key(payload.email)
 
-    data = redis.hgetall(key)
-    if not data:
+    # 코드 필드만 조회
+    stored_code = redis.hget(key, "code")
+    if stored_code is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="인증 정보가 만료되었거나 존재하지 않습니다.",
         )
 
-    stored_code = data.get("code", "")
-
-    # 디버깅 로그
-    print(f"[DEBUG] Redis stored code: '{stored_code}'")
-    print(f"[DEBUG] User input code: '{payload.code}'")
-    print(f"[DEBUG] Codes match: {stored_code == payload.code}")
+    matched = stored_code == payload.code
+    logger.debug("signup code verified", extra={"email": payload.email, "matched": matched})
 
-    if stored_code != payload.code:
+    if not matched:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="인증 코드가 올바르지 않습니다.",
@@ -138,50 +224,36 @@ def confirm_signup(
     db: Session, payload: SignupConfirm
 ) -> SignupConfirmResponse:  # 인증코드 확인하고 가입 승인, 토큰 발급
 
-    redis = get_redis_client()
     key = _redis_key(payload.email)
 
-    data = redis.hgetall(key)
-    if not data:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="인증 정보가 만료되었거나 존재하지 않습니다.",
-        )
-
-    stored_code = data.get("code", "")
-
-    # 디버깅 로그
-    print(f"[DEBUG] Redis stored code: '{stored_code}'")
-    print(f"[DEBUG] User input code: '{payload.code}'")
-    print(f"[DEBUG] Codes match: {stored_code == payload.code}")
-
-    if stored_code != payload.code:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="인증 코드가 올바르지 않습니다.",
-        )
+    # 코드 확인 + 임시 데이터 꺼내기 + 삭제 (한 번의 왕복, 중복 confirm 방지)
+    data, ttl_ms = _consume_signup_state(key, payload.code)
+
+    # 여기서부터 커밋까지 실패하면 임시 데이터를 남은 TTL 그대로 되돌려
+    # 같은 코드로 다시 시도할 수 있게 함 (코드 유효 시간은 늘리지 않음)
+    try:
+        # 중복 가입 방지 (이 타이밍에도 다시 체크)
+        exists = db.query(User).filter(User.email == payload.email).first()
+        if exists:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 가입된 이메일입니다.",
+            )
 
-    # 중복 가입 방지 (이 타이밍에도 다시 체크)
-    exists = db.query(User).filter(User.email == payload.email).first()
-    if exists:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 가입된 이메일입니다.",
+        # 실제 유저 생성
+        user = User(
+            email=data["email"],
+            password=data["password"],  # 해시된 비밀번호
+            nickname=data["nickname"],
+            onboarding_completed=False,  # 온보딩 미완료
         )
-
-    # 실제 유저 생성
-    user = User(
-        email=data["email"],
-        password_hash=data["password"],  # password_hash로 저장
-        nickname=data["nickname"],  # nickname 추가
-        onboarding_completed_at=None,  # 온보딩 미완료 (NULL)
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-
-    # Redis 데이터 삭제
-    redis.delete(key)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    except Exception:
+        db.rollback()
+        _save_signup_state(key, data, ttl_ms)
+        raise
 
     # JWT 발급
     token = create_access_token({"sub": str(user.user_id)})
@@ -189,8 +261,7 @@ def confirm_signup(
     return SignupConfirmResponse(
         user_id=str(user.user_id),
         email=user.email,
-        onboarding_completed=user.onboarding_completed_at
-        is not None,  # NULL이 아니면 완료
+        onboarding_completed=user.onboarding_completed,
         token={
             "access_token": token,
             "token_type": "bearer",
@@ -202,15 +273,19 @@ def confirm_signup(
 # REG-03-01 온보딩 – OTT 선택
 # ========================================
 def save_user_ott(
-    db: Session, user: User, payload: OnboardingOTTRequest
+    db: Session, user: UserPrincipal, payload: OnboardingOTTRequest
 ) -> None:  # 선택한 ott 저장
 
-    # 기존 데이터 삭제 후 다시 저장 (idempotent)
-    db.execute(delete(UserOttMap).where(UserOttMap.user_id == user.user_id))
-
-    for provider_id in payload.provider_ids:
-        db.add(UserOttMap(user_id=user.user_id, provider_id=provider_id))
+    # 존재하지 않는 OTT는 커밋 시 FK 오류 대신 메모리 스냅샷으로 미리 거절
+    unknown = ott_provider_snapshot.unknown_ids(db, payload.provider_ids)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"존재하지 않는 OTT입니다: {unknown}",
+        )
 
+    # 기존 선택과 비교해서 바뀐 것만 반영 (idempotent)
+    _sync_user_links(db, UserOttMap, UserOttMap.provider_id, user, payload.provider_ids)
     db.commit()
 
 
@@ -219,40 +294,76 @@ def save_user_ott(
 # ========================================
 def save_onboarding_answers(
     db: Session,
-    user: User,
+    user: UserPrincipal,
     payload: OnboardingSurveyRequest,
 ) -> None:  # 선택한 영화 저장
 
-    # 기존 기록 삭제 후 새로 저장
-    db.execute(
-        delete(UserOnboardingAnswer).where(UserOnboardingAnswer.user_id == user.user_id)
+    # 기존 기록과 비교해서 바뀐 것만 반영 (이미 있던 응답은 selected_at 유지)
+    _sync_user_links(
+        db,
+        UserOnboardingAnswer,
+        UserOnboardingAnswer.movie_id,
+        user,
+        payload.movie_ids,
+        selected_at=func.now(),
     )
 
-    for movie_id in payload.movie_ids:
-        db.add(
-            UserOnboardingAnswer(
-                user_id=user.user_id,
-                movie_id=movie_id,
-                # created_at은 DB에서 자동 생성
-            )
-        )
-
     # 설문 완료 시 온보딩 완료 처리
-    user.onboarding_completed = True
-    db.add(user)
+    _mark_onboarding_completed(db, user)
     db.commit()
+    invalidate_principal(user.user_id)
+
+
+def _sync_user_links(
+    db: Session,
+    model,
+    column,
+    user: UserPrincipal,
+    ids: List[int],
+    **values,
+) -> None:
+    """
+    (user_id, column) 매핑 테이블을 ids와 같게 맞춘다.
+
+    - 선택에서 빠진 행만 DELETE
+    - 새로 선택된 행은 multi-row INSERT ... ON CONFLICT DO NOTHING 한 번으로 추가
+    - 커밋은 호출한 쪽에서 (한 트랜잭션)
+    """
+    ids = list(dict.fromkeys(ids))  # 중복 제거 (순서 유지)
+
+    stale = delete(model).where(model.user_id == user.user_id)
+    if ids:
+        stale = stale.where(column.not_in(ids))
+    db.execute(stale)
+
+    if not ids:
+        return
+
+    db.execute(
+        pg_insert(model)
+        .values([{"user_id": user.user_id, column.key: i, **values} for i in ids])
+        .on_conflict_do_nothing(index_elements=[model.user_id, column])
+    )
+
+
+def _mark_onboarding_completed(db: Session, user: UserPrincipal) -> None:
+    """User 엔티티를 읽지 않고 UPDATE 한 번으로 온보딩 완료 처리"""
+    db.execute(
+        update(User)
+        .where(User.user_id == user.user_id)
+        .values(onboarding_completed=True)
+    )
 
 
 # ========================================
 # REG-05-01 온보딩 완료
 # ========================================
 def complete_onboarding(
-    db: Session, user: User
+    db: Session, user: UserPrincipal
 ) -> OnboardingCompleteResponse:  # 온보딩 완료
-    user.onboarding_completed = True
-    db.add(user)
+    _mark_onboarding_completed(db, user)
     db.commit()
-    db.refresh(user)
+    invalidate_principal(user.user_id)
 
     return OnboardingCompleteResponse(
         user_id=str(user.user_id),
@@ -264,13 +375,12 @@ def complete_onboarding(
 # REG-05-02 온보딩 스킵
 # ========================================
 def skip_onboarding(
-    db: Session, user: User
+    db: Session, user: UserPrincipal
 ) -> OnboardingCompleteResponse:  # 온보딩 스킵으로 완료
     # 스킵 시에도 온보딩 완료 처리 (메인 진입 허용)
-    user.onboarding_completed = True
-    db.add(user)
+    _mark_onboarding_completed(db, user)
     db.commit()
-    db.refresh(user)
+    invalidate_principal(user.user_id)
 
     return OnboardingCompleteResponse(
         user_id=str(user.user_id),
@@ -285,59 +395,15 @@ def get_onboarding_survey_movies(db: Session) -> SurveyMoviesResponse:
     """
     키워드별로 랜덤 영화 1개씩 선택 (총 10개)
     "불멸의 명작" + "평론가 추천 / 예술" 통합
-    """
-    # 10개 키워드 정의 (통합된 키워드 포함)
-    keywords = [
-        "가벼운 재미 / 코미디",
-        "설레는 로맨스",
-        "환상적인 모험",
-        "동심의 세계 / 애니메이션",
-        ["불멸의 명작", "평론가 추천 / 예술"],  # 통합 키워드
-        "감성 인디 / 인간관계",
-        "압도적 스케일 / 히어로",
-        "SF / 우주 / 미래",
-        "등골이 오싹한 / 공포",
-        "짜릿한 액션 / 범죄",
-    ]
-
-    result_movies = []
-
-    for keyword in keywords:
-        # 통합 키워드 처리
-        if isinstance(keyword, list):
-            # 두 키워드 모두에서 후보 가져오기
-            candidates = (
-                db.query(OnboardingCandidate, Movie)
-                .join(Movie, OnboardingCandidate.movie_id == Movie.movie_id)
-                .filter(OnboardingCandidate.mood_tag.in_(keyword))
-                .all()
-            )
-            mood_tag = " / ".join(keyword)  # 표시용 통합 태그
-        else:
-            # 단일 키워드
-            candidates = (
-                db.query(OnboardingCandidate, Movie)
-                .join(Movie, OnboardingCandidate.movie_id == Movie.movie_id)
-                .filter(OnboardingCandidate.mood_tag == keyword)
-                .all()
-            )
-            mood_tag = keyword
-
-        if not candidates:
-            # 해당 키워드에 후보가 없으면 건너뛰기
-            continue
 
-        # 랜덤으로 1개 선택
-        import random
-
-        selected_candidate, selected_movie = random.choice(candidates)
+    후보는 메모리 풀(survey_candidate_pool)에서 샘플링하고,
+    풀이 비어 있거나 TTL이 지났을 때만 DB에서 다시 읽는다.
+    """
+    survey_candidate_pool.ensure_fresh(db)
 
-        result_movies.append(
-            SurveyMovieItem(
-                movie_id=selected_movie.movie_id,
-                mood_tag=mood_tag,
-                title=selected_movie.title,
-            )
-        )
+    result_movies = [
+        SurveyMovieItem(movie_id=movie_id, mood_tag=mood_tag, title=title)
+        for movie_id, mood_tag, title in survey_candidate_pool.sample()
+    ]
 
     return SurveyMoviesResponse(movies=result_movies)
@@ -0,0 +1,132 @@
+# backend/domains/registration/survey_pool.py
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.domains.movie.models import Movie, OnboardingCandidate
+
+# ========================================
+# 설문 키워드 정의
+# ========================================
+# 10개 키워드 (통합된 키워드 포함)
+SURVEY_KEYWORDS: List[Union[str, Tuple[str, ...]]] = [
+    "가벼운 재미 / 코미디",
+    "설레는 로맨스",
+    "환상적인 모험",
+    "동심의 세계 / 애니메이션",
+    ("불멸의 명작", "평론가 추천 / 예술"),  # 통합 키워드
+    "감성 인디 / 인간관계",
+    "압도적 스케일 / 히어로",
+    "SF / 우주 / 미래",
+    "등골이 오싹한 / 공포",
+    "짜릿한 액션 / 범죄",
+]
+
+SURVEY_POOL_TTL = 600  # 후보 풀 갱신 주기 (초 단위)
+
+
+@dataclass(frozen=True)
+class _Bucket:
+    """키워드 하나에 해당하는 후보 묶음 (movie_id 배열 + 제목 튜플)"""
+
+    mood_tag: str  # 응답에 표시되는 태그 (통합 키워드는 " / "로 연결)
+    movie_ids: array
+    titles: Tuple[str, ...]
+
+
+def _display_tag(keyword: Union[str, Sequence[str]]) -> str:
+    if isinstance(keyword, str):
+        return keyword
+    return " / ".join(keyword)
+
+
+class SurveyCandidatePool:
+    """
+    온보딩 설문 후보를 메모리에 올려두고 샘플링하는 풀.
+
+    - 최초 요청 또는 TTL 만료 시 한 번의 쿼리로 전체 후보를 읽어 키워드별로 묶는다.
+    - 이후 요청은 DB 조회 없이 메모리에서 키워드별 1개씩 랜덤 선택한다.
+    - 후보 데이터가 바뀌면 invalidate()로 즉시 갱신을 강제할 수 있다.
+    """
+
+    def __init__(self, ttl: float = SURVEY_POOL_TTL) -> None:
+        self.ttl = ttl
+        self._buckets: Tuple[_Bucket, ...] = ()
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    # -----------------------------
+    # 로딩 / 갱신
+    # -----------------------------
+    def is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return time.monotonic() - self._loaded_at >= self.ttl
+
+    def invalidate(self) -> None:
+        """다음 요청에서 후보 풀을 다시 읽도록 표시"""
+        self._loaded_at = None
+
+    def refresh(self, db: Session) -> None:
+        """DB에서 전체 후보를 한 번에 읽어 키워드별 버킷으로 재구성"""
+        rows = db.execute(
+            select(OnboardingCandidate.mood_tag, Movie.movie_id, Movie.title)
+            .join(Movie, OnboardingCandidate.movie_id == Movie.movie_id)
+            .order_by(OnboardingCandidate.mood_tag, OnboardingCandidate.display_order)
+        ).all()
+
+        by_tag: Dict[str, List[Tuple[int, str]]] = {}
+        for mood_tag, movie_id, title in rows:
+            by_tag.setdefault(mood_tag, []).append((movie_id, title))
+
+        buckets = []
+        for keyword in SURVEY_KEYWORDS:
+            tags = (keyword,) if isinstance(keyword, str) else keyword
+            candidates = [c for tag in tags for c in by_tag.get(tag, ())]
+            if not candidates:
+                # 해당 키워드에 후보가 없으면 버킷을 만들지 않음
+                continue
+            buckets.append(
+                _Bucket(
+                    mood_tag=_display_tag(keyword),
+                    movie_ids=array("i", (movie_id for movie_id, _ in candidates)),
+                    titles=tuple(title for _, title in candidates),
+                )
+            )
+
+        # 참조 교체 한 번으로 반영 (읽는 쪽은 락 없이 접근)
+        self._buckets = tuple(buckets)
+        self._loaded_at = time.monotonic()
+
+    def ensure_fresh(self, db: Session) -> None:
+        if not self.is_stale():
+            return
+        with self._lock:
+            # 다른 스레드가 먼저 갱신했으면 건너뜀
+            if self.is_stale():
+                self.refresh(db)
+
+    # -----------------------------
+    # 샘플링
+    # -----------------------------
+    def sample(self, rng: Optional[random.Random] = None) -> List[Tuple[int, str, str]]:
+        """키워드별로 (movie_id, mood_tag, title) 1개씩 랜덤 선택"""
+        randrange = (rng or random).randrange
+        picked = []
+        for bucket in self._buckets:
+            idx = randrange(len(bucket.movie_ids))
+            picked.append((bucket.movie_ids[idx], bucket.mood_tag, bucket.titles[idx]))
+        return picked
+
+
+# 프로세스 단위 공용 풀
+survey_candidate_pool = SurveyCandidatePool()
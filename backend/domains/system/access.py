@@ -0,0 +1,63 @@
+# backend/domains/system/access.py
+"""
+내부용 엔드포인트(/internal/*, /metrics) 접근 제한.
+
+- INTERNAL_API_TOKEN 이 설정되어 있으면 X-Internal-Token 헤더가 일치하는 요청만 허용
+  (모니터링/스크레이퍼가 외부 네트워크에서 들어오는 경우)
+- 토큰이 없으면 INTERNAL_ALLOW_IPS (IP 또는 CIDR, 쉼표 구분, 기본: 루프백)에서
+  직접 들어온 요청만 허용.
+  X-Forwarded-For 가 붙은 요청은 프록시를 거친 외부 요청으로 보고 거절
+  (같은 호스트의 리버스 프록시 뒤에서는 모든 요청이 루프백으로 보이기 때문)
+- 거절은 404 -> 내부 엔드포인트의 존재 자체를 드러내지 않음
+"""
+
+import ipaddress
+import os
+import secrets
+from typing import List, Optional, Union
+
+from fastapi import HTTPException, Request, status
+
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN", "")
+INTERNAL_TOKEN_HEADER = "x-internal-token"
+
+_Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def _parse_networks(value: str) -> List[_Network]:
+    return [
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    ]
+
+
+INTERNAL_ALLOW_IPS = _parse_networks(os.getenv("INTERNAL_ALLOW_IPS", "127.0.0.1,::1"))
+
+
+def _ip_allowed(host: Optional[str]) -> bool:
+    if not host:
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:  # TestClient("testclient") 등 IP가 아닌 값
+        return False
+    return any(address in network for network in INTERNAL_ALLOW_IPS)
+
+
+def is_internal_request(request: Request) -> bool:
+    if INTERNAL_API_TOKEN:
+        token = request.headers.get(INTERNAL_TOKEN_HEADER, "")
+        return secrets.compare_digest(token.encode(), INTERNAL_API_TOKEN.encode())
+
+    if request.headers.get("x-forwarded-for"):
+        return False
+    return _ip_allowed(request.client.host if request.client else None)
+
+
+# ========================================
+# FastAPI 의존성 (라우터 dependencies=[Depends(...)]에 사용)
+# ========================================
+async def require_internal_access(request: Request) -> None:
+    if not is_internal_request(request):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
@@ -0,0 +1,109 @@
+# backend/domains/system/router.py
+
+from fastapi import APIRouter, Depends
+
+from backend.core.db import get_pool_stats
+from backend.core.log import get_logging_stats
+from backend.domains.auth.cache import principal_cache
+from backend.domains.auth.token_cache import token_cache
+from backend.utils.http_cache import get_http_cache_stats
+from backend.utils.mailer import mail_dispatcher
+from backend.utils.rate_limit import get_rate_limit_stats
+from backend.utils.redis import get_redis_pool_stats
+
+from .access import require_internal_access
+
+# 내부망/토큰 요청만 허용 (access.py 참고)
+router = APIRouter(
+    prefix="/internal",
+    tags=["system"],
+    dependencies=[Depends(require_internal_access)],
+)
+
+
+# =========================
+# 내부용: DB 커넥션 풀 상태
+# =========================
+@router.get(
+    "/db/pool",
+    summary="DB 커넥션 풀 상태 및 누적 통계 조회",
+    include_in_schema=False,
+)
+def db_pool_stats() -> dict:
+    """checkout 대기/점유 시간, overflow 사용량, 현재 풀 크기 반환"""
+    return get_pool_stats()
+
+
+# =========================
+# 내부용: Redis 커넥션 풀 상태
+# =========================
+@router.get(
+    "/redis/pool",
+    summary="Redis 커넥션 풀 사용량 조회",
+    include_in_schema=False,
+)
+def redis_pool_stats() -> dict:
+    return get_redis_pool_stats()
+
+
+# =========================
+# 내부용: 인증 캐시 상태
+# =========================
+@router.get(
+    "/auth/cache",
+    summary="인증 유저/토큰 캐시 적중률 조회",
+    include_in_schema=False,
+)
+def auth_cache_stats() -> dict:
+    return {
+        "principal": principal_cache.stats(),
+        "token": token_cache.stats(),
+    }
+
+
+# =========================
+# 내부용: 메일 발송 큐 상태
+# =========================
+@router.get(
+    "/mail/queue",
+    summary="메일 발송 큐 상태 조회",
+    include_in_schema=False,
+)
+def mail_queue_stats() -> dict:
+    return mail_dispatcher.stats()
+
+
+# =========================
+# 내부용: HTTP 응답 캐시 상태
+# =========================
+@router.get(
+    "/http/cache",
+    summary="HTTP 응답 캐시 적중률 조회",
+    include_in_schema=False,
+)
+def http_cache_stats() -> dict:
+    return get_http_cache_stats()
+
+
+# =========================
+# 내부용: 로그 큐 상태
+# =========================
+@router.get(
+    "/logging",
+    summary="로그 큐 적재량 / 버린 로그 수 조회",
+    include_in_schema=False,
+)
+def logging_stats() -> dict:
+    return get_logging_stats()
+
+
+# =========================
+# 내부용: rate limit 통계
+# =========================
+@router.get(
+    "/rate-limit",
+    summary="rate limit 허용/거절 건수 조회",
+    include_in_schema=False,
+)
+def rate_limit_stats() -> dict:
+    return get_rate_limit_stats()
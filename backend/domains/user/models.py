@@ -28,6 +28,11 @@ class User(Base):
         String,
         nullable=False,  # 해시된 비밀번호 저장
     )
+    nickname = Column(
+        String(30),
+        nullable=True,  # 기존 유저는 NULL
+        unique=True,  # 닉네임 중복 방지
+    )
     onboarding_completed = Column(
         Boolean,
         nullable=False,
@@ -1,19 +1,82 @@
 # backend/main.py
 
-from dotenv import load_dotenv
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
 
+from fastapi import Depends, FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from backend.core.db import dispose_engines, init_engines
+from backend.core.log import setup_logging, shutdown_logging
+from backend.core.metrics import MetricsMiddleware, render_prometheus
+
+from backend.domains.movie.router import router as movie_router
+from backend.domains.ott.router import router as ott_router
+from backend.domains.ott.snapshot import ott_provider_snapshot
+from backend.domains.recommendation.router import router as recommendation_router
 from backend.domains.registration.router import router as registration_router
+from backend.domains.system.access import require_internal_access
+from backend.domains.system.router import router as system_router
+from backend.utils.mailer import mail_dispatcher
+from backend.utils.password import password_hasher
+from backend.utils.redis import close_async_redis, close_redis, get_redis_client, init_async_redis
+
 
-# 환경변수 로드 (.env)
-load_dotenv()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 로그는 큐에 넣고 백그라운드 스레드가 출력 (uvicorn 로그 포함)
+    setup_logging()
+    # DB 엔진 / Redis 풀은 import 시점이 아니라 여기서 생성 (.env는 backend/__init__.py에서 로드)
+    init_engines()
+    get_redis_client()
+    await init_async_redis()
+    # OTT 목록 스냅샷을 미리 올려 첫 요청부터 DB 조회 없이 응답
+    await run_in_threadpool(ott_provider_snapshot.load_once)
+    if mail_dispatcher.settings.enabled:
+        mail_dispatcher.start()
+    yield
+    await close_async_redis()
+    close_redis()
+    await dispose_engines()
+    # 종료 시 남은 메일 발송 후 워커 정리
+    mail_dispatcher.stop()
+    # 종료 시 해싱 워커 프로세스 정리
+    password_hasher.shutdown()
+    # 큐에 남은 로그까지 출력 후 종료
+    shutdown_logging()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
+
+# 요청별 지연 시간 / DB·Redis 시간 계측 (/metrics로 노출)
+app.add_middleware(MetricsMiddleware)
 
 # 회원가입/온보딩 라우터 등록
 app.include_router(registration_router)
 
+# OTT 플랫폼 목록 라우터 등록
+app.include_router(ott_router)
+
+# 영화 목록 라우터 등록
+app.include_router(movie_router)
+
+# 추천 라우터 등록
+app.include_router(recommendation_router)
+
+# 내부 운영용 라우터 (풀 상태 등)
+app.include_router(system_router)
+
 
 @app.get("/")
 def root():
     return {"message": "ok"}
+
+
+@app.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_access)],
+)
+def metrics() -> PlainTextResponse:
+    """Prometheus 스크레이프용 (text exposition format)"""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,321 @@
+# backend/utils/http_cache.py
+"""
+읽기 위주 GET 라우터용 응답 캐시 (+ ETag / 304).
+
+    @router.get("/movies/genres", response_model=List[str])
+    @cache_response(ttl=600, namespace="movies")
+    def list_genres(db: Session = Depends(get_db)): ...
+
+- 캐시 키: namespace + 세대(generation) + 경로 + 정렬된 쿼리스트링 (+ vary 헤더)
+- 히트 시 라우터 함수(DB 조회)와 응답 직렬화를 모두 건너뛰고 저장된 JSON 바이트를 그대로 반환
+- ETag는 응답 본문의 sha256 (strong), If-None-Match가 같으면 본문 없이 304
+- invalidate(namespace)는 세대 번호만 올려 해당 namespace의 기존 항목을 한 번에 무효화
+  (옛 항목은 TTL로 자연 소멸)
+
+백엔드는 HTTP_CACHE_BACKEND=memory(기본, 프로세스별) | redis(워커 간 공유).
+적재 CLI 같은 별도 프로세스의 invalidate()는 redis 백엔드일 때만 API 서버에 전달된다
+(memory 백엔드에서는 TTL이 지나야 반영).
+로그인 유저마다 다른 응답을 주는 라우터에는 쓰지 말 것 (vary로 헤더를 키에 넣을 수는 있음).
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import typing
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from fastapi import Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from redis import RedisError
+
+from backend.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_BACKEND = os.getenv("HTTP_CACHE_BACKEND", "memory").lower()
+HTTP_CACHE_SIZE = int(os.getenv("HTTP_CACHE_SIZE", "2048"))
+# Redis 백엔드에서 세대 번호를 로컬에 들고 있는 시간 (= 다른 워커의 무효화가 보이기까지 최대 지연)
+HTTP_CACHE_GENERATION_TTL = float(os.getenv("HTTP_CACHE_GENERATION_TTL", "1"))
+HTTP_CACHE_REDIS_PREFIX = "httpcache"
+
+# (ETag, JSON 본문)
+CachedBody = Tuple[str, bytes]
+
+
+# ======================================================
+# 백엔드
+# ======================================================
+class MemoryCacheBackend:
+    """프로세스 내부 LRU + TTL (워커마다 따로)"""
+
+    def __init__(self, maxsize: int = HTTP_CACHE_SIZE) -> None:
+        self._entries = TTLCache(maxsize=maxsize, ttl=60)
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def invalidate(self, namespace: str) -> None:
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: CachedBody, ttl: float) -> None:
+        self._entries.set(key, value, ttl=ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "entries": self._entries.stats()}
+
+
+class RedisCacheBackend:
+    """
+    Redis 공유 캐시.
+
+    - 항목: httpcache:{namespace}:{generation}:{key 해시} -> "etag\\n본문" (SETEX)
+    - 세대: httpcache:gen:{namespace} (INCR), 로컬에 HTTP_CACHE_GENERATION_TTL 동안 보관
+    - Redis 오류는 캐시 미스로 처리 (요청은 그대로 DB에서 처리)
+    """
+
+    def __init__(self, generation_ttl: float = HTTP_CACHE_GENERATION_TTL) -> None:
+        self._generations = TTLCache(maxsize=1024, ttl=generation_ttl)
+
+    @staticmethod
+    def _client():
+        from backend.utils.redis import get_redis_client
+
+        return get_redis_client()
+
+    def generation(self, namespace: str) -> int:
+        generation = self._generations.get(namespace)
+        if generation is None:
+            try:
+                generation = int(self._client().get(f"{HTTP_CACHE_REDIS_PREFIX}:gen:{namespace}") or 0)
+            except RedisError:
+                return 0
+            self._generations.set(namespace, generation)
+        return generation
+
+    def invalidate(self, namespace: str) -> None:
+        try:
+            generation = self._client().incr(f"{HTTP_CACHE_REDIS_PREFIX}:gen:{namespace}")
+        except RedisError as exc:
+            logger.warning("http cache invalidate failed namespace=%s: %s", namespace, exc)
+            self._generations.pop(namespace)
+            return
+        self._generations.set(namespace, int(generation))
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        try:
+            raw = self._client().get(f"{HTTP_CACHE_REDIS_PREFIX}:{key}")
+        except RedisError:
+            return None
+        if raw is None:
+            return None
+        etag, _, body = raw.partition("\n")
+        return etag, body.encode()
+
+    def set(self, key: str, value: CachedBody, ttl: float) -> None:
+        etag, body = value
+        try:
+            self._client().set(
+                f"{HTTP_CACHE_REDIS_PREFIX}:{key}",
+                etag + "\n" + body.decode(),
+                ex=max(int(ttl), 1),
+            )
+        except RedisError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", "generations": self._generations.stats()}
+
+
+def _create_backend(name: str):
+    if name == "redis":
+        return RedisCacheBackend()
+    if name != "memory":
+        raise RuntimeError(f"알 수 없는 HTTP_CACHE_BACKEND 입니다: {name}")
+    return MemoryCacheBackend()
+
+
+# 프로세스 단위 공용 백엔드
+http_cache_backend = _create_backend(HTTP_CACHE_BACKEND)
+
+# lookup()은 스레드풀에서도 불리므로 카운터 갱신은 락으로 보호
+_stats = {"hits": 0, "misses": 0, "not_modified": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def invalidate(namespace: str) -> None:
+    """namespace에 속한 캐시 응답 전체 무효화 (데이터 변경 후 호출)"""
+    http_cache_backend.invalidate(namespace)
+
+
+def get_http_cache_stats() -> Dict[str, Any]:
+    with _stats_lock:
+        counters = dict(_stats)
+    return {**counters, **http_cache_backend.stats()}
+
+
+# ======================================================
+# 데코레이터
+# ======================================================
+def _render(data: Any) -> bytes:
+    # fastapi.responses.JSONResponse와 같은 직렬화 옵션
+    return json.dumps(
+        jsonable_encoder(data),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _cache_key(request: Request, namespace: str, generation: int, vary: Sequence[str]) -> str:
+    # 파라미터 이름 순서는 무시하되, 같은 이름이 반복될 때(?q=b&q=a)의 값 순서는 유지 (안정 정렬)
+    # 값에 '&', '='가 들어가도 섞이지 않도록 JSON으로 직렬화
+    params = sorted(request.query_params.multi_items(), key=lambda item: item[0])
+    parts = [request.url.path, json.dumps(params, ensure_ascii=False)]
+    parts.extend(request.headers.get(name, "") for name in vary)
+    digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+    return f"{namespace}:{generation}:{digest}"
+
+
+def _build_response(status_code: int, etag: str, body: bytes, cache_control: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if status_code == status.HTTP_304_NOT_MODIFIED:
+        return Response(status_code=status_code, headers=headers)
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+
+
+def _resolved_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """
+    문자열 어노테이션(`from __future__ import annotations`)을 func 모듈 기준으로 미리 풀어 둔 시그니처.
+    FastAPI는 래퍼의 __globals__(이 모듈)로 어노테이션을 해석하므로, 풀지 않으면 라우터 모듈의 타입을 못 찾는다.
+    """
+    signature = inspect.signature(func)
+    try:
+        hints = typing.get_type_hints(func, include_extras=True)
+    except Exception:  # TYPE_CHECKING 전용 이름 등 -> 원래 어노테이션 그대로 둠
+        hints = {}
+    parameters = [
+        param.replace(annotation=hints.get(param.name, param.annotation))
+        for param in signature.parameters.values()
+    ]
+    return signature.replace(
+        parameters=parameters,
+        return_annotation=hints.get("return", signature.return_annotation),
+    )
+
+
+def cache_response(
+    ttl: float,
+    namespace: str,
+    vary: Sequence[str] = (),
+    max_age: int = 0,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    GET 라우터 함수에 응답 캐시 + ETag를 붙이는 데코레이터 (@router.get 아래에 둘 것).
+
+    - ttl: 서버 캐시 보관 시간 (초)
+    - namespace: invalidate(namespace)로 함께 지울 묶음 이름
+    - vary: 캐시 키에 포함할 요청 헤더 이름
+    - max_age: 클라이언트 Cache-Control max-age (0이면 매번 ETag로 재검증)
+
+    라우터 함수가 Response를 직접 반환하면 캐시하지 않고 그대로 돌려준다.
+    """
+    cache_control = f"public, max-age={max_age}" if max_age > 0 else "no-cache"
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = _resolved_signature(func)
+        request_param = next(
+            (p.name for p in signature.parameters.values() if p.annotation in (Request, "Request")),
+            None,
+        )
+        injected = request_param is None
+        if injected:
+            # FastAPI가 Request를 넘겨주도록 시그니처에 인자를 추가
+            request_param = "_http_cache_request"
+            signature = signature.replace(
+                parameters=[
+                    *signature.parameters.values(),
+                    inspect.Parameter(request_param, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+                ]
+            )
+
+        def lookup(request: Request) -> Tuple[str, Optional[Response]]:
+            key = _cache_key(request, namespace, http_cache_backend.generation(namespace), vary)
+            cached = http_cache_backend.get(key)
+            if cached is None:
+                _count("misses")
+                return key, None
+
+            etag, body = cached
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                _count("not_modified")
+                return key, _build_response(status.HTTP_304_NOT_MODIFIED, etag, body, cache_control)
+            _count("hits")
+            return key, _build_response(status.HTTP_200_OK, etag, body, cache_control)
+
+        def store(request: Request, key: str, result: Any) -> Any:
+            if isinstance(result, Response):
+                return result
+            body = _render(result)
+            etag = _etag(body)
+            http_cache_backend.set(key, (etag, body), ttl)
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return _build_response(status.HTTP_304_NOT_MODIFIED, etag, body, cache_control)
+            return _build_response(status.HTTP_200_OK, etag, body, cache_control)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                request = kwargs.pop(request_param) if injected else kwargs[request_param]
+                # Redis 백엔드는 동기 클라이언트이므로 이벤트 루프 밖에서 조회
+                key, response = await run_in_threadpool(lookup, request)
+                if response is not None:
+                    return response
+                result = await func(*args, **kwargs)
+                return await run_in_threadpool(store, request, key, result)
+
+            async_wrapper.__signature__ = signature  # type: ignore[attr-defined]
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request = kwargs.pop(request_param) if injected else kwargs[request_param]
+            key, response = lookup(request)
+            if response is not None:
+                return response
+            return store(request, key, func(*args, **kwargs))
+
+        wrapper.__signature__ = signature  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -0,0 +1,327 @@
+# backend/utils/mailer.py
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.message import EmailMessage
+from typing import Iterator, List, Optional
+
+from backend.core.env import env_bool
+
+logger = logging.getLogger(__name__)
+
+
+# ======================================================
+# SMTP 설정
+# ======================================================
+@dataclass(frozen=True)
+class SMTPSettings:
+    host: Optional[str]
+    port: int
+    user: Optional[str]
+    password: Optional[str]
+    from_email: str
+    starttls: bool
+    timeout: float
+
+    @classmethod
+    def from_env(cls) -> "SMTPSettings":
+        user = os.getenv("SMTP_USER")
+        return cls(
+            host=os.getenv("SMTP_HOST"),
+            port=int(os.getenv("SMTP_PORT", "587")),
+            user=user,
+            password=os.getenv("SMTP_PASSWORD"),
+            from_email=os.getenv("SMTP_FROM", user or ""),
+            # 로컬 디버깅 SMTP 서버(aiosmtpd 등)는 STARTTLS 없이 사용
+            starttls=env_bool("SMTP_STARTTLS", True),
+            timeout=float(os.getenv("SMTP_TIMEOUT", "10")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.host)
+
+
+MAIL_POOL_SIZE = int(os.getenv("MAIL_POOL_SIZE", "2"))  # SMTP 커넥션 수 = 워커 스레드 수
+MAIL_QUEUE_SIZE = int(os.getenv("MAIL_QUEUE_SIZE", "1000"))
+MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", "20"))  # 커넥션 하나로 연속 전송할 최대 개수
+MAIL_MAX_RETRIES = int(os.getenv("MAIL_MAX_RETRIES", "3"))
+MAIL_RETRY_BACKOFF = float(os.getenv("MAIL_RETRY_BACKOFF", "0.5"))  # 초, 재시도마다 2배
+MAIL_CONN_MAX_IDLE = float(os.getenv("MAIL_CONN_MAX_IDLE", "60"))  # 이 시간 넘게 놀던 커넥션은 NOOP 확인
+
+
+class MailQueueFull(RuntimeError):
+    """발송 대기열이 가득 참"""
+
+
+# ======================================================
+# SMTP 커넥션 풀
+# ======================================================
+class SMTPConnectionPool:
+    """
+    로그인까지 끝난 smtplib.SMTP 커넥션을 재사용하는 풀.
+    매 메일마다 TCP 연결 + STARTTLS + 로그인을 반복하지 않도록 한다.
+    """
+
+    def __init__(self, settings: SMTPSettings, size: int = MAIL_POOL_SIZE) -> None:
+        self.settings = settings
+        self.size = max(1, size)
+        self._idle: "queue.LifoQueue[tuple[smtplib.SMTP, float]]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        s = self.settings
+        conn = smtplib.SMTP(s.host, s.port, timeout=s.timeout)
+        try:
+            if s.starttls:
+                conn.starttls()
+            if s.user and s.password:
+                conn.login(s.user, s.password)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _is_alive(self, conn: smtplib.SMTP) -> bool:
+        try:
+            return conn.noop()[0] == 250
+        except OSError:  # smtplib.SMTPException 포함
+            return False
+
+    def _acquire(self) -> smtplib.SMTP:
+        while True:
+            try:
+                conn, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - released_at < MAIL_CONN_MAX_IDLE or self._is_alive(conn):
+                return conn
+            self._discard(conn)
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if can_create:
+            try:
+                return self._connect()
+            except BaseException:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        # 풀이 꽉 찼으면 반납될 때까지 대기
+        conn, _ = self._idle.get()
+        return conn
+
+    def _discard(self, conn: smtplib.SMTP) -> None:
+        with self._lock:
+            self._created -= 1
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        conn = self._acquire()
+        try:
+            yield conn
+        except smtplib.SMTPResponseException:
+            # 서버가 응답은 했으므로 커넥션은 그대로 재사용
+            self._idle.put((conn, time.monotonic()))
+            raise
+        except BaseException:
+            # 끊겼거나 상태를 알 수 없는 커넥션은 버리고 다음 요청에서 새로 연결
+            self._discard(conn)
+            raise
+        else:
+            self._idle.put((conn, time.monotonic()))
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                self._created -= 1
+            try:
+                conn.quit()
+            except OSError:
+                conn.close()
+
+
+# ======================================================
+# 메일 발송 큐 + 백그라운드 워커
+# ======================================================
+def _is_permanent(exc: Exception) -> bool:
+    """5xx 응답/수신자 거부는 재시도해도 소용없음"""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return True
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 500 <= exc.smtp_code < 600
+    return False
+
+
+class MailDispatcher:
+    """
+    메일을 큐에 넣으면 백그라운드 스레드가 꺼내 커넥션 풀로 발송한다.
+
+    - enqueue()는 즉시 반환 (큐가 가득 차면 MailQueueFull)
+    - 워커는 한 번에 최대 batch_size개를 같은 커넥션으로 연속 전송
+    - 일시적인 오류는 지수 백오프로 max_retries번까지 재시도
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        settings: Optional[SMTPSettings] = None,
+        workers: int = MAIL_POOL_SIZE,
+        queue_size: int = MAIL_QUEUE_SIZE,
+        batch_size: int = MAIL_BATCH_SIZE,
+        max_retries: int = MAIL_MAX_RETRIES,
+        backoff: float = MAIL_RETRY_BACKOFF,
+    ) -> None:
+        self.settings = settings or SMTPSettings.from_env()
+        self.pool = SMTPConnectionPool(self.settings, size=workers)
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+
+    # -----------------------------
+    # 시작 / 종료
+    # -----------------------------
+    def start(self) -> None:
+        """워커 시작 (이미 떠 있으면 죽은 워커 자리만 다시 띄움)"""
+        with self._lock:
+            for i in range(self.workers):
+                if i < len(self._threads):
+                    if self._threads[i].is_alive():
+                        continue
+                    logger.warning("mail worker %s died, restarting", self._threads[i].name)
+                thread = threading.Thread(
+                    target=self._run, name=f"mail-dispatcher-{i}", daemon=True
+                )
+                thread.start()
+                if i < len(self._threads):
+                    self._threads[i] = thread
+                else:
+                    self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """남은 메일을 모두 보낸 뒤 워커 종료"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(self._STOP)
+        for thread in threads:
+            thread.join(timeout)
+        self.pool.close_all()
+
+    # -----------------------------
+    # 발송 요청
+    # -----------------------------
+    def enqueue(self, msg: EmailMessage) -> None:
+        if not self._threads or not all(thread.is_alive() for thread in self._threads):
+            self.start()
+        try:
+            self._queue.put_nowait(msg)
+        except queue.Full:
+            raise MailQueueFull("메일 발송 대기열이 가득 찼습니다.")
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    # -----------------------------
+    # 워커
+    # -----------------------------
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is self._STOP:
+                    stop = True
+                    break
+                batch.append(nxt)
+
+            try:
+                self._send_batch(batch)  # type: ignore[arg-type]
+            except Exception:
+                # 예상 못 한 오류(잘못된 헤더/인코딩 등)로 워커가 죽지 않도록, 남은 메일만 실패 처리
+                logger.exception("mail batch failed, dropping %d message(s)", len(batch))
+                self.failed += len(batch)
+            if stop:
+                return
+
+    def _send_batch(self, batch: List[EmailMessage]) -> None:
+        """batch에서 처리(발송/실패)한 메일을 앞에서부터 꺼냄 -> 예외로 끝나면 batch에는 미처리분만 남음"""
+        pending = batch
+        attempt = 0
+        while pending:
+            try:
+                with self.pool.connection() as conn:
+                    while pending:
+                        msg = pending[0]
+                        try:
+                            conn.send_message(msg)
+                        except smtplib.SMTPException as exc:
+                            if not _is_permanent(exc):
+                                raise
+                            logger.error("mail rejected to=%s: %s", msg["To"], exc)
+                            self.failed += 1
+                        else:
+                            self.sent += 1
+                        pending.pop(0)
+                        attempt = 0
+            except OSError as exc:  # smtplib.SMTPException 포함
+                attempt += 1
+                if attempt > self.max_retries:
+                    logger.error(
+                        "mail send failed after %d retries, dropping to=%s: %s",
+                        self.max_retries,
+                        pending[0]["To"],
+                        exc,
+                    )
+                    self.failed += 1
+                    pending.pop(0)
+                    attempt = 0
+                    continue
+                time.sleep(self.backoff * (2 ** (attempt - 1)))
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.qsize(),
+            "sent": self.sent,
+            "failed": self.failed,
+            "workers": sum(thread.is_alive() for thread in self._threads),
+        }
+
+
+# 프로세스 단위 공용 디스패처 (첫 enqueue 때 워커 시작)
+mail_dispatcher = MailDispatcher()
@@ -1,37 +1,142 @@
 # backend/utils/password.py
 
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
 import bcrypt
 
+# ======================================================
+# 해싱 설정
+# ======================================================
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))  # cost factor (2^rounds)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+# 워커 수를 넘는 요청은 이 개수까지만 대기열에 쌓고, 넘치면 바로 거절
+PASSWORD_HASH_MAX_PENDING = int(
+    os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 4))
+)
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "2"))
+# 워커 프로세스 시작 방식. API 프로세스는 이미 여러 스레드(로그 리스너, 메일 워커, 스레드풀)가
+# 락을 잡고 있을 수 있어 fork하면 자식에서 락이 영원히 잠길 수 있음 -> fork 대신 forkserver/spawn
+PASSWORD_HASH_START_METHOD = os.getenv(
+    "PASSWORD_HASH_START_METHOD",
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn",
+)
 
-def hash_password(password: str) -> str:
-    """
-    비밀번호 해싱 (bcrypt 사용)
-    """
+
+class PasswordHasherBusy(RuntimeError):
+    """해싱 대기열이 가득 차서 요청을 받을 수 없음"""
+
+
+def _to_bcrypt_bytes(password: str) -> bytes:
     # UTF-8로 인코딩
     password_bytes = password.encode("utf-8")
 
     # bcrypt는 72바이트 제한이 있으므로 잘라줌
     if len(password_bytes) > 72:
         password_bytes = password_bytes[:72]
+    return password_bytes
+
+
+def _hashpw(password_bytes: bytes, rounds: int) -> str:
+    """프로세스 풀에서 실행되는 실제 해싱 (pickle 가능하도록 모듈 최상위에 둠)"""
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password_bytes, salt).decode("utf-8")
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱을 프로세스 풀로 넘겨 요청 처리 스레드/이벤트 루프를 비워두는 서비스.
+
+    - hash(): 동기 API (결과가 나올 때까지 호출 스레드만 대기)
+    - hash_async(): await 가능한 API
+    - 대기 중인 작업이 max_pending을 넘으면 PasswordHasherBusy 발생 (backpressure)
+    """
+
+    def __init__(
+        self,
+        workers: int = PASSWORD_HASH_WORKERS,
+        rounds: int = BCRYPT_ROUNDS,
+        max_pending: int = PASSWORD_HASH_MAX_PENDING,
+        queue_timeout: float = PASSWORD_HASH_QUEUE_TIMEOUT,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.rounds = rounds
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # 첫 요청 때 워커 프로세스를 띄움 (import 시점 비용 없음)
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context(PASSWORD_HASH_START_METHOD),
+                    )
+        return self._executor
+
+    def _submit(self, password: str, blocking: bool) -> Future:
+        acquired = (
+            self._slots.acquire(timeout=self.queue_timeout)
+            if blocking
+            else self._slots.acquire(blocking=False)
+        )
+        if not acquired:
+            raise PasswordHasherBusy("비밀번호 해싱 대기열이 가득 찼습니다.")
+
+        try:
+            future = self._get_executor().submit(
+                _hashpw, _to_bcrypt_bytes(password), self.rounds
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
 
-    # bcrypt 해싱
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    def hash(self, password: str) -> str:
+        return self._submit(password, blocking=True).result()
 
-    # 문자열로 반환
-    return hashed.decode("utf-8")
+    async def hash_async(self, password: str) -> str:
+        # 이벤트 루프는 대기하지 않고, 자리가 없으면 바로 거절
+        return await asyncio.wrap_future(self._submit(password, blocking=False))
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+# 프로세스 단위 공용 해셔
+password_hasher = PasswordHasher()
+
+
+def hash_password(password: str) -> str:
+    """
+    비밀번호 해싱 (bcrypt 사용, 프로세스 풀에서 실행)
+    """
+    return password_hasher.hash(password)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    비밀번호 해싱 (async def 라우터용)
+    """
+    return await password_hasher.hash_async(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     비밀번호 검증
     """
-    # UTF-8로 인코딩
-    password_bytes = plain_password.encode("utf-8")
-
-    # bcrypt는 72바이트 제한이 있으므로 잘라줌
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
+    password_bytes = _to_bcrypt_bytes(plain_password)
 
     # 해시된 비밀번호도 bytes로 변환
     hashed_bytes = hashed_password.encode("utf-8")
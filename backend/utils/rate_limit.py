@@ -0,0 +1,166 @@
+# backend/utils/rate_limit.py
+"""
+Redis 슬라이딩 윈도우 rate limiter (FastAPI 의존성용).
+
+    signup_limiter = RateLimiter(
+        "signup:request",
+        RateLimitRule("email", limit=5, window=600),
+        RateLimitRule("ip", limit=20, window=600),
+    )
+
+    async def limit_signup(request: Request, payload: SignupRequest) -> None:
+        await signup_limiter.check(email=payload.email, ip=client_ip(request))
+
+    @router.post("/auth/signup/request", dependencies=[Depends(limit_signup)])
+
+- 규칙마다 ZSET 하나 (ratelimit:{scope}:{rule}:{값}), 멤버 = 요청 1건, score = 요청 시각(ms)
+- 모든 규칙의 확인과 기록을 Lua 스크립트 한 번(EVALSHA 1회 왕복)으로 원자적으로 처리.
+  하나라도 초과면 어느 키에도 기록하지 않음 (거절된 요청은 한도를 소모하지 않음)
+- 비동기 Redis 클라이언트를 쓰므로 초과 요청은 이벤트 루프에서 바로 429로 끝남
+  (스레드풀, DB 조회, bcrypt 해싱, 메일 발송까지 가지 않음)
+- Redis 장애 시에는 통과시킴 (fail-open) -> 가입 자체가 막히지 않도록
+- 설정(RATE_LIMIT_ENABLED / RATE_LIMIT_TRUST_PROXY / RATE_LIMIT_TRUSTED_HOPS)은
+  core/config.py Settings에서 처음 쓸 때 읽음
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from redis import RedisError
+
+from backend.utils.redis import get_async_redis_client
+
+if TYPE_CHECKING:
+    from backend.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_REDIS_PREFIX = "ratelimit"
+
+# KEYS[i] = 규칙별 ZSET, ARGV = [멤버, limit1, window_ms1, limit2, window_ms2, ...]
+# 반환: {1, 0} = 허용 / {0, retry_after_ms, 초과한 규칙 번호(1부터)} = 거절
+_SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[i * 2])
+    local window = tonumber(ARGV[i * 2 + 1])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        local retry = window
+        if oldest[2] then
+            retry = tonumber(oldest[2]) + window - now
+        end
+        return {0, retry, i}
+    end
+end
+for i, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, ARGV[1])
+    redis.call('PEXPIRE', key, ARGV[i * 2 + 1])
+end
+return {1, 0}
+"""
+
+_stats = {"allowed": 0, "rejected": 0, "errors": 0}
+
+
+def _settings() -> Settings:
+    # pydantic-settings import는 처음 검사할 때까지 미룸 (core/db.py와 동일)
+    from backend.core.config import get_settings
+
+    return get_settings()
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """name 별로 window초 동안 최대 limit건"""
+
+    name: str
+    limit: int
+    window: int  # 초
+
+
+class RateLimiter:
+    """scope 하나에 규칙 여러 개 (예: 이메일당 + IP당). check()에 규칙 이름별 값을 넘긴다."""
+
+    def __init__(self, scope: str, *rules: RateLimitRule) -> None:
+        self.scope = scope
+        self.rules = rules
+        self._script = None
+
+    def _key(self, rule: RateLimitRule, value: str) -> str:
+        return f"{RATE_LIMIT_REDIS_PREFIX}:{self.scope}:{rule.name}:{value}"
+
+    async def hit(self, **values: Optional[str]) -> Optional[Tuple[RateLimitRule, float]]:
+        """
+        요청 1건을 기록. 허용이면 None, 초과면 (초과한 규칙, 재시도까지 남은 초).
+        값이 None인 규칙은 건너뜀.
+        """
+        rules = [rule for rule in self.rules if values.get(rule.name)]
+        if not rules:
+            return None
+
+        keys = [self._key(rule, str(values[rule.name])) for rule in rules]
+        args = [uuid.uuid4().hex]
+        for rule in rules:
+            args.extend((rule.limit, rule.window * 1000))
+
+        client = get_async_redis_client()
+        if self._script is None:
+            self._script = client.register_script(_SLIDING_WINDOW_LUA)
+        result = await self._script(keys=keys, args=args, client=client)
+
+        if int(result[0]) == 1:
+            return None
+        return rules[int(result[2]) - 1], max(int(result[1]), 0) / 1000
+
+    async def check(self, **values: Optional[str]) -> None:
+        """한도 초과면 429 (Retry-After 헤더 포함). Redis 오류면 통과."""
+        if not _settings().rate_limit_enabled:
+            return
+        try:
+            exceeded = await self.hit(**values)
+        except (RedisError, RuntimeError) as exc:
+            # RuntimeError: 비동기 클라이언트 미초기화 (lifespan 밖)
+            _stats["errors"] += 1
+            logger.warning("rate limit check skipped scope=%s: %s", self.scope, exc)
+            return
+
+        if exceeded is None:
+            _stats["allowed"] += 1
+            return
+
+        rule, retry_after = exceeded
+        _stats["rejected"] += 1
+        logger.info("rate limited", extra={"scope": self.scope, "rule": rule.name})
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(max(int(retry_after + 0.999), 1))},
+        )
+
+
+def client_ip(request: Request) -> Optional[str]:
+    """
+    요청자 IP. X-Forwarded-For의 왼쪽 항목은 클라이언트가 마음대로 채울 수 있으므로,
+    우리 프록시들이 오른쪽에 붙인 항목 중 rate_limit_trusted_hops 번째를 사용.
+    """
+    settings = _settings()
+    trusted_hops = settings.rate_limit_trusted_hops
+    if settings.rate_limit_trust_proxy and trusted_hops > 0:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            hops = [entry.strip() for entry in forwarded.split(",") if entry.strip()]
+            if len(hops) >= trusted_hops:
+                return hops[-trusted_hops]
+    return request.client.host if request.client else None
+
+
+def get_rate_limit_stats() -> Dict[str, int]:
+    return dict(_stats)
@@ -1,20 +1,172 @@
 # backend/utils/redis.py
+"""
+Redis 클라이언트 (동기 / 비동기).
 
-import os
+동기 풀은 처음 get_redis_client()를 부를 때, 비동기 풀은 lifespan의 init_async_redis()에서 만든다.
+import만으로는 Redis에 연결하지도, REDIS_URL을 검사하지도 않음.
+"""
 
-import redis
-from dotenv import load_dotenv
+from __future__ import annotations
 
-load_dotenv()
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-REDIS_URL = os.getenv("REDIS_URL")
+import redis
+import redis.asyncio as aioredis
+from redis.asyncio.connection import parse_url as parse_async_url
+from redis.connection import parse_url
 
-redis_client = redis.from_url(
-    REDIS_URL,
-    decode_responses=True,
+from backend.core.metrics import (
+    instrumented_async_redis_connection_class,
+    instrumented_redis_connection_class,
 )
 
+if TYPE_CHECKING:
+    from backend.core.config import Settings
+
+
+def _settings() -> Settings:
+    # pydantic-settings import는 풀을 만들 때까지 미룸
+    from backend.core.config import get_settings
+
+    return get_settings()
+
+
+def _redis_url(settings: Settings) -> str:
+    if not settings.redis_url:
+        raise RuntimeError("REDIS_URL 환경변수가 설정되지 않았습니다.")
+    return settings.redis_url
 
-def get_redis_client():
+
+# ======================================================
+# 커넥션 풀 설정 (워커 1개 기준, 동기/비동기 풀 각각 적용)
+# ======================================================
+def _pool_options(settings: Settings) -> Dict[str, Any]:
+    return {
+        "max_connections": settings.redis_max_connections,
+        "socket_timeout": settings.redis_socket_timeout,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout,
+        "health_check_interval": settings.redis_health_check_interval,
+        "decode_responses": True,
+        # 풀이 꽉 찼을 때 커넥션 대기 한도
+        "timeout": settings.redis_socket_connect_timeout,
+    }
+
+
+# ======================================================
+# 동기 클라이언트 (def 라우터 / 서비스용, 처음 호출 시 생성)
+# ======================================================
+_pool: Optional[redis.BlockingConnectionPool] = None
+_client: Optional[redis.Redis] = None
+_client_lock = threading.Lock()
+
+
+def get_redis_client() -> redis.Redis:
     """Redis 클라이언트 반환"""
-    return redis_client
+    global _pool, _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                settings = _settings()
+                url = _redis_url(settings)
+                _pool = redis.BlockingConnectionPool.from_url(
+                    url,
+                    # 스킴(redis/rediss/unix)에 맞는 커넥션 클래스에 명령 시간 계측을 붙임 (core/metrics.py)
+                    connection_class=instrumented_redis_connection_class(
+                        parse_url(url).get("connection_class", redis.Connection)
+                    ),
+                    **_pool_options(settings),
+                )
+                _client = redis.Redis(connection_pool=_pool)
+    return _client
+
+
+def close_redis() -> None:
+    """앱 종료 시 동기 풀 정리"""
+    global _pool, _client
+    with _client_lock:
+        pool = _pool
+        _pool = None
+        _client = None
+    if pool is not None:
+        pool.disconnect()
+
+
+# ======================================================
+# 비동기 클라이언트 (async def 라우터용, lifespan에서 생성/정리)
+# ======================================================
+_async_pool: Optional[aioredis.BlockingConnectionPool] = None
+_async_client: Optional[aioredis.Redis] = None
+
+
+async def init_async_redis() -> aioredis.Redis:
+    """앱 시작 시 비동기 풀/클라이언트 생성 후 연결 확인"""
+    global _async_pool, _async_client
+    if _async_client is None:
+        settings = _settings()
+        url = _redis_url(settings)
+        _async_pool = aioredis.BlockingConnectionPool.from_url(
+            url,
+            connection_class=instrumented_async_redis_connection_class(
+                parse_async_url(url).get("connection_class", aioredis.Connection)
+            ),
+            **_pool_options(settings),
+        )
+        _async_client = aioredis.Redis(connection_pool=_async_pool)
+        await _async_client.ping()
+    return _async_client
+
+
+async def close_async_redis() -> None:
+    """앱 종료 시 비동기 풀 정리"""
+    global _async_pool, _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+    if _async_pool is not None:
+        await _async_pool.disconnect()
+    _async_pool = None
+    _async_client = None
+
+
+def get_async_redis_client() -> aioredis.Redis:
+    """비동기 Redis 클라이언트 반환 (init_async_redis 이후 사용)"""
+    if _async_client is None:
+        raise RuntimeError("비동기 Redis 클라이언트가 초기화되지 않았습니다. (lifespan 확인)")
+    return _async_client
+
+
+async def get_async_redis():
+    """FastAPI 의존성: Depends(get_async_redis)"""
+    yield get_async_redis_client()
+
+
+# ======================================================
+# 커넥션 풀 상태 조회
+# ======================================================
+def _pool_snapshot(pool) -> dict:
+    # redis-py 풀은 공개 통계 API가 없어 내부 속성을 읽음
+    if hasattr(pool, "_in_use_connections"):
+        # asyncio BlockingConnectionPool (ConnectionPool 기반)
+        in_use = len(pool._in_use_connections)
+        idle = len(pool._available_connections)
+    else:
+        # 동기 BlockingConnectionPool: 미생성 슬롯은 None으로 큐에 들어 있음
+        created = len(pool._connections)
+        idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+        in_use = created - idle
+    return {
+        "max_connections": pool.max_connections,
+        "created": in_use + idle,
+        "idle": idle,
+        "in_use": in_use,
+    }
+
+
+def get_redis_pool_stats() -> dict:
+    # 아직 만들어지지 않은 풀은 빼고 반환
+    stats = {}
+    if _pool is not None:
+        stats["sync"] = _pool_snapshot(_pool)
+    if _async_pool is not None:
+        stats["async"] = _pool_snapshot(_async_pool)
+    return stats
@@ -0,0 +1,142 @@
+# benchmarks/import_time.py
+"""
+backend 모듈 import 시간 측정 (콜드 스타트 / 워커 부팅 비용).
+
+모듈마다 새 인터프리터를 띄워 `import <모듈>`에 걸린 시간만 잰다 (인터프리터 기동 시간 제외).
+시간은 머신 부하에 따라 흔들리므로, 같이 로드된 모듈 수(loaded)도 출력한다 (실행마다 동일).
+--no-services 를 주면 DATABASE_URL / REDIS_URL 을 비운 채로 import해서
+DB/Redis 없이도 import가 되는지(테스트 수집 등) 함께 확인한다.
+
+실행:
+    python -m benchmarks.import_time --runs 10
+    python -m benchmarks.import_time --no-services --top 15 backend.main
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_MODULES = (
+    "backend.main",
+    "backend.core.db",
+    "backend.utils.redis",
+    "backend.domains.movie.service",
+    "backend.domains.registration.service",
+)
+
+_SNIPPET = (
+    "import sys, time; before = len(sys.modules); t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - t, len(sys.modules) - before)"
+)
+# -X importtime 출력: "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _env(no_services: bool) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), env.get("PYTHONPATH")]))
+    if no_services:
+        # .env 값도 덮어쓰도록 빈 값으로 둠 (load_dotenv는 기존 환경변수를 덮어쓰지 않음)
+        env["DATABASE_URL"] = ""
+        env["REDIS_URL"] = ""
+    return env
+
+
+def measure(module: str, runs: int, no_services: bool) -> Dict[str, object]:
+    """새 프로세스에서 runs번 import하고 ms 단위 통계 반환 (실패 시 error 포함)"""
+    samples: List[float] = []
+    loaded = 0
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", _SNIPPET.format(module=module)],
+            capture_output=True,
+            text=True,
+            env=_env(no_services),
+        )
+        if proc.returncode != 0:
+            last_line = (proc.stderr.strip().splitlines() or ["?"])[-1]
+            return {"module": module, "error": last_line}
+        elapsed, loaded_text = proc.stdout.strip().splitlines()[-1].split()
+        samples.append(float(elapsed) * 1000)
+        loaded = int(loaded_text)
+    return {
+        "module": module,
+        "runs": runs,
+        "loaded": loaded,
+        "p50_ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+        "max_ms": round(max(samples), 1),
+    }
+
+
+def top_imports(module: str, top: int, no_services: bool) -> List[Tuple[str, float]]:
+    """-X importtime 기준으로 module이 직접 import한 것 중 누적 시간이 큰 목록 (ms)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=_env(no_services),
+    )
+    entries: List[Tuple[str, float]] = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        # 한 단계 들여쓴 줄(공백 3칸) = module이 직접 import한 모듈
+        if match and len(match.group(3)) == 3:
+            entries.append((match.group(4), int(match.group(2)) / 1000))
+    entries.sort(key=lambda e: e[1], reverse=True)
+    return entries[:top]
+
+
+def run(modules: Sequence[str], runs: int, no_services: bool, top: int) -> Dict[str, object]:
+    result: Dict[str, object] = {
+        "python": sys.version.split()[0],
+        "no_services": no_services,
+        "modules": [measure(m, runs, no_services) for m in modules],
+    }
+    if top:
+        result["top_imports"] = {m: top_imports(m, top, no_services) for m in modules[:1]}
+    return result
+
+
+def _print_table(result: Dict[str, object]) -> None:
+    print(f"python {result['python']}  no_services={result['no_services']}")
+    print(f"{'module':<40} {'p50 ms':>8} {'min':>8} {'max':>8} {'loaded':>8}")
+    for row in result["modules"]:  # type: ignore[union-attr]
+        if "error" in row:
+            print(f"{row['module']:<40} FAILED  {row['error']}")
+            continue
+        print(
+            f"{row['module']:<40} {row['p50_ms']:>8.1f} {row['min_ms']:>8.1f} "
+            f"{row['max_ms']:>8.1f} {row['loaded']:>8}"
+        )
+    for module, entries in (result.get("top_imports") or {}).items():  # type: ignore[union-attr]
+        print(f"\ntop imports for {module} (cumulative ms)")
+        for name, ms in entries:
+            print(f"  {name:<38} {ms:>8.1f}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="backend import 시간 벤치마크")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--runs", type=int, default=10, help="모듈별 측정 횟수 (매번 새 프로세스)")
+    parser.add_argument("--no-services", action="store_true", help="DATABASE_URL/REDIS_URL 없이 import")
+    parser.add_argument("--top", type=int, default=10, help="첫 모듈의 무거운 import 상위 N개 (0이면 생략)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    result = run(args.modules, args.runs, args.no_services, args.top)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        _print_table(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+# benchmarks/registration_flow.py
+"""
+회원가입 -> 온보딩 흐름 부하 테스트 (registration/router.py 엔드포인트별 지연 / 처리량).
+
+가상 유저 한 명의 시나리오:
+    signup/request -> (Redis에서 인증 코드 조회) -> signup/verify -> signup/confirm
+    -> onboarding/ott -> onboarding/survey/movies -> onboarding/survey -> onboarding/complete
+    (--skip-ratio 비율만큼은 ott 다음 바로 onboarding/skip)
+
+--base-url 이 없으면 backend.main:app 을 uvicorn 서브프로세스로 띄운다.
+DATABASE_URL / REDIS_URL 은 로컬(도커 등) Postgres / Redis를 가리켜야 하고,
+ott_providers / movies 가 적재되어 있어야 설문 단계까지 정상 동작한다.
+rate limit은 측정을 방해하므로 띄운 서버에서는 끈다 (--rate-limit 으로 켤 수 있음).
+만든 유저는 끝나고 지운다 (--keep-users 로 유지).
+
+부하 전에 유저 한 명으로 시나리오 전체를 한 번 돌려보고(preflight), 실패하면 바로 중단한다
+(스키마 불일치 / 데이터 미적재 상태에서 에러 응답 지연이 기준으로 저장되지 않도록).
+
+결과는 엔드포인트별 p50 / p95 / p99 (ms), RPS, 에러 수.
+--save-baseline 으로 benchmarks/baselines/registration_flow.json 에 저장하고,
+--compare 로 저장된 기준과 비교한다 (p95가 --max-regression 이상 느려지면 exit 1).
+실패한 흐름이 하나라도 있으면 기준으로 저장하지 않는다.
+
+실행:
+    python -m benchmarks.registration_flow --users 200 --concurrency 20
+    python -m benchmarks.registration_flow --users 200 --concurrency 20 --save-baseline main
+    python -m benchmarks.registration_flow --users 200 --concurrency 20 --compare main
+
+필요 패키지: pip install -r benchmarks/requirements.txt (앱 의존성 + httpx)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+ENDPOINTS = (
+    ("POST", "/auth/signup/request"),
+    ("POST", "/auth/signup/verify"),
+    ("POST", "/auth/signup/confirm"),
+    ("POST", "/onboarding/ott"),
+    ("GET", "/onboarding/survey/movies"),
+    ("POST", "/onboarding/survey"),
+    ("POST", "/onboarding/complete"),
+    ("POST", "/onboarding/skip"),
+)
+
+EMAIL_DOMAIN = "bench.example.com"
+DEFAULT_BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines", "registration_flow.json")
+
+
+class FlowError(Exception):
+    """시나리오 중간 단계 실패 (해당 유저의 나머지 단계는 건너뜀)"""
+
+
+class PreflightError(Exception):
+    """부하 전 점검용 유저의 시나리오 실패 (측정 자체가 무의미하므로 중단)"""
+
+
+# ======================================================
+# 측정값 수집
+# ======================================================
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {path: [] for _, path in ENDPOINTS}
+        self.errors: Dict[str, Dict[str, int]] = {path: {} for _, path in ENDPOINTS}
+
+    async def call(self, client, method: str, path: str, **kwargs: Any):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+        except Exception as exc:  # 연결 오류 / 타임아웃도 에러로 집계
+            self._error(path, type(exc).__name__)
+            raise FlowError(f"{path}: {exc!r}") from exc
+        self.latencies[path].append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            self._error(path, str(response.status_code))
+            raise FlowError(f"{path}: {response.status_code} {response.text[:200]}")
+        return response
+
+    def _error(self, path: str, reason: str) -> None:
+        self.errors[path][reason] = self.errors[path].get(reason, 0) + 1
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """nearest-rank 백분위"""
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(q / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> Dict[str, Dict[str, Any]]:
+    result: Dict[str, Dict[str, Any]] = {}
+    for method, path in ENDPOINTS:
+        values = sorted(recorder.latencies[path])
+        errors = recorder.errors[path]
+        if not values and not errors:
+            continue
+        result[f"{method} {path}"] = {
+            "count": len(values),
+            "errors": sum(errors.values()),
+            "error_codes": errors,
+            "p50_ms": round(_percentile(values, 50), 2),
+            "p95_ms": round(_percentile(values, 95), 2),
+            "p99_ms": round(_percentile(values, 99), 2),
+            "rps": round(len(values) / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+    return result
+
+
+# ======================================================
+# 시나리오
+# ======================================================
+async def _signup_code(redis_client, email: str) -> str:
+    # registration/service.py: signup:{email} 해시의 code 필드
+    code = await redis_client.hget(f"signup:{email}", "code")
+    if code is None:
+        raise FlowError(f"signup code lookup: not found in Redis ({email})")
+    return code
+
+
+async def run_user(
+    client,
+    redis_client,
+    recorder: Recorder,
+    rng: random.Random,
+    run_id: str,
+    index: Any,
+    provider_ids: Sequence[int],
+    skip_ratio: float,
+) -> None:
+    email = f"bench-{run_id}-{index}@{EMAIL_DOMAIN}"
+    signup = {"email": email, "password": "bench-password-1234", "nickname": f"b{run_id}{index}"[:30]}
+
+    await recorder.call(client, "POST", "/auth/signup/request", json=signup)
+    confirm = {"email": email, "code": await _signup_code(redis_client, email)}
+    await recorder.call(client, "POST", "/auth/signup/verify", json=confirm)
+    response = await recorder.call(client, "POST", "/auth/signup/confirm", json=confirm)
+
+    token = response.json()["token"]["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    chosen = rng.sample(list(provider_ids), k=min(len(provider_ids), rng.randint(1, 3)))
+    await recorder.call(client, "POST", "/onboarding/ott", json={"provider_ids": chosen}, headers=headers)
+
+    if rng.random() < skip_ratio:
+        await recorder.call(client, "POST", "/onboarding/skip", headers=headers)
+        return
+
+    movies = (await recorder.call(client, "GET", "/onboarding/survey/movies", headers=headers)).json()["movies"]
+    if not movies:
+        raise FlowError("/onboarding/survey/movies: empty (movies 테이블 적재 확인)")
+    picked = rng.sample(movies, k=min(len(movies), rng.randint(1, 5)))
+    await recorder.call(
+        client, "POST", "/onboarding/survey", json={"movie_ids": [m["movie_id"] for m in picked]}, headers=headers
+    )
+    await recorder.call(client, "POST", "/onboarding/complete", headers=headers)
+
+
+async def run_load(
+    run_id: str,
+    base_url: str,
+    redis_url: str,
+    users: int,
+    concurrency: int,
+    skip_ratio: float,
+    seed: int,
+    timeout: float,
+) -> Dict[str, Any]:
+    import httpx
+    import redis.asyncio as aioredis
+
+    recorder = Recorder()
+    failures: Dict[str, int] = {}
+    completed = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    redis_client = aioredis.from_url(redis_url, decode_responses=True)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        providers = (await client.get("/ott/providers")).json()["providers"]
+        provider_ids = [p["provider_id"] for p in providers]
+
+        # preflight: 측정과 별도 Recorder로 한 명만 끝까지 (스킵 없이 설문 경로로)
+        try:
+            await run_user(
+                client, redis_client, Recorder(), random.Random(seed),
+                run_id, "preflight", provider_ids, skip_ratio=0.0,
+            )
+        except FlowError as exc:
+            await redis_client.aclose()
+            raise PreflightError(str(exc)) from exc
+
+        queue: "asyncio.Queue[int]" = asyncio.Queue()
+        for index in range(users):
+            queue.put_nowait(index)
+
+        async def worker() -> None:
+            nonlocal completed
+            while True:
+                try:
+                    index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await run_user(
+                        client, redis_client, recorder, random.Random(seed + index),
+                        run_id, index, provider_ids, skip_ratio,
+                    )
+                    completed += 1
+                except FlowError as exc:
+                    step = str(exc).split(":", 1)[0]
+                    failures[step] = failures.get(step, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    await redis_client.aclose()
+
+    return {
+        "run_id": run_id,
+        "users": users,
+        "concurrency": concurrency,
+        "completed_flows": completed,
+        "failed_flows": failures,
+        "elapsed_s": round(elapsed, 2),
+        "flows_per_s": round(completed / elapsed, 2) if elapsed > 0 else 0.0,
+        "endpoints": summarize(recorder, elapsed),
+    }
+
+
+# ======================================================
+# 서버 기동 / 정리
+# ======================================================
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, rate_limit: bool, startup_timeout: float = 30) -> Tuple[subprocess.Popen, str]:
+    import httpx
+
+    port = _free_port()
+    env = dict(os.environ)
+    env.setdefault("LOG_LEVEL", "WARNING")
+    if not rate_limit:
+        env["RATE_LIMIT_ENABLED"] = "false"
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--no-access-log",
+        ],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"서버가 시작 중 종료되었습니다 (exit {proc.returncode})")
+        try:
+            if httpx.get(base_url + "/", timeout=1).status_code == 200:
+                return proc, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"서버가 {startup_timeout:.0f}초 안에 응답하지 않았습니다")
+
+
+def stop_server(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def delete_bench_users(run_id: str) -> int:
+    """이번 실행에서 만든 유저 삭제 (user_ott_map / user_onboarding_answers는 FK CASCADE)"""
+    from sqlalchemy import text
+
+    from backend.core.db import get_engine
+
+    with get_engine().begin() as conn:
+        result = conn.execute(
+            text("DELETE FROM users WHERE email LIKE :pattern"),
+            {"pattern": f"bench-{run_id}-%@{EMAIL_DOMAIN}"},
+        )
+    return result.rowcount
+
+
+# ======================================================
+# 기준 결과 저장 / 비교
+# ======================================================
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_baseline(path: str, label: str, result: Dict[str, Any]) -> None:
+    baselines: Dict[str, Any] = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            baselines = json.load(f)
+    baselines[label] = result
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def compare(baseline: Dict[str, Any], result: Dict[str, Any], max_regression: float) -> List[str]:
+    """p95가 max_regression(비율) 넘게 느려진 엔드포인트 목록"""
+    regressions: List[str] = []
+    print(f"\ncompare with baseline (commit={baseline.get('commit')}, {baseline.get('created_at')})")
+    print(f"{'endpoint':<36} {'p95 base':>9} {'p95 now':>9} {'Δ':>7} {'rps base':>9} {'rps now':>9}")
+    for name, now in result["endpoints"].items():
+        base = baseline.get("endpoints", {}).get(name)
+        if base is None or not base["p95_ms"]:
+            continue
+        delta = now["p95_ms"] / base["p95_ms"] - 1
+        flag = ""
+        if delta > max_regression:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<36} {base['p95_ms']:>9.1f} {now['p95_ms']:>9.1f} {delta:>+7.0%} "
+            f"{base['rps']:>9.1f} {now['rps']:>9.1f}{flag}"
+        )
+    return regressions
+
+
+def _print_table(result: Dict[str, Any]) -> None:
+    print(
+        f"users={result['users']} concurrency={result['concurrency']} "
+        f"completed={result['completed_flows']} elapsed={result['elapsed_s']}s "
+        f"flows/s={result['flows_per_s']}"
+    )
+    if result["failed_flows"]:
+        print(f"failed flows by step: {result['failed_flows']}")
+    print(f"{'endpoint':<36} {'count':>6} {'err':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rps':>8}")
+    for name, row in result["endpoints"].items():
+        print(
+            f"{name:<36} {row['count']:>6} {row['errors']:>5} {row['p50_ms']:>8.1f} "
+            f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['rps']:>8.1f}"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="회원가입/온보딩 흐름 부하 테스트")
+    parser.add_argument("--base-url", default=None, help="이미 떠 있는 서버 주소 (없으면 uvicorn으로 직접 띄움)")
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", ""), help="인증 코드 조회용 (서버와 같은 Redis)")
+    parser.add_argument("--users", type=int, default=100, help="시나리오를 끝까지 도는 가상 유저 수")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--skip-ratio", type=float, default=0.2, help="설문 대신 온보딩 스킵하는 비율")
+    parser.add_argument("--workers", type=int, default=1, help="직접 띄울 때 uvicorn 워커 수")
+    parser.add_argument("--rate-limit", action="store_true", help="직접 띄운 서버에서 rate limit 유지")
+    parser.add_argument("--timeout", type=float, default=30, help="요청 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep-users", action="store_true", help="만든 유저를 지우지 않음")
+    parser.add_argument("--baseline-file", default=DEFAULT_BASELINE_FILE)
+    parser.add_argument("--save-baseline", metavar="LABEL", default=None, help="결과를 LABEL 이름으로 저장")
+    parser.add_argument("--compare", metavar="LABEL", default=None, help="저장된 LABEL 기준과 비교")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="허용 p95 증가 비율 (0.2 = 20%%)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    if not args.redis_url:
+        parser.error("--redis-url 또는 REDIS_URL 이 필요합니다 (인증 코드 조회)")
+
+    baseline = None
+    if args.compare:
+        with open(args.baseline_file, encoding="utf-8") as f:
+            baseline = json.load(f).get(args.compare)
+        if baseline is None:
+            parser.error(f"기준 결과가 없습니다: {args.compare} ({args.baseline_file})")
+
+    run_id = uuid.uuid4().hex[:8]
+    proc = None
+    base_url = args.base_url
+    if base_url is None:
+        proc, base_url = start_server(args.workers, args.rate_limit)
+    try:
+        result = asyncio.run(
+            run_load(
+                run_id, base_url, args.redis_url, args.users, args.concurrency,
+                args.skip_ratio, args.seed, args.timeout,
+            )
+        )
+    except PreflightError as exc:
+        if not args.keep_users:
+            delete_bench_users(run_id)
+        sys.exit(
+            f"preflight 실패, 부하 테스트를 중단합니다: {exc}\n"
+            "(DB 스키마 / ott_providers·movies 적재 / 서버 로그를 확인하세요)"
+        )
+    finally:
+        if proc is not None:
+            stop_server(proc)
+
+    if not args.keep_users:
+        result["deleted_users"] = delete_bench_users(run_id)
+
+    result["commit"] = _git_commit()
+    result["created_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    result["workers"] = args.workers if args.base_url is None else None
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        _print_table(result)
+
+    if args.save_baseline:
+        if result["failed_flows"]:
+            sys.exit(f"\n실패한 흐름이 있어 기준으로 저장하지 않습니다: {result['failed_flows']}")
+        save_baseline(args.baseline_file, args.save_baseline, result)
+        print(f"\nbaseline saved: {args.save_baseline} -> {args.baseline_file}")
+
+    if baseline is not None and compare(baseline, result, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# benchmarks/title_search.py
+"""
+제목 검색 쿼리 지연 비교 (인덱스 없음 vs 있음).
+
+DATABASE_URL의 DB에 임시 스키마(bench_title_search)를 만들고, 카탈로그 크기별로
+합성 제목을 채운 뒤 movie/search.py와 같은 모양의 쿼리를 돌린다.
+인덱스 없이 한 번, movies 모델과 같은 인덱스를 만들고 ANALYZE 후 한 번 측정한다.
+끝나면 스키마는 지운다 (--keep 으로 유지).
+
+실행:
+    python -m benchmarks.title_search --sizes 10000 100000 1000000 --queries 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Dict, List, Sequence
+
+SCHEMA = "bench_title_search"
+
+_WORDS = (
+    "love night city last dark star war lost king girl man blue house road day dream "
+    "world heart secret river fire moon ghost summer winter little big black red golden "
+    "shadow return story life death game time space island wild lady boy family forest "
+    "사랑 밤 도시 마지막 어둠 별 전쟁 왕 소녀 남자 집 길 하루 꿈 세계 마음 비밀 강 불 달 "
+    "유령 여름 겨울 작은 검은 붉은 그림자 귀환 이야기 인생 죽음 시간 우주 섬 가족 숲"
+).split()
+
+QUERIES = {
+    # movie/search.py typeahead
+    "typeahead_short": """
+        SELECT movie_id, title FROM {schema}.movies
+        WHERE lower(title) LIKE %(prefix)s AND adult = false
+        ORDER BY coalesce(popularity, 0) DESC, movie_id DESC LIMIT 10
+    """,
+    "typeahead_long": """
+        SELECT movie_id, title FROM {schema}.movies
+        WHERE lower(title) LIKE %(prefix)s AND adult = false
+        ORDER BY coalesce(popularity, 0) DESC, movie_id DESC LIMIT 10
+    """,
+    # movie/search.py search_titles
+    "search": """
+        SELECT movie_id, title,
+               greatest(ts_rank(to_tsvector('simple', title), plainto_tsquery('simple', %(q)s)),
+                        similarity(title, %(q)s)) AS score
+        FROM {schema}.movies
+        WHERE (to_tsvector('simple', title) @@ plainto_tsquery('simple', %(q)s) OR title %% %(q)s)
+          AND adult = false
+        ORDER BY score DESC, coalesce(popularity, 0) DESC, movie_id DESC LIMIT 20
+    """,
+    # 비교용: 인덱스 없이 흔히 쓰는 ILIKE 부분 일치
+    "ilike_contains": """
+        SELECT movie_id, title FROM {schema}.movies
+        WHERE title ILIKE %(contains)s AND adult = false
+        ORDER BY coalesce(popularity, 0) DESC, movie_id DESC LIMIT 20
+    """,
+}
+
+INDEXES = (
+    "CREATE INDEX ON {schema}.movies (lower(title) text_pattern_ops)",
+    "CREATE INDEX ON {schema}.movies USING gin (to_tsvector('simple', title))",
+    "CREATE INDEX ON {schema}.movies USING gin (title gin_trgm_ops)",
+)
+
+
+def _setup(cur, size: int) -> None:
+    cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    cur.execute(f"CREATE SCHEMA {SCHEMA}")
+    cur.execute(
+        f"""
+        CREATE TABLE {SCHEMA}.movies (
+            movie_id serial PRIMARY KEY,
+            title text NOT NULL,
+            adult boolean NOT NULL DEFAULT false,
+            popularity double precision
+        )
+        """
+    )
+    # 단어 1~4개짜리 합성 제목, 인기도는 롱테일 분포
+    cur.execute(
+        f"""
+        INSERT INTO {SCHEMA}.movies (title, adult, popularity)
+        SELECT (SELECT string_agg(w[1 + floor(random() * array_length(w, 1))::int], ' ')
+                FROM generate_series(1, 1 + (i % 4)) AS n(j)),
+               random() < 0.02,
+               power(random(), 4) * 1000
+        FROM generate_series(1, %(size)s) AS s(i), (SELECT %(words)s::text[] AS w) AS words
+        """,
+        {"size": size, "words": list(_WORDS)},
+    )
+    cur.execute(f"ANALYZE {SCHEMA}.movies")
+
+
+def _sample_params(cur, count: int, seed: int) -> Dict[str, List[Dict[str, str]]]:
+    rng = random.Random(seed)
+    cur.execute(f"SELECT title FROM {SCHEMA}.movies ORDER BY random() LIMIT %s", (count,))
+    titles = [row[0] for row in cur.fetchall()]
+
+    def typo(word: str) -> str:
+        if len(word) < 4:
+            return word
+        i = rng.randrange(1, len(word) - 1)
+        return word[:i] + word[i + 1 :]
+
+    params: Dict[str, List[Dict[str, str]]] = {name: [] for name in QUERIES}
+    for title in titles:
+        lowered = title.lower()
+        word = rng.choice(title.split())
+        params["typeahead_short"].append({"prefix": lowered[:2] + "%"})
+        params["typeahead_long"].append({"prefix": lowered[:6] + "%"})
+        params["search"].append({"q": typo(title)})
+        params["ilike_contains"].append({"contains": f"%{word}%"})
+    return params
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _measure(cur, params: Dict[str, List[Dict[str, str]]]) -> Dict[str, Dict[str, object]]:
+    report: Dict[str, Dict[str, object]] = {}
+    for name, sql in QUERIES.items():
+        sql = sql.format(schema=SCHEMA)
+        cur.execute("EXPLAIN " + sql, params[name][0])
+        plan = "\n".join(row[0] for row in cur.fetchall())
+
+        timings: List[float] = []
+        for p in params[name]:
+            start = time.perf_counter()
+            cur.execute(sql, p)
+            cur.fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        report[name] = {
+            "p50_ms": round(statistics.median(timings), 3),
+            "p95_ms": round(_percentile(timings, 95), 3),
+            "max_ms": round(max(timings), 3),
+            "seq_scan": "Seq Scan" in plan,
+        }
+    return report
+
+
+def run(raw_conn, sizes: Sequence[int], queries: int, seed: int, keep: bool) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    cur = raw_conn.cursor()
+    try:
+        for size in sizes:
+            started = time.perf_counter()
+            _setup(cur, size)
+            raw_conn.commit()
+            load_s = time.perf_counter() - started
+
+            params = _sample_params(cur, queries, seed)
+            without = _measure(cur, params)
+
+            started = time.perf_counter()
+            for ddl in INDEXES:
+                cur.execute(ddl.format(schema=SCHEMA))
+            cur.execute(f"ANALYZE {SCHEMA}.movies")
+            raw_conn.commit()
+            index_s = time.perf_counter() - started
+
+            with_index = _measure(cur, params)
+            results.append(
+                {
+                    "rows": size,
+                    "load_s": round(load_s, 2),
+                    "index_build_s": round(index_s, 2),
+                    "without_index": without,
+                    "with_index": with_index,
+                }
+            )
+            raw_conn.commit()
+    finally:
+        if not keep:
+            cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+            raw_conn.commit()
+        cur.close()
+    return results
+
+
+def _print_table(results: List[Dict[str, object]]) -> None:
+    print(f"{'rows':>9}  {'query':<16} {'no index p50/p95 (ms)':>24} {'index p50/p95 (ms)':>22}")
+    for result in results:
+        without = result["without_index"]
+        with_index = result["with_index"]
+        for name in QUERIES:
+            a, b = without[name], with_index[name]  # type: ignore[index]
+            print(
+                f"{result['rows']:>9}  {name:<16} "
+                f"{a['p50_ms']:>11.2f} / {a['p95_ms']:<10.2f} "
+                f"{b['p50_ms']:>9.2f} / {b['p95_ms']:<10.2f}"
+                + ("  (seq scan)" if b["seq_scan"] else "")
+            )
+
+
+def main() -> None:
+    from backend.core.db import get_engine
+
+    parser = argparse.ArgumentParser(description="제목 검색 인덱스 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--queries", type=int, default=200, help="쿼리 종류별 샘플 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 벤치마크 스키마를 남김")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    raw_conn = get_engine().raw_connection()
+    try:
+        results = run(raw_conn, args.sizes, args.queries, args.seed, args.keep)
+    finally:
+        raw_conn.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+
+if __name__ == "__main__":
+    main()